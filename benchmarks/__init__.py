@@ -0,0 +1,9 @@
+"""
+Performance benchmarks for the `ground_station` hot paths.
+
+- `python -m benchmarks.micro`: micro-benchmarks of the fitness function and solver iterations,
+  with baseline save / compare modes for catching regressions.
+- `python -m benchmarks.scaling`: time- and evaluations-to-target curves per solver over log grids of
+  drones, stations and population size, with fitted complexity exponents and optional plots.
+- `python -m benchmarks.startup`: start-up overhead of a one-shot CLI solve against a 50 ms budget.
+"""
@@ -0,0 +1,260 @@
+"""
+Micro-benchmarks for the fitness function and solver hot paths.
+
+Every case builds a generated instance (`n` drones, `max(n // 10, 3)` stations) and times one
+"operation" on it: a full `evaluate`, a `random_assignment`, one `_parse_gene` pass over a whole
+solution, one ACO construction, or one iteration of a solver. Throughput is the best of
+`repeat` timed rounds; memory is the tracemalloc peak of a single operation.
+
+    python -m benchmarks.micro --sizes 10 100 1000
+    python -m benchmarks.micro --save-baseline benchmarks/baseline.json
+    python -m benchmarks.micro --compare benchmarks/baseline.json  # exit 1 on a >10% regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from ground_station.algorithms import (
+    AntColony,
+    ArtificialBeeColony,
+    DifferentialEvolution,
+    Genetic,
+    Grasshopper,
+    GreyWolf,
+    ParticleSwarm,
+)
+from ground_station.algorithms.repair import StationPool
+from ground_station.problem import AssignmentProblem
+from ground_station.scenarios import generated_scenario
+
+SIZES = (10, 100, 1_000, 10_000)
+DEFAULT_THRESHOLD = 0.10
+# Peak-memory changes below this many bytes are treated as noise.
+MEMORY_SLACK_BYTES = 4096
+
+Operation = Callable[[], object]
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    ops_per_sec: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+
+def build_problem(size: int) -> AssignmentProblem:
+    return generated_scenario(num_drones=size, num_stations=max(size // 10, 3), seed=size)
+
+
+def _evaluate(problem: AssignmentProblem) -> Operation:
+    solution = problem.random_assignment(randomize_battery=True)
+    return lambda: problem.evaluate(solution)
+
+
+def _random_assignment(problem: AssignmentProblem) -> Operation:
+    return lambda: problem.random_assignment(randomize_battery=True)
+
+
+def _parse_gene(problem: AssignmentProblem) -> Operation:
+    pairs = list(zip(problem.random_assignment(randomize_battery=True), problem.fleet.max_battery))
+    parse = problem._parse_gene
+
+    def run() -> None:
+        for gene, max_battery in pairs:
+            parse(gene, max_battery)
+
+    return run
+
+
+def _aco_construction(problem: AssignmentProblem) -> Operation:
+    colony = AntColony()
+    pheromones = [colony.initial_pheromone] * problem.num_stations
+    pool = StationPool(problem)
+    return lambda: colony._construct_solution(problem, pheromones, pool)
+
+
+def _solver_iteration(factory: Callable[[], object]) -> Callable[[AssignmentProblem], Operation]:
+    def setup(problem: AssignmentProblem) -> Operation:
+        solver = factory()
+        return lambda: solver.solve(problem)
+
+    return setup
+
+
+# Solver cases run a single iteration with a small population so the largest sizes stay tractable.
+CASES: Dict[str, Callable[[AssignmentProblem], Operation]] = {
+    "evaluate": _evaluate,
+    "random_assignment": _random_assignment,
+    "parse_gene": _parse_gene,
+    "aco_construction": _aco_construction,
+    "iteration/pso": _solver_iteration(lambda: ParticleSwarm(num_particles=10, max_iterations=1)),
+    "iteration/gwo": _solver_iteration(lambda: GreyWolf(num_wolves=10, max_iterations=1)),
+    "iteration/aco": _solver_iteration(lambda: AntColony(num_ants=5, num_iterations=1)),
+    "iteration/ga": _solver_iteration(lambda: Genetic(population_size=10, max_generations=1)),
+    "iteration/abc": _solver_iteration(
+        lambda: ArtificialBeeColony(num_employed_bees=5, num_onlooker_bees=5, max_iterations=1)
+    ),
+    "iteration/goa": _solver_iteration(lambda: Grasshopper(population_size=10, max_iterations=1)),
+    "iteration/dea": _solver_iteration(lambda: DifferentialEvolution(population_size=10, max_iterations=1)),
+}
+
+
+def measure(operation: Operation, min_time: float = 0.2, repeat: int = 3) -> float:
+    """Best-of-`repeat` operations per second, each round running for at least `min_time`."""
+    loops = 1
+    while True:
+        elapsed = _time_loops(operation, loops)
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        # Grow towards min_time in one step when possible, at most tenfold per calibration round.
+        loops *= max(2, min(10, int(min_time / max(elapsed, 1e-9)) + 1))
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time_loops(operation, loops))
+    return loops / best if best > 0 else float("inf")
+
+
+def _time_loops(operation: Operation, loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        operation()
+    return time.perf_counter() - start
+
+
+def peak_memory(operation: Operation) -> int:
+    """tracemalloc peak (bytes) allocated by one call of `operation`."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        operation()
+        return max(0, tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def run_suite(
+    sizes: Sequence[int] = SIZES,
+    cases: Optional[Iterable[str]] = None,
+    min_time: float = 0.2,
+    repeat: int = 3,
+    seed: int = 0,
+    progress: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> List[BenchmarkResult]:
+    names = list(cases) if cases is not None else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark case(s): {', '.join(unknown)}. Available: {', '.join(CASES)}")
+
+    results: List[BenchmarkResult] = []
+    for size in sizes:
+        problem = build_problem(size)
+        for name in names:
+            random.seed(seed)
+            operation = CASES[name](problem)
+            result = BenchmarkResult(
+                name=name,
+                size=size,
+                ops_per_sec=measure(operation, min_time=min_time, repeat=repeat),
+                peak_bytes=peak_memory(operation),
+            )
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return results
+
+
+def save_baseline(path: str, results: Sequence[BenchmarkResult]) -> None:
+    payload = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.key: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, BenchmarkResult]:
+    with open(path, encoding="utf-8") as handle:
+        payload = json.load(handle)
+    return {key: BenchmarkResult(**entry) for key, entry in payload["results"].items()}
+
+
+def compare(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, BenchmarkResult],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Describe every case that got more than `threshold` slower or hungrier than the baseline."""
+    regressions: List[str] = []
+    for result in results:
+        reference = baseline.get(result.key)
+        if reference is None:
+            continue
+        if result.ops_per_sec < reference.ops_per_sec * (1 - threshold):
+            change = 1 - result.ops_per_sec / reference.ops_per_sec
+            regressions.append(
+                f"{result.key}: {result.ops_per_sec:,.1f} ops/s vs {reference.ops_per_sec:,.1f} (-{change:.1%})"
+            )
+        memory_limit = max(reference.peak_bytes * (1 + threshold), reference.peak_bytes + MEMORY_SLACK_BYTES)
+        if result.peak_bytes > memory_limit:
+            regressions.append(f"{result.key}: peak {result.peak_bytes:,} B vs {reference.peak_bytes:,} B")
+    return regressions
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(f"{result.key:<32} {result.ops_per_sec:>14,.1f} ops/s {result.peak_bytes / 1024:>12,.1f} KiB", flush=True)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for ground_station hot paths")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="Drone counts to benchmark")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=None, help="Subset of cases to run")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per timed round")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed rounds per case (best is kept)")
+    parser.add_argument("--save-baseline", default=None, help="Write results to this JSON baseline")
+    parser.add_argument("--compare", default=None, help="Compare against this JSON baseline")
+    parser.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed relative regression (default 0.10)"
+    )
+    args = parser.parse_args(argv)
+
+    if any(size <= 0 for size in args.sizes):
+        parser.error("Sizes must be positive")
+    if args.min_time <= 0 or args.repeat <= 0:
+        parser.error("Minimum time and repeat count must be positive")
+
+    results = run_suite(args.sizes, args.cases, min_time=args.min_time, repeat=args.repeat, progress=_print_result)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+        print(f"Baseline written to {args.save_baseline}")
+    if args.compare:
+        regressions = compare(results, load_baseline(args.compare), args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
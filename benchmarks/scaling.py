@@ -0,0 +1,292 @@
+"""
+Scaling curves for the seven solvers.
+
+One dimension (drones, stations or population size) is swept over a log grid while the others stay
+at their base values. Each run stops as soon as its fitness is within `target_gap` of the problem's
+lower bound (or at the iteration / time cap), and records the time and the fitness evaluations
+needed. An empirical exponent `k` in `time ~ size^k` is then fitted per solver and dimension by
+least squares in log-log space, using only the runs that reached the target.
+
+    python -m benchmarks.scaling --output scaling.json --plot scaling_plots --workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ground_station.algorithms.registry import solver_names, solver_spec
+from ground_station.scenarios import LAYOUTS, generated_scenario
+from ground_station.selection import instance_features
+
+DIMENSIONS = ("drones", "stations", "population")
+
+
+@dataclass
+class ScalingTask:
+    algorithm: str
+    dimension: str
+    drones: int
+    stations: int
+    population: int
+    max_iterations: int
+    time_limit: float
+    target_gap: float
+    layout: str
+    seed: int
+
+    @property
+    def size(self) -> int:
+        return getattr(self, self.dimension)
+
+
+@dataclass
+class ScalingRun:
+    algorithm: str
+    dimension: str
+    size: int
+    drones: int
+    stations: int
+    population: int
+    seed: int
+    reached: bool
+    seconds: float
+    evaluations: int
+    iterations: int
+    fitness: float
+    lower_bound: float
+    gap: float
+    features: Dict[str, float] = field(default_factory=dict)
+
+
+def log_grid(low: int, high: int, points: int) -> List[int]:
+    """`points` integers spaced evenly in log space between `low` and `high` (deduplicated)."""
+    if low <= 0 or high < low:
+        raise ValueError("Grid bounds must satisfy 0 < low <= high")
+    if points <= 1 or low == high:
+        return [low]
+    ratio = math.log(high / low) / (points - 1)
+    return sorted({int(round(low * math.exp(ratio * step))) for step in range(points)})
+
+
+def fit_exponent(sizes: Sequence[float], values: Sequence[float]) -> Optional[float]:
+    """Least-squares slope of log(value) against log(size); None with fewer than two distinct sizes."""
+    points = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def run_task(task: ScalingTask) -> ScalingRun:
+    random.seed(task.seed)
+    problem = generated_scenario(
+        num_drones=task.drones, num_stations=task.stations, layout=task.layout, seed=task.seed
+    )
+    problem.lower_bound()  # cached; computed outside the timed solve
+    features = instance_features(problem)
+    spec = solver_spec(task.algorithm)
+    solver = spec.build(
+        {"time_limit": task.time_limit, "gap_tolerance": task.target_gap},
+        iterations=task.max_iterations,
+        population=max(task.population, spec.min_population),
+    )
+    solver.instrument = True
+    evaluations_before = problem.counters.evaluations
+    result = solver.solve(problem)
+    result.compute_lower_bound()
+    return ScalingRun(
+        algorithm=task.algorithm,
+        dimension=task.dimension,
+        size=task.size,
+        drones=task.drones,
+        stations=task.stations,
+        population=task.population,
+        seed=task.seed,
+        reached=result.gap <= task.target_gap,
+        seconds=result.elapsed_seconds,
+        evaluations=problem.counters.evaluations - evaluations_before,
+        iterations=len(result.trace["iteration_ns"]),
+        fitness=result.fitness,
+        lower_bound=result.lower_bound,
+        gap=result.gap,
+        features=features,
+    )
+
+
+def build_tasks(
+    algorithms: Sequence[str],
+    grids: Dict[str, Sequence[int]],
+    base: Dict[str, int],
+    max_iterations: int,
+    time_limit: float,
+    target_gap: float,
+    layout: str,
+    repeats: int,
+    seed: int,
+) -> List[ScalingTask]:
+    tasks: List[ScalingTask] = []
+    for algorithm in algorithms:
+        for dimension, values in grids.items():
+            for value in values:
+                for repeat in range(repeats):
+                    config = dict(base, **{dimension: value})
+                    tasks.append(
+                        ScalingTask(
+                            algorithm=algorithm,
+                            dimension=dimension,
+                            max_iterations=max_iterations,
+                            time_limit=time_limit,
+                            target_gap=target_gap,
+                            layout=layout,
+                            seed=seed + repeat,
+                            **config,
+                        )
+                    )
+    return tasks
+
+
+def run_tasks(tasks: Sequence[ScalingTask], workers: int = 1) -> List[ScalingRun]:
+    if workers <= 1:
+        return [run_task(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(run_task, tasks))
+
+
+def summarize(runs: Sequence[ScalingRun]) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+    """Fitted time / evaluation exponents per algorithm and dimension (reached runs only)."""
+    groups: Dict[Tuple[str, str], List[ScalingRun]] = {}
+    for run in runs:
+        groups.setdefault((run.algorithm, run.dimension), []).append(run)
+
+    exponents: Dict[str, Dict[str, Dict[str, Optional[float]]]] = {}
+    for (algorithm, dimension), group in sorted(groups.items()):
+        reached = [run for run in group if run.reached]
+        exponents.setdefault(algorithm, {})[dimension] = {
+            "time": fit_exponent([r.size for r in reached], [r.seconds for r in reached]),
+            "evaluations": fit_exponent([r.size for r in reached], [r.evaluations for r in reached]),
+            "reached": len(reached) / len(group),
+        }
+    return exponents
+
+
+def write_report(path: str, runs: Sequence[ScalingRun], settings: Dict[str, object]) -> Dict[str, object]:
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "settings": settings,
+        "exponents": summarize(runs),
+        "runs": [asdict(run) for run in runs],
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    return report
+
+
+def plot_report(runs: Sequence[ScalingRun], directory: str) -> List[str]:
+    """One log-log time-to-target plot per dimension; needs matplotlib."""
+    try:
+        import matplotlib
+
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError as exc:
+        raise RuntimeError("Plotting requires matplotlib (pip install matplotlib)") from exc
+
+    os.makedirs(directory, exist_ok=True)
+    paths: List[str] = []
+    for dimension in DIMENSIONS:
+        selected = [run for run in runs if run.dimension == dimension and run.reached]
+        if not selected:
+            continue
+        figure, axis = plt.subplots(figsize=(7, 5))
+        for algorithm in sorted({run.algorithm for run in selected}):
+            points = sorted((run.size, run.seconds) for run in selected if run.algorithm == algorithm)
+            axis.plot([p[0] for p in points], [p[1] for p in points], marker="o", label=algorithm)
+        axis.set_xscale("log")
+        axis.set_yscale("log")
+        axis.set_xlabel(dimension)
+        axis.set_ylabel("seconds to target")
+        axis.legend()
+        path = os.path.join(directory, f"scaling_{dimension}.png")
+        figure.savefig(path, dpi=120, bbox_inches="tight")
+        plt.close(figure)
+        paths.append(path)
+    return paths
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Solver scaling curves on generated scenarios")
+    algorithms = solver_names(with_population=True)
+    parser.add_argument("--algorithms", nargs="+", choices=algorithms, default=algorithms)
+    parser.add_argument("--dimensions", nargs="+", choices=DIMENSIONS, default=list(DIMENSIONS))
+    parser.add_argument("--drones", type=int, nargs=2, default=[10, 1000], metavar=("LOW", "HIGH"))
+    parser.add_argument("--stations", type=int, nargs=2, default=[5, 500], metavar=("LOW", "HIGH"))
+    parser.add_argument("--population", type=int, nargs=2, default=[5, 80], metavar=("LOW", "HIGH"))
+    parser.add_argument("--points", type=int, default=5, help="Grid points per dimension")
+    parser.add_argument("--base-drones", type=int, default=200)
+    parser.add_argument("--base-stations", type=int, default=40)
+    parser.add_argument("--base-population", type=int, default=20)
+    parser.add_argument("--max-iterations", type=int, default=200)
+    parser.add_argument("--time-limit", type=float, default=10.0, help="Per-run time cap in seconds")
+    parser.add_argument("--target-gap", type=float, default=0.25, help="Target gap to the lower bound")
+    parser.add_argument("--layout", choices=LAYOUTS, default="uniform")
+    parser.add_argument("--repeats", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default="scaling.json", help="JSON report path")
+    parser.add_argument("--plot", default=None, help="Directory for matplotlib plots")
+    args = parser.parse_args(argv)
+
+    if args.points <= 0 or args.repeats <= 0 or args.max_iterations <= 0:
+        parser.error("Points, repeats and max iterations must be positive")
+    if args.time_limit <= 0 or args.target_gap < 0:
+        parser.error("Time limit must be positive and target gap non-negative")
+    if args.plot and importlib.util.find_spec("matplotlib") is None:
+        parser.error("--plot requires matplotlib (pip install matplotlib)")
+
+    ranges = {"drones": args.drones, "stations": args.stations, "population": args.population}
+    grids = {dimension: log_grid(*ranges[dimension], args.points) for dimension in args.dimensions}
+    base = {"drones": args.base_drones, "stations": args.base_stations, "population": args.base_population}
+    settings = dict(
+        grids=grids,
+        base=base,
+        max_iterations=args.max_iterations,
+        time_limit=args.time_limit,
+        target_gap=args.target_gap,
+        layout=args.layout,
+        repeats=args.repeats,
+        seed=args.seed,
+    )
+    tasks = build_tasks(args.algorithms, **settings)
+    print(f"Running {len(tasks)} scaling runs on {args.workers} worker(s)...", flush=True)
+    runs = run_tasks(tasks, workers=args.workers)
+    report = write_report(args.output, runs, settings)
+
+    for algorithm, dimensions in report["exponents"].items():
+        parts = []
+        for dimension, fitted in dimensions.items():
+            exponent = "n/a" if fitted["time"] is None else f"{fitted['time']:.2f}"
+            parts.append(f"{dimension}: k={exponent} (reached {fitted['reached']:.0%})")
+        print(f"{algorithm:>4} | " + " | ".join(parts))
+    print(f"Report written to {args.output}")
+    if args.plot:
+        for path in plot_report(runs, args.plot):
+            print(f"Plot written to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
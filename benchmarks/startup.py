@@ -0,0 +1,91 @@
+"""
+Start-up budget for the CLI.
+
+Times a one-shot static solve (`run.py --scenario static --iterations 1`) in fresh interpreters and
+subtracts the bare interpreter start (`python -c pass`), so the figure is what our imports,
+argument parsing and the solve itself cost. Each command is run `runs` times and the fastest run
+is kept. Bytecode caching is forced on (`PYTHONDONTWRITEBYTECODE` is dropped), since recompiling
+stale modules would otherwise dominate. `--importtime` also prints the slowest imports from
+`python -X importtime`.
+
+    python -m benchmarks.startup                  # exit 1 if over the 50 ms budget
+    python -m benchmarks.startup --importtime --budget-ms 80
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional, Sequence, Tuple
+
+DEFAULT_BUDGET_MS = 50.0
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMMAND = ("run.py", "--scenario", "static", "--iterations", "1")
+
+
+def _environment() -> dict:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def best_time(args: Sequence[str], runs: int) -> float:
+    """Fastest wall time in seconds of `python <args>` over `runs` fresh processes."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, env=_environment(), stdout=subprocess.DEVNULL, check=True)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(runs: int = 20) -> Tuple[float, float]:
+    """(baseline, command) best wall times in seconds."""
+    best_time(COMMAND, 1)  # warm the bytecode caches
+    return best_time(("-c", "pass"), runs), best_time(COMMAND, runs)
+
+
+def slowest_imports(limit: int = 15) -> List[Tuple[int, int, str]]:
+    """(self us, cumulative us, module) of the slowest imports of a one-shot solve."""
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", *COMMAND],
+        cwd=ROOT,
+        env=_environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line[len("import time:") :].split("|")
+        rows.append((int(own), int(cumulative), module.rstrip()))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:limit]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="CLI start-up budget for a one-shot static solve")
+    parser.add_argument("--runs", type=int, default=20, help="Fresh interpreters per command (best is kept)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Allowed overhead in ms")
+    parser.add_argument("--importtime", action="store_true", help="Also list the slowest imports")
+    args = parser.parse_args(argv)
+    if args.runs <= 0 or args.budget_ms <= 0:
+        parser.error("Runs and budget must be positive")
+
+    baseline, command = measure(args.runs)
+    overhead_ms = (command - baseline) * 1e3
+    print(f"Interpreter: {baseline * 1e3:.1f}ms | One-shot static solve: {command * 1e3:.1f}ms")
+    print(f"Start-up overhead: {overhead_ms:.1f}ms (budget {args.budget_ms:.0f}ms)")
+    if args.importtime:
+        print("Slowest imports (cumulative us, self us):")
+        for own, cumulative, module in slowest_imports():
+            print(f"  {cumulative:>8} {own:>8}  {module}")
+    return 0 if overhead_ms <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
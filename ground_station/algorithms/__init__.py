@@ -1,22 +1,48 @@
 """
 Algorithm adapters exposing a consistent interface for assignment optimization.
 Each algorithm implements `solve(problem: AssignmentProblem) -> AssignmentResult`.
+
+Solver modules are imported on first attribute access (PEP 562), so importing the package (or
+the registry) does not load every solver.
 """
 
-from .abc import ArtificialBeeColony
-from .aco import AntColony
-from .dea import DifferentialEvolution
-from .ga import Genetic
-from .goa import Grasshopper
-from .gwo import GreyWolf
-from .pso import ParticleSwarm
-
-__all__ = [
-    "AntColony",
-    "ArtificialBeeColony",
-    "DifferentialEvolution",
-    "Genetic",
-    "Grasshopper",
-    "GreyWolf",
-    "ParticleSwarm",
-]
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .abc import ArtificialBeeColony
+    from .aco import AntColony
+    from .dea import DifferentialEvolution
+    from .ga import Genetic
+    from .goa import Grasshopper
+    from .gwo import GreyWolf
+    from .portfolio import Portfolio
+    from .pso import ParticleSwarm
+
+_EXPORTS = {
+    "AntColony": ".aco",
+    "ArtificialBeeColony": ".abc",
+    "DifferentialEvolution": ".dea",
+    "Genetic": ".ga",
+    "Grasshopper": ".goa",
+    "GreyWolf": ".gwo",
+    "ParticleSwarm": ".pso",
+    "Portfolio": ".portfolio",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class ArtificialBeeColony:
@@ -14,14 +17,25 @@ class ArtificialBeeColony:
         num_onlooker_bees: int = 20,
         max_iterations: int = 200,
         limit: int = 50,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
     ) -> None:
         self.num_employed_bees = num_employed_bees
         self.num_onlooker_bees = num_onlooker_bees
         self.max_iterations = max_iterations
         self.limit = limit
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem)
         employed = [
             (problem.random_assignment(randomize_battery=True), float("inf"), 0) for _ in range(self.num_employed_bees)
         ]  # (solution, fitness, trials)
@@ -32,13 +46,13 @@ class ArtificialBeeColony:
 
         for _ in range(self.max_iterations):
             employed = [
-                self._employed_step(problem, sol, trials) for sol, _, trials in employed
+                self._employed_step(problem, sol, trials, pool) for sol, _, trials in employed
             ]
 
             for _ in range(self.num_onlooker_bees):
                 index = self._select_onlooker(employed)
                 sol, fit, trials = employed[index]
-                new_sol = self._neighbor(problem, sol)
+                new_sol = self._neighbor(problem, sol, pool)
                 new_fit = problem.evaluate(new_sol)
                 if new_fit < fit:
                     employed[index] = (new_sol, new_fit, 0)
@@ -54,31 +68,40 @@ class ArtificialBeeColony:
                     best_fitness = fit
                     best_solution = sol
             history.append(best_fitness)
+            trace.record([fit for _, fit, _ in employed], [sol for sol, _, _ in employed])
+            if stop.should_stop(best_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best_solution]
         return AssignmentResult(
             assignments=assignments,
             fitness=best_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
 
-    def _neighbor(self, problem: AssignmentProblem, solution: List[Tuple[int, float]]) -> List[Tuple[int, float]]:
+    def _neighbor(
+        self, problem: AssignmentProblem, solution: List[Tuple[int, float]], pool: StationPool
+    ) -> List[Tuple[int, float]]:
+        # move every drone to another free station; stations it leaves are not handed out again
         neighbor: List[Tuple[int, float]] = []
-        available = list(range(len(problem.stations)))
-        random.shuffle(available)
+        pool.reset()
         for idx, (station_idx, _) in enumerate(solution):
-            if station_idx >= 0 and station_idx in available:
-                available.remove(station_idx)
-            new_station = available.pop() if available else -1
-            neighbor.append((new_station, random.uniform(0, problem.drones[idx].max_battery_level)))
+            if station_idx >= 0:
+                pool.take(station_idx)
+            new_station = pool.pick(idx)
+            if new_station >= 0:
+                pool.take(new_station)
+            neighbor.append((new_station, random.uniform(0, problem.fleet.max_battery[idx])))
         return neighbor
 
     def _employed_step(
-        self, problem: AssignmentProblem, solution: List[Tuple[int, float]], trials: int
+        self, problem: AssignmentProblem, solution: List[Tuple[int, float]], trials: int, pool: StationPool
     ) -> Tuple[List[Tuple[int, float]], float, int]:
-        new_sol = self._neighbor(problem, solution)
+        new_sol = self._neighbor(problem, solution, pool)
         fit_old = problem.evaluate(solution)
         fit_new = problem.evaluate(new_sol)
         if fit_new < fit_old:
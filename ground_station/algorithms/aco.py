@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import math
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class AntColony:
@@ -17,6 +21,10 @@ class AntColony:
         beta: float = 2.0,
         initial_pheromone: float = 1.0,
         deposit_weight: float = 1.0,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
     ) -> None:
         self.num_ants = num_ants
         self.num_iterations = num_iterations
@@ -25,19 +33,26 @@ class AntColony:
         self.beta = beta
         self.initial_pheromone = initial_pheromone
         self.deposit_weight = deposit_weight
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
-        pheromones = [self.initial_pheromone for _ in range(len(problem.stations))]
-        best_solution: List[int] = [-1 for _ in problem.drones]
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem)
+        pheromones = [self.initial_pheromone for _ in range(problem.num_stations)]
+        best_solution: List[int] = [-1 for _ in range(problem.num_drones)]
         best_fitness = float("inf")
         history: List[float] = []
 
         for _ in range(self.num_iterations):
             ants: List[Tuple[List[int], float]] = []
             for _ in range(self.num_ants):
-                assignment = self._construct_solution(problem, pheromones)
-                fitness = problem.evaluate([(s, problem.drones[i].max_battery_level) for i, s in enumerate(assignment)])
+                assignment = self._construct_solution(problem, pheromones, pool)
+                fitness = problem.evaluate(assignment)
                 ants.append((assignment, fitness))
 
                 if fitness < best_fitness:
@@ -54,19 +69,28 @@ class AntColony:
                         pheromones[station_idx] += deposit_amount
 
             history.append(best_fitness)
+            trace.record([fitness for _, fitness in ants], [assignment for assignment, _ in ants])
+            if stop.should_stop(best_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         return AssignmentResult(
             assignments=best_solution,
             fitness=best_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
 
-    def _construct_solution(self, problem: AssignmentProblem, pheromones: List[float]) -> List[int]:
-        available = list(range(len(problem.stations)))
+    def _construct_solution(
+        self, problem: AssignmentProblem, pheromones: List[float], pool: StationPool
+    ) -> List[int]:
+        pool.reset()
         assignment: List[int] = []
-        for drone in problem.drones:
+        station_x, station_y = problem.station_set.x, problem.station_set.y
+        for drone_idx, (x, y) in enumerate(zip(problem.fleet.x, problem.fleet.y)):
+            available = pool.available(drone_idx) if pool else []
             if not available:
                 assignment.append(-1)
                 continue
@@ -74,12 +98,12 @@ class AntColony:
             weights = []
             for station_idx in available:
                 pheromone_component = pheromones[station_idx] ** self.alpha
-                distance = problem.distance(drone.position, problem.stations[station_idx].position)
+                distance = math.sqrt((x - station_x[station_idx]) ** 2 + (y - station_y[station_idx]) ** 2)
                 heuristic = (1 / (distance + 1e-9)) ** self.beta
                 weights.append(pheromone_component * heuristic)
 
             selected = random.choices(available, weights=weights, k=1)[0]
             assignment.append(selected)
-            available.remove(selected)
+            pool.take(selected)
 
         return assignment
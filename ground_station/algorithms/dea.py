@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class DifferentialEvolution:
@@ -14,52 +17,66 @@ class DifferentialEvolution:
         max_iterations: int = 200,
         scaling_factor: float = 0.8,
         crossover_rate: float = 0.7,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+        nearest_repair: bool = False,
     ) -> None:
         self.population_size = population_size
         self.max_iterations = max_iterations
         self.scaling_factor = scaling_factor
         self.crossover_rate = crossover_rate
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.nearest_repair = nearest_repair
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
-        population = [self._random_vector(problem) for _ in range(self.population_size)]
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem, nearest=self.nearest_repair)
+        population = [problem.random_assignment(randomize_battery=True) for _ in range(self.population_size)]
         best = population[0]
         best_fitness = problem.evaluate(best)
         history: List[float] = [best_fitness]
 
         for _ in range(self.max_iterations):
+            fitnesses: List[float] = []
             for i in range(self.population_size):
-                trial = self._mutate_and_crossover(problem, population, i)
+                trial = self._mutate_and_crossover(problem, population, i, pool)
                 trial_fitness = problem.evaluate(trial)
                 current_fitness = problem.evaluate(population[i])
                 if trial_fitness < current_fitness:
                     population[i] = trial
+                fitnesses.append(min(trial_fitness, current_fitness))
                 if trial_fitness < best_fitness:
                     best = trial
                     best_fitness = trial_fitness
             history.append(best_fitness)
+            trace.record(fitnesses, population)
+            if stop.should_stop(best_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best]
         return AssignmentResult(
             assignments=assignments,
             fitness=best_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
 
-    def _random_vector(self, problem: AssignmentProblem) -> List[Tuple[int, float]]:
-        available = list(range(len(problem.stations)))
-        random.shuffle(available)
-        vector: List[Tuple[int, float]] = []
-        for drone in problem.drones:
-            station_idx = available.pop() if available else -1
-            battery = random.uniform(0, drone.max_battery_level)
-            vector.append((station_idx, battery))
-        return vector
-
     def _mutate_and_crossover(
-        self, problem: AssignmentProblem, population: List[List[Tuple[int, float]]], idx: int
+        self,
+        problem: AssignmentProblem,
+        population: List[List[Tuple[int, float]]],
+        idx: int,
+        pool: StationPool,
     ) -> List[Tuple[int, float]]:
         indices = list(range(len(population)))
         indices.remove(idx)
@@ -68,9 +85,9 @@ class DifferentialEvolution:
         for j in range(len(population[idx])):
             xa, xb, xc = population[a][j][0], population[b][j][0], population[c][j][0]
             new_station = xa + self.scaling_factor * (xb - xc)
-            new_station = max(-1, min(int(round(new_station)), len(problem.stations) - 1))
+            new_station = max(-1, min(int(round(new_station)), problem.num_stations - 1))
             new_battery = population[a][j][1] + self.scaling_factor * (population[b][j][1] - population[c][j][1])
-            new_battery = max(0.0, min(new_battery, problem.drones[j].max_battery_level))
+            new_battery = max(0.0, min(new_battery, problem.fleet.max_battery[j]))
             donor.append((new_station, new_battery))
 
         trial: List[Tuple[int, float]] = []
@@ -80,15 +97,10 @@ class DifferentialEvolution:
             else:
                 trial.append(gene)
 
-        # enforce uniqueness if requested
-        if problem.require_unique_station:
-            seen = set()
+        # enforce uniqueness if requested, and keep every drone within station coverage
+        if problem.require_unique_station or problem.has_coverage_limits:
+            pool.reset()
             for j, (station_idx, battery) in enumerate(trial):
-                if station_idx >= 0 and station_idx in seen:
-                    available = [s for s in range(len(problem.stations)) if s not in seen]
-                    station_idx = random.choice(available) if available else -1
-                    trial[j] = (station_idx, battery)
-                if station_idx >= 0:
-                    seen.add(station_idx)
+                trial[j] = (pool.assign(j, station_idx), battery)
 
         return trial
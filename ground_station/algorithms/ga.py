@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class Genetic:
@@ -14,6 +17,11 @@ class Genetic:
         mutation_rate: float = 0.1,
         crossover_rate: float = 0.7,
         max_generations: int = 200,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+        nearest_repair: bool = False,
     ) -> None:
         if population_size <= 0:
             raise ValueError("Population size must be positive")
@@ -28,9 +36,17 @@ class Genetic:
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.max_generations = max_generations
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.nearest_repair = nearest_repair
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem, nearest=self.nearest_repair)
         population = [problem.random_assignment(randomize_battery=True) for _ in range(self.population_size)]
         history: List[float] = []
 
@@ -38,6 +54,7 @@ class Genetic:
             fitnesses = [problem.evaluate(individual) for individual in population]
             best_idx = fitnesses.index(min(fitnesses))
             history.append(fitnesses[best_idx])
+            trace.record(fitnesses, population)
 
             next_population: List[List[Tuple[int, float]]] = [population[best_idx]]
 
@@ -45,22 +62,26 @@ class Genetic:
                 parent1 = self._select(population, fitnesses)
                 parent2 = self._select(population, fitnesses)
                 child1, child2 = self._crossover(parent1, parent2)
-                child1 = self._mutate(child1, problem)
-                child2 = self._mutate(child2, problem)
+                child1 = self._mutate(child1, problem, pool)
+                child2 = self._mutate(child2, problem, pool)
                 next_population.extend([child1, child2])
 
             population = next_population[: self.population_size]
+            if stop.should_stop(history[-1]):
+                break
 
         fitnesses = [problem.evaluate(individual) for individual in population]
         best_idx = fitnesses.index(min(fitnesses))
         best_solution = population[best_idx]
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best_solution]
 
         return AssignmentResult(
             assignments=assignments,
             fitness=fitnesses[best_idx],
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
 
@@ -86,11 +107,16 @@ class Genetic:
         child2 = parent2[:point] + parent1[point:]
         return child1, child2
 
-    def _mutate(self, individual: List[Tuple[int, float]], problem: AssignmentProblem) -> List[Tuple[int, float]]:
-        num_stations = len(problem.stations)
+    def _mutate(
+        self, individual: List[Tuple[int, float]], problem: AssignmentProblem, pool: StationPool
+    ) -> List[Tuple[int, float]]:
+        # mutate, then repair the duplicates left by crossover and mutation
+        pool.reset()
         for idx, (station_idx, battery) in enumerate(individual):
             if random.random() < self.mutation_rate:
-                station_idx = random.randint(-1, num_stations - 1)
-                battery = random.uniform(0, problem.drones[idx].max_battery_level)
-                individual[idx] = (station_idx, battery)
+                options = problem.feasible_stations(idx)
+                pick = random.randint(-1, len(options) - 1)
+                station_idx = options[pick] if pick >= 0 else -1
+                battery = random.uniform(0, problem.fleet.max_battery[idx])
+            individual[idx] = (pool.assign(idx, station_idx), battery)
         return individual
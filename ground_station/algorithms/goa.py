@@ -2,52 +2,78 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class Grasshopper:
-    def __init__(self, population_size: int = 30, max_iterations: int = 200) -> None:
+    def __init__(
+        self,
+        population_size: int = 30,
+        max_iterations: int = 200,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+        nearest_repair: bool = False,
+    ) -> None:
         self.population_size = population_size
         self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.nearest_repair = nearest_repair
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem, nearest=self.nearest_repair)
         population: List[List[Tuple[int, float]]] = [problem.random_assignment(randomize_battery=True) for _ in range(self.population_size)]
         best_solution = population[0]
         best_fitness = problem.evaluate(best_solution)
         history: List[float] = [best_fitness]
 
         for _ in range(self.max_iterations):
+            fitnesses: List[float] = []
+            # grasshoppers move in place right after scoring; the trace gets the genes that were scored
+            scored: List[List[Tuple[int, float]]] = []
             for idx, sol in enumerate(population):
                 fitness = problem.evaluate(sol)
+                fitnesses.append(fitness)
+                if trace.enabled:
+                    scored.append(list(sol))
                 if fitness < best_fitness:
                     best_fitness = fitness
                     best_solution = [gene for gene in sol]
 
                 # move grasshopper toward best
-                assigned = set()
+                pool.reset()
                 for j, (station_idx, battery) in enumerate(sol):
                     perturb = random.uniform(-1, 1)
                     candidate = int(round((station_idx + best_solution[j][0]) / 2 + perturb))
-                    candidate = max(-1, min(candidate, len(problem.stations) - 1))
-                    if candidate >= 0 and candidate in assigned and problem.require_unique_station:
-                        available = [s for s in range(len(problem.stations)) if s not in assigned]
-                        candidate = random.choice(available) if available else -1
-                    if candidate >= 0:
-                        assigned.add(candidate)
-                    sol[j] = (candidate, battery)
+                    candidate = max(-1, min(candidate, problem.num_stations - 1))
+                    sol[j] = (pool.assign(j, candidate), battery)
 
                 population[idx] = sol
 
             history.append(best_fitness)
+            trace.record(fitnesses, scored)
+            if stop.should_stop(best_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best_solution]
         return AssignmentResult(
             assignments=assignments,
             fitness=best_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
@@ -2,19 +2,41 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class GreyWolf:
-    def __init__(self, num_wolves: int = 20, max_iterations: int = 200) -> None:
+    def __init__(
+        self,
+        num_wolves: int = 20,
+        max_iterations: int = 200,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+        nearest_repair: bool = False,
+    ) -> None:
         self.num_wolves = num_wolves
         self.max_iterations = max_iterations
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.nearest_repair = nearest_repair
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
-        wolves: List[List[Tuple[int, float]]] = [self._random_wolf(problem) for _ in range(self.num_wolves)]
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem, nearest=self.nearest_repair)
+        wolves: List[List[Tuple[int, float]]] = [
+            problem.random_assignment(randomize_battery=True) for _ in range(self.num_wolves)
+        ]
 
         best_fitness = float("inf")
         best_wolf: List[Tuple[int, float]] = wolves[0]
@@ -32,7 +54,7 @@ class GreyWolf:
             a = 2 - 2 * (t / self.max_iterations)
             updated = []
             for wolf in wolves:
-                assigned = set()
+                pool.reset()
                 new_wolf: List[Tuple[int, float]] = []
                 for idx, (station_idx, battery) in enumerate(wolf):
                     r1, r2 = random.random(), random.random()
@@ -40,39 +62,27 @@ class GreyWolf:
                     C1 = 2 * r2
 
                     candidate = int(round(abs(alpha[idx][0] - A1 * abs(C1 * alpha[idx][0] - station_idx))))
-                    candidate = max(-1, min(candidate, len(problem.stations) - 1))
-
-                    if candidate >= 0 and candidate in assigned and problem.require_unique_station:
-                        available = [s for s in range(len(problem.stations)) if s not in assigned]
-                        candidate = random.choice(available) if available else -1
-
-                    if candidate >= 0:
-                        assigned.add(candidate)
-                    new_wolf.append((candidate, battery))
+                    candidate = max(-1, min(candidate, problem.num_stations - 1))
+                    new_wolf.append((pool.assign(idx, candidate), battery))
                 updated.append(new_wolf)
 
+            trace.record(fitnesses, wolves)
             wolves = updated
             history.append(best_fitness)
+            if stop.should_stop(best_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best_wolf]
         return AssignmentResult(
             assignments=assignments,
             fitness=best_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": history},
         )
 
-    def _random_wolf(self, problem: AssignmentProblem) -> List[Tuple[int, float]]:
-        available = list(range(len(problem.stations)))
-        random.shuffle(available)
-        wolf: List[Tuple[int, float]] = []
-        for drone in problem.drones:
-            station_idx = available.pop() if available else -1
-            battery = random.uniform(0, drone.max_battery_level)
-            wolf.append((station_idx, battery))
-        return wolf
-
     def _select_top(self, wolves: List[List[Tuple[int, float]]], fitnesses: List[float]):
         sorted_indices = sorted(range(len(fitnesses)), key=lambda i: fitnesses[i])
         return wolves[sorted_indices[0]], wolves[sorted_indices[1]], wolves[sorted_indices[2]]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import time
+from array import array
+from typing import Dict, Optional, Sequence
+
+from ..problem import AssignmentProblem
+
+COLUMNS = (
+    ("iteration_ns", "q"),
+    ("evaluations", "q"),
+    ("cache_hits", "q"),
+    ("repairs", "q"),
+    ("mean_fitness", "d"),
+    ("diversity", "d"),
+)
+
+
+class SolverTrace:
+    """
+    Per-iteration instrumentation shared by the solver main loops, one array entry per iteration:
+
+    - `iteration_ns`: wall time since the previous record (`perf_counter_ns`).
+    - `evaluations`, `cache_hits`, `repairs`: deltas of the problem's counters.
+    - `mean_fitness`: mean fitness of the scored population.
+    - `diversity`: mean fraction of drones whose station differs from the population's best member.
+    - `peak_memory_bytes`: tracemalloc peak during the iteration (only with `track_memory`).
+
+    A disabled trace ignores `record` calls, so solvers can call it unconditionally.
+    """
+
+    def __init__(self, problem: AssignmentProblem, enabled: bool = True, track_memory: bool = False) -> None:
+        self.problem = problem
+        self.enabled = enabled or track_memory
+        self.track_memory = track_memory
+        self.columns: Dict[str, array] = {}
+        if not self.enabled:
+            return
+
+        self.columns = {name: array(typecode) for name, typecode in COLUMNS}
+        self._owns_tracemalloc = False
+        if track_memory:
+            import tracemalloc  # deferred: only memory tracing needs it
+
+            self._tracemalloc = tracemalloc
+            self.columns["peak_memory_bytes"] = array("q")
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._owns_tracemalloc = True
+            tracemalloc.reset_peak()
+        counters = problem.counters
+        self._last = (counters.evaluations, counters.cache_hits, counters.repairs)
+        self._last_ns = time.perf_counter_ns()
+
+    @classmethod
+    def for_solver(cls, solver: object, problem: AssignmentProblem) -> "SolverTrace":
+        """Build the trace from the solver's `instrument` / `trace_memory` settings."""
+        return cls(
+            problem,
+            enabled=getattr(solver, "instrument", False),
+            track_memory=getattr(solver, "trace_memory", False),
+        )
+
+    def record(self, fitnesses: Sequence[float], population: Optional[Sequence[Sequence]] = None) -> None:
+        """Close the current iteration given the fitness (and genes) of the scored population."""
+        if not self.enabled:
+            return
+
+        now = time.perf_counter_ns()
+        columns = self.columns
+        counters = self.problem.counters
+        current = (counters.evaluations, counters.cache_hits, counters.repairs)
+        columns["iteration_ns"].append(now - self._last_ns)
+        columns["evaluations"].append(current[0] - self._last[0])
+        columns["cache_hits"].append(current[1] - self._last[1])
+        columns["repairs"].append(current[2] - self._last[2])
+        columns["mean_fitness"].append(sum(fitnesses) / len(fitnesses) if fitnesses else float("nan"))
+        columns["diversity"].append(self._diversity(fitnesses, population) if population else 0.0)
+        if self.track_memory:
+            columns["peak_memory_bytes"].append(self._tracemalloc.get_traced_memory()[1])
+            self._tracemalloc.reset_peak()
+
+        self._last = current
+        # Exclude the bookkeeping above from the next iteration's wall time.
+        self._last_ns = time.perf_counter_ns()
+
+    def finish(self) -> Dict[str, array]:
+        """Stop memory tracing (if this trace started it) and return the recorded columns."""
+        if self.enabled and self._owns_tracemalloc:
+            self._tracemalloc.stop()
+            self._owns_tracemalloc = False
+        return self.columns
+
+    @staticmethod
+    def _diversity(fitnesses: Sequence[float], population: Sequence[Sequence]) -> float:
+        best = population[min(range(len(fitnesses)), key=fitnesses.__getitem__)]
+        best_stations = [_station(gene) for gene in best]
+        size = len(best_stations)
+        if size == 0:
+            return 0.0
+        differing = 0
+        for member in population:
+            differing += sum(1 for gene, station in zip(member, best_stations) if _station(gene) != station)
+        return differing / (size * len(population))
+
+
+def _station(gene) -> int:
+    return gene[0] if isinstance(gene, tuple) else gene
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import copy
+import math
+import multiprocessing
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from ..problem import AssignmentProblem, AssignmentResult
+from .aco import AntColony
+from .dea import DifferentialEvolution
+from .ga import Genetic
+from .pso import ParticleSwarm
+
+# Set in every pool worker by `_init_member` when the members run in processes.
+_BOARD = None
+
+
+@dataclass
+class MemberStats:
+    name: str
+    fitness: float
+    elapsed_seconds: float
+    iterations: int
+    cut: bool
+
+
+@dataclass
+class PortfolioResult(AssignmentResult):
+    winner: str = ""
+    members: List[MemberStats] = field(default_factory=list)
+
+
+class _Board:
+    """
+    State shared by the racing members: the incumbent fitness, per-member cut flags and a global
+    stop. Members may be cut from `cut_after` (wall clock) on, or, without a time limit, once
+    they have run `grace_iterations` iterations.
+    """
+
+    def __init__(
+        self, size: int, deadline: Optional[float], cut_after: Optional[float], grace_iterations: int
+    ) -> None:
+        self.incumbent = multiprocessing.Value("d", math.inf)
+        self.cut = multiprocessing.Array("b", size, lock=False)
+        self.stop = multiprocessing.Value("b", 0, lock=False)
+        self.deadline = deadline
+        self.cut_after = cut_after
+        self.grace_iterations = grace_iterations
+
+
+def _init_member(board: _Board) -> None:
+    global _BOARD
+    _BOARD = board
+
+
+def _run_member(
+    index: int,
+    name: str,
+    solver: object,
+    problem: AssignmentProblem,
+    seed: Optional[int],
+    cutoff: float,
+    gap_tolerance: Optional[float],
+    board: Optional[_Board] = None,
+) -> Tuple[AssignmentResult, MemberStats]:
+    """Pool entry point: run one member, publishing its best and stopping when cut or done."""
+    board = board or _BOARD
+    if seed is not None:
+        random.seed(seed)
+    if board.deadline is not None:
+        remaining = max(board.deadline - time.time(), 1e-3)
+        solver.time_limit = remaining if solver.time_limit is None else min(solver.time_limit, remaining)
+
+    lower_bound = problem.lower_bound() if gap_tolerance is not None else None
+    state = {"best": math.inf, "iterations": 0}
+
+    def progress(best: float) -> None:
+        state["best"] = best
+        state["iterations"] += 1
+        with board.incumbent.get_lock():
+            if best < board.incumbent.value:
+                board.incumbent.value = best
+        if gap_tolerance is not None and (best == 0 or (best - lower_bound) / abs(best) <= gap_tolerance):
+            board.stop.value = 1
+
+    def interrupt() -> bool:
+        if board.stop.value:
+            return True
+        if board.cut_after is None:
+            in_grace = state["iterations"] < board.grace_iterations
+        else:
+            in_grace = time.time() < board.cut_after
+        incumbent = board.incumbent.value
+        if not in_grace and state["best"] > incumbent + cutoff * abs(incumbent):
+            board.cut[index] = 1
+            return True
+        return False
+
+    solver.progress = progress
+    solver.interrupt = interrupt
+    result = solver.solve(problem)
+    stats = MemberStats(
+        name=name,
+        fitness=result.fitness,
+        elapsed_seconds=result.elapsed_seconds,
+        iterations=state["iterations"],
+        cut=bool(board.cut[index]),
+    )
+    return result, stats
+
+
+class Portfolio:
+    """
+    Races several solvers on the same problem and returns the best result.
+
+    Members run concurrently (one per worker process by default) under a shared wall-clock budget.
+    Every iteration each member publishes its best fitness to a shared incumbent; once `grace` of
+    the budget has passed (or, without a `time_limit`, once the member has run `grace_iterations`
+    iterations), a member whose best is more than `cutoff` (relative) behind the incumbent is
+    stopped early. With `gap_tolerance` set, all members stop as soon as any of them
+    reaches it.
+
+    Process members are seeded from the caller's `random` state, one seed per member. Thread
+    members share the caller's global `random` generator and are not seeded per member (the
+    solvers draw from the module-level generator, so reseeding it would reset the other threads):
+    a thread portfolio is reproducible with `workers=1`, where members run one after another,
+    but not when its threads interleave.
+    """
+
+    def __init__(
+        self,
+        members: Optional[Sequence[object]] = None,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        cutoff: float = 0.25,
+        grace: float = 0.25,
+        grace_iterations: int = 10,
+        workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> None:
+        if members is None:
+            members = [ParticleSwarm(), Genetic(), DifferentialEvolution(), AntColony()]
+        if not members:
+            raise ValueError("A portfolio needs at least one member")
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Time limit must be positive")
+        if gap_tolerance is not None and gap_tolerance < 0:
+            raise ValueError("Gap tolerance must be non-negative")
+        if cutoff < 0:
+            raise ValueError("Cutoff must be non-negative")
+        if not 0 <= grace <= 1:
+            raise ValueError("Grace must be between 0 and 1")
+        if grace_iterations < 0:
+            raise ValueError("Grace iterations must be non-negative")
+        if workers is not None and workers <= 0:
+            raise ValueError("Workers must be positive")
+
+        self.members = list(members)
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.cutoff = cutoff
+        self.grace = grace
+        self.grace_iterations = grace_iterations
+        self.workers = workers
+        self.use_processes = use_processes
+
+    def member_names(self) -> List[str]:
+        names: List[str] = []
+        for solver in self.members:
+            name = type(solver).__name__
+            count = sum(1 for other in names if other.split("#")[0] == name)
+            names.append(name if count == 0 else f"{name}#{count + 1}")
+        return names
+
+    def solve(self, problem: AssignmentProblem) -> PortfolioResult:
+        start = time.perf_counter()
+        if self.gap_tolerance is not None:
+            problem.lower_bound()  # cached on the problem, so every member receives it precomputed
+        now = time.time()
+        deadline = None if self.time_limit is None else now + self.time_limit
+        cut_after = None if self.time_limit is None else now + self.grace * self.time_limit
+        board = _Board(len(self.members), deadline, cut_after, self.grace_iterations)
+        names = self.member_names()
+        seeds = [random.randrange(2**32) for _ in self.members]
+        workers = self.workers or len(self.members)
+
+        executor: Executor
+        if self.use_processes:
+            executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_member, initargs=(board,))
+        else:
+            executor = ThreadPoolExecutor(max_workers=workers)
+        shared = None if self.use_processes else board
+        interrupt = getattr(self, "interrupt", None)
+        with executor:
+            futures = [
+                executor.submit(
+                    _run_member,
+                    index,
+                    names[index],
+                    copy.copy(solver),
+                    problem,
+                    seeds[index] if self.use_processes else None,
+                    self.cutoff,
+                    self.gap_tolerance,
+                    shared,
+                )
+                for index, solver in enumerate(self.members)
+            ]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                if interrupt is not None and interrupt():
+                    board.stop.value = 1
+            outcomes = [future.result() for future in futures]
+
+        best_result, best_stats = min(outcomes, key=lambda outcome: outcome[0].fitness)
+        return PortfolioResult(
+            assignments=best_result.assignments,
+            fitness=best_result.fitness,
+            elapsed_seconds=time.perf_counter() - start,
+            history=best_result.history,
+            problem=problem,
+            trace=best_result.trace,
+            winner=best_stats.name,
+            members=[stats for _, stats in outcomes],
+        )
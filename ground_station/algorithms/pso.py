@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import random
 import time
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..problem import AssignmentProblem, AssignmentResult
+from .instrumentation import SolverTrace
+from .repair import StationPool
+from .stopping import StopCondition
 
 
 class ParticleSwarm:
@@ -15,6 +18,11 @@ class ParticleSwarm:
         inertia_weight: float = 0.8,
         cognitive_weight: float = 1.5,
         social_weight: float = 2.0,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        instrument: bool = False,
+        trace_memory: bool = False,
+        nearest_repair: bool = False,
     ) -> None:
         if num_particles <= 0:
             raise ValueError("Number of particles must be positive")
@@ -26,11 +34,19 @@ class ParticleSwarm:
         self.inertia_weight = inertia_weight
         self.cognitive_weight = cognitive_weight
         self.social_weight = social_weight
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.instrument = instrument
+        self.trace_memory = trace_memory
+        self.nearest_repair = nearest_repair
 
     def solve(self, problem: AssignmentProblem) -> AssignmentResult:
-        start = time.time()
-        num_stations = len(problem.stations)
-        num_drones = len(problem.drones)
+        start = time.perf_counter()
+        stop = StopCondition.for_solver(self, problem)
+        trace = SolverTrace.for_solver(self, problem)
+        pool = StationPool(problem, nearest=self.nearest_repair)
+        num_stations = problem.num_stations
+        num_drones = problem.num_drones
 
         particles: List[List[Tuple[int, float]]] = [
             problem.random_assignment(randomize_battery=True) for _ in range(self.num_particles)
@@ -40,14 +56,20 @@ class ParticleSwarm:
         fitness_history: List[float] = [best_global_fitness]
 
         for _ in range(self.max_iterations):
+            fitnesses: List[float] = []
+            # particles move in place right after scoring; the trace gets the genes that were scored
+            scored: List[List[Tuple[int, float]]] = []
             for particle in particles:
                 fitness = problem.evaluate(particle)
+                fitnesses.append(fitness)
+                if trace.enabled:
+                    scored.append(list(particle))
                 if fitness < best_global_fitness:
                     best_global = [gene for gene in particle]
                     best_global_fitness = fitness
 
                 # update particle positions (only station indices)
-                assigned = set()
+                pool.reset()
                 for idx in range(num_drones):
                     station_index, battery = particle[idx]
                     inertia = self.inertia_weight * station_index
@@ -55,22 +77,20 @@ class ParticleSwarm:
                     social = self.social_weight * random.random() * (best_global[idx][0] - station_index)
                     candidate = int(round(inertia + cognitive + social))
                     candidate = max(-1, min(candidate, num_stations - 1))
-
-                    if candidate >= 0 and candidate in assigned and problem.require_unique_station:
-                        available = [s for s in range(num_stations) if s not in assigned]
-                        candidate = random.choice(available) if available else -1
-
-                    particle[idx] = (candidate, battery)
-                    if candidate >= 0:
-                        assigned.add(candidate)
+                    particle[idx] = (pool.assign(idx, candidate), battery)
 
             fitness_history.append(best_global_fitness)
+            trace.record(fitnesses, scored)
+            if stop.should_stop(best_global_fitness):
+                break
 
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         assignments = [int(gene[0]) if gene[0] >= 0 else -1 for gene in best_global]
         return AssignmentResult(
             assignments=assignments,
             fitness=best_global_fitness,
             elapsed_seconds=elapsed,
+            problem=problem,
+            trace=trace.finish(),
             history={"best_fitness": fitness_history},
         )
@@ -0,0 +1,246 @@
+"""
+Solver registry and configuration files.
+
+Every solver is registered under a short name with the constructor argument that holds its
+iteration budget and the ones that hold its population size. Classes are imported on first use.
+The typed parameter schema of each solver is read from its constructor signature, so configs are
+checked (unknown names, wrong types) before a solver is built.
+
+A solver config is a TOML or JSON document:
+
+    solver = "aco"
+    iterations = 300          # optional; sets the solver's iteration parameter
+    population = 40           # optional; sets its population parameter(s)
+
+    [params]
+    evaporation_rate = 0.3
+    time_limit = 5.0
+
+A portfolio lists its members as nested configs (`[[params.members]]` in TOML); members inherit
+the portfolio's `iterations` unless they set their own.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import os
+import types
+import typing
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+_SCALARS = (bool, int, float, str)
+
+
+@dataclass(frozen=True)
+class Parameter:
+    name: str
+    kind: type
+    default: Any
+    nullable: bool = False
+
+    def check(self, solver: str, value: Any) -> Any:
+        if value is None:
+            if self.nullable:
+                return None
+        elif self.kind is bool:
+            if isinstance(value, bool):
+                return value
+        elif self.kind is float:
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return float(value)
+        elif isinstance(value, self.kind) and not isinstance(value, bool):
+            return value
+        expected = self.kind.__name__ + (" or null" if self.nullable else "")
+        raise ValueError(f"Parameter '{self.name}' of {solver} must be {expected}, got {value!r}")
+
+
+@dataclass(frozen=True)
+class SolverSpec:
+    name: str
+    class_path: str  # "module:Class"
+    iterations: Optional[str] = None
+    population: Tuple[str, ...] = ()
+    min_population: int = 1
+    # Parameters holding lists of nested solver configs, and the members built when none are given.
+    nested: Tuple[str, ...] = ()
+    default_members: Tuple[str, ...] = ()
+
+    def load(self) -> type:
+        module, _, attribute = self.class_path.partition(":")
+        return getattr(importlib.import_module(module), attribute)
+
+    def schema(self) -> Dict[str, Parameter]:
+        return _schema(self.load())
+
+    def build(
+        self,
+        params: Optional[Dict[str, Any]] = None,
+        iterations: Optional[int] = None,
+        population: Optional[int] = None,
+    ):
+        params = dict(params or {})
+        schema = self.schema() if params else {}  # introspection is skipped for plain builds
+        kwargs: Dict[str, Any] = {}
+        for name, value in params.items():
+            if name in self.nested:
+                if not isinstance(value, list):
+                    raise ValueError(f"Parameter '{name}' of {self.name} must be a list of solver configs")
+                kwargs[name] = [SolverConfig.from_dict(item, iterations=iterations).build() for item in value]
+            elif name in schema:
+                kwargs[name] = schema[name].check(self.name, value)
+            else:
+                allowed = ", ".join(sorted(set(schema) | set(self.nested)))
+                raise ValueError(f"Unknown parameter '{name}' for {self.name}. Allowed: {allowed}")
+
+        for name in self.nested:
+            if name not in kwargs and self.default_members:
+                kwargs[name] = [build_solver(member, iterations=iterations) for member in self.default_members]
+        if iterations is not None and self.iterations is not None:
+            kwargs[self.iterations] = _count(self.name, "Iterations", iterations)
+        if population is not None:
+            if not self.population:
+                raise ValueError(f"{self.name} has no population size")
+            if _count(self.name, "Population", population) < self.min_population:
+                raise ValueError(f"Population of {self.name} must be at least {self.min_population}")
+            for name in self.population:
+                kwargs[name] = population
+        return self.load()(**kwargs)
+
+
+def _count(solver: str, label: str, value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value <= 0:
+        raise ValueError(f"{label} of {solver} must be a positive integer, got {value!r}")
+    return value
+
+
+@lru_cache(maxsize=None)
+def _schema(solver_cls: type) -> Dict[str, Parameter]:
+    """Scalar constructor parameters of `solver_cls` with their types and defaults."""
+    hints = typing.get_type_hints(solver_cls.__init__)
+    schema: Dict[str, Parameter] = {}
+    for name, parameter in inspect.signature(solver_cls.__init__).parameters.items():
+        if name == "self" or name not in hints:
+            continue
+        kind, nullable = hints[name], False
+        if typing.get_origin(kind) in (typing.Union, types.UnionType):
+            options = [arg for arg in typing.get_args(kind) if arg is not type(None)]
+            nullable = len(options) < len(typing.get_args(kind))
+            kind = options[0] if len(options) == 1 else None
+        if kind in _SCALARS:
+            schema[name] = Parameter(name, kind, parameter.default, nullable)
+    return schema
+
+
+SOLVERS: Dict[str, SolverSpec] = {
+    spec.name: spec
+    for spec in (
+        SolverSpec("pso", "ground_station.algorithms.pso:ParticleSwarm", "max_iterations", ("num_particles",)),
+        SolverSpec("gwo", "ground_station.algorithms.gwo:GreyWolf", "max_iterations", ("num_wolves",), 3),
+        SolverSpec("aco", "ground_station.algorithms.aco:AntColony", "num_iterations", ("num_ants",)),
+        SolverSpec("ga", "ground_station.algorithms.ga:Genetic", "max_generations", ("population_size",)),
+        SolverSpec(
+            "abc",
+            "ground_station.algorithms.abc:ArtificialBeeColony",
+            "max_iterations",
+            ("num_employed_bees", "num_onlooker_bees"),
+        ),
+        SolverSpec("goa", "ground_station.algorithms.goa:Grasshopper", "max_iterations", ("population_size",)),
+        SolverSpec(
+            "dea", "ground_station.algorithms.dea:DifferentialEvolution", "max_iterations", ("population_size",), 4
+        ),
+        SolverSpec(
+            "portfolio",
+            "ground_station.algorithms.portfolio:Portfolio",
+            nested=("members",),
+            default_members=("pso", "ga", "dea", "aco"),
+        ),
+    )
+}
+
+
+def solver_spec(name: str) -> SolverSpec:
+    spec = SOLVERS.get(name.lower())
+    if spec is None:
+        raise ValueError(f"Unknown algorithm '{name}'. Available: {', '.join(sorted(SOLVERS))}")
+    return spec
+
+
+def build_solver(
+    name: str,
+    params: Optional[Dict[str, Any]] = None,
+    iterations: Optional[int] = None,
+    population: Optional[int] = None,
+):
+    """Build the solver registered as `name`, checking `params` against its schema."""
+    return solver_spec(name).build(params, iterations=iterations, population=population)
+
+
+@dataclass
+class SolverConfig:
+    solver: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    iterations: Optional[int] = None
+    population: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], iterations: Optional[int] = None) -> "SolverConfig":
+        """Parse a config mapping; `iterations` is the default when the mapping sets none."""
+        if not isinstance(data, dict) or not isinstance(data.get("solver"), str):
+            raise ValueError("A solver config needs a 'solver' name")
+        unknown = set(data) - {"solver", "params", "iterations", "population"}
+        if unknown:
+            raise ValueError(f"Unknown solver config keys: {', '.join(sorted(unknown))}")
+        params = data.get("params", {})
+        if not isinstance(params, dict):
+            raise ValueError("Solver config 'params' must be a table")
+        config = cls(data["solver"], dict(params), data.get("iterations", iterations), data.get("population"))
+        for name in ("iterations", "population"):
+            value = getattr(config, name)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, int) or value <= 0):
+                raise ValueError(f"Solver config '{name}' must be a positive integer")
+        solver_spec(config.solver)
+        return config
+
+    def build(self):
+        return build_solver(self.solver, self.params, iterations=self.iterations, population=self.population)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {"solver": self.solver, "params": self.params}
+        if self.iterations is not None:
+            data["iterations"] = self.iterations
+        if self.population is not None:
+            data["population"] = self.population
+        return data
+
+
+def load_config(path: str) -> SolverConfig:
+    """Read a solver config from a `.toml` or `.json` file."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".toml":
+        try:
+            import tomllib
+        except ImportError as exc:  # Python < 3.11
+            raise ValueError("TOML solver configs need Python 3.11+ (use JSON instead)") from exc
+        with open(path, "rb") as handle:
+            try:
+                data = tomllib.load(handle)
+            except tomllib.TOMLDecodeError as exc:
+                raise ValueError(f"{path}: {exc}") from exc
+    elif extension == ".json":
+        import json
+
+        with open(path, "r", encoding="utf-8") as handle:
+            try:
+                data = json.load(handle)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}: {exc}") from exc
+    else:
+        raise ValueError(f"Solver configs must be .toml or .json files, got '{path}'")
+    return SolverConfig.from_dict(data)
+
+
+def solver_names(with_population: bool = False) -> List[str]:
+    return [name for name, spec in SOLVERS.items() if spec.population or not with_population]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import math
+import random
+from typing import List
+
+from ..problem import AssignmentProblem
+
+# Random draws from a drone's feasible row before falling back to scanning it.
+_SAMPLE_ATTEMPTS = 8
+
+
+class StationPool:
+    """
+    Station occupancy of one solution under construction, shared by the solvers' repair steps.
+
+    Occupancy lives in a `bytearray` borrowed from the problem (the one `evaluate` uses). The
+    stations are also kept in an indexed free list: `_stations` is a permutation whose first
+    `_free` entries are the free stations, and `_position` maps each station to its slot. Taking or
+    releasing a station swaps it across that boundary, so `take`, `release`, `is_free` and a random
+    free pick are O(1), and `reset` clears only the taken stations (or the whole buffer at memcpy
+    speed when many are taken). With coverage limits a random pick samples the drone's feasible
+    row a few times and then scans it.
+
+    `assign` keeps a gene's station if it is feasible (and free when stations are unique) and
+    otherwise repairs it with `pick`: a random free feasible station, or with `nearest` the
+    closest one (found through the problem's spatial index). Occupancy is only recorded by
+    `assign` when the problem requires unique stations.
+    """
+
+    def __init__(self, problem: AssignmentProblem, nearest: bool = False) -> None:
+        self.problem = problem
+        self.nearest = nearest
+        self.unique = problem.require_unique_station
+        self._taken = problem._acquire_occupancy()
+        self._stations = list(range(problem.num_stations))
+        self._position = list(range(problem.num_stations))
+        self._free = problem.num_stations
+
+    def __len__(self) -> int:
+        """Number of free stations."""
+        return self._free
+
+    def reset(self) -> None:
+        """Free every station."""
+        if self._free < len(self._stations):
+            self.problem._clear_occupancy(self._taken, self._stations[self._free :])
+            self._free = len(self._stations)
+
+    def is_free(self, station_idx: int) -> bool:
+        return not self._taken[station_idx]
+
+    def take(self, station_idx: int) -> bool:
+        """Mark the station taken; False if it already was."""
+        if self._taken[station_idx]:
+            return False
+        self._taken[station_idx] = 1
+        self._free -= 1
+        self._swap(self._position[station_idx], self._free)
+        return True
+
+    def release(self, station_idx: int) -> None:
+        if self._taken[station_idx]:
+            self._taken[station_idx] = 0
+            self._swap(self._position[station_idx], self._free)
+            self._free += 1
+
+    def available(self, drone_idx: int) -> List[int]:
+        """The free feasible stations of the drone."""
+        if not self.problem.has_coverage_limits:
+            return self._stations[: self._free]
+        taken = self._taken
+        return [s for s in self.problem.feasible_stations(drone_idx) if not taken[s]]
+
+    def pick(self, drone_idx: int) -> int:
+        """A free feasible station for the drone (random, or the nearest), or -1 if none is left."""
+        if self._free == 0:
+            return -1
+        if self.nearest:
+            return self._pick_nearest(drone_idx)
+        if not self.problem.has_coverage_limits:
+            return self._stations[random.randrange(self._free)]
+
+        row = self.problem.feasible_stations(drone_idx)
+        if not row:
+            return -1
+        taken = self._taken
+        for _ in range(_SAMPLE_ATTEMPTS):
+            station_idx = row[random.randrange(len(row))]
+            if not taken[station_idx]:
+                return station_idx
+        available = self.available(drone_idx)
+        return random.choice(available) if available else -1
+
+    def assign(self, drone_idx: int, station_idx: int) -> int:
+        """The station the drone ends up with: `station_idx` if it is usable, else a repaired pick."""
+        problem = self.problem
+        if station_idx >= 0 and (
+            not problem.is_feasible(drone_idx, station_idx) or (self.unique and not self.take(station_idx))
+        ):
+            problem.counters.repairs += 1
+            station_idx = self.pick(drone_idx)
+            if station_idx >= 0 and self.unique:
+                self.take(station_idx)
+        return station_idx
+
+    def _pick_nearest(self, drone_idx: int) -> int:
+        problem = self.problem
+        x, y = problem.fleet.x[drone_idx], problem.fleet.y[drone_idx]
+        station_x, station_y = problem.station_set.x, problem.station_set.y
+        if not problem.has_coverage_limits:
+            station_idx, _ = problem._station_index().nearest(station_x, station_y, x, y, accept=self.is_free)
+            return station_idx
+
+        best_idx, best_sq = -1, math.inf
+        taken = self._taken
+        for station_idx in problem.feasible_stations(drone_idx):
+            if not taken[station_idx]:
+                dist_sq = (station_x[station_idx] - x) ** 2 + (station_y[station_idx] - y) ** 2
+                if dist_sq < best_sq:
+                    best_idx, best_sq = station_idx, dist_sq
+        return best_idx
+
+    def _swap(self, a: int, b: int) -> None:
+        stations, position = self._stations, self._position
+        station_a, station_b = stations[a], stations[b]
+        stations[a], stations[b] = station_b, station_a
+        position[station_a], position[station_b] = b, a
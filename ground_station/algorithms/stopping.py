@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from ..problem import AssignmentProblem
+
+
+class StopCondition:
+    """
+    Early-termination checks shared by the solver main loops.
+    Solvers call `should_stop` once per iteration, after the best fitness has been updated.
+
+    With `gap_tolerance` set, the search also stops once the relative gap between the best
+    fitness and `lower_bound` drops to the tolerance. `interrupt` is polled every iteration so
+    callers (e.g. the assignment service) can cancel a running solve; the solver then returns its
+    best assignment so far. `progress`, if set, receives the best fitness of every iteration
+    before the checks run (the portfolio uses it to share the incumbent between solvers).
+    """
+
+    def __init__(
+        self,
+        time_limit: Optional[float] = None,
+        gap_tolerance: Optional[float] = None,
+        lower_bound: Optional[float] = None,
+        interrupt: Optional[Callable[[], bool]] = None,
+        progress: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        if time_limit is not None and time_limit <= 0:
+            raise ValueError("Time limit must be positive")
+        if gap_tolerance is not None and gap_tolerance < 0:
+            raise ValueError("Gap tolerance must be non-negative")
+        if gap_tolerance is not None and lower_bound is None:
+            raise ValueError("A gap tolerance requires a lower bound")
+
+        self.time_limit = time_limit
+        self.gap_tolerance = gap_tolerance
+        self.lower_bound = lower_bound
+        self.interrupt = interrupt
+        self.progress = progress
+        self._deadline = None if time_limit is None else time.perf_counter() + time_limit
+
+    @classmethod
+    def for_solver(cls, solver: object, problem: AssignmentProblem) -> "StopCondition":
+        """Build the stop condition from the solver's configured limits."""
+        gap_tolerance = getattr(solver, "gap_tolerance", None)
+        return cls(
+            time_limit=getattr(solver, "time_limit", None),
+            gap_tolerance=gap_tolerance,
+            lower_bound=problem.lower_bound() if gap_tolerance is not None else None,
+            interrupt=getattr(solver, "interrupt", None),
+            progress=getattr(solver, "progress", None),
+        )
+
+    def should_stop(self, best_fitness: float) -> bool:
+        if self.progress is not None:
+            self.progress(best_fitness)
+        if self.interrupt is not None and self.interrupt():
+            return True
+        if self.gap_tolerance is not None:
+            gap = 0.0 if best_fitness == 0 else (best_fitness - self.lower_bound) / abs(best_fitness)
+            if gap <= self.gap_tolerance:
+                return True
+        return self._deadline is not None and time.perf_counter() >= self._deadline
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+from typing import List, Sequence
+
+
+def min_cost_assignment(cost: Sequence[Sequence[float]]) -> float:
+    """
+    Optimal value of the rectangular assignment problem (rows <= columns, every row gets a
+    distinct column) via the O(rows^2 * columns) shortest augmenting path Hungarian method.
+    """
+    rows = len(cost)
+    if rows == 0:
+        return 0.0
+    cols = len(cost[0])
+    if rows > cols:
+        raise ValueError("Cost matrix must not have more rows than columns")
+
+    # 1-based potentials / matching as in the classic formulation; column 0 is a sentinel.
+    u = [0.0] * (rows + 1)
+    v = [0.0] * (cols + 1)
+    match = [0] * (cols + 1)  # match[j] = row assigned to column j
+    way = [0] * (cols + 1)
+
+    for i in range(1, rows + 1):
+        match[0] = i
+        j0 = 0
+        min_v = [math.inf] * (cols + 1)
+        used = [False] * (cols + 1)
+        while True:
+            used[j0] = True
+            i0 = match[j0]
+            row = cost[i0 - 1]
+            delta = math.inf
+            j1 = 0
+            u_i0 = u[i0]
+            for j in range(1, cols + 1):
+                if used[j]:
+                    continue
+                current = row[j - 1] - u_i0 - v[j]
+                if current < min_v[j]:
+                    min_v[j] = current
+                    way[j] = j0
+                if min_v[j] < delta:
+                    delta = min_v[j]
+                    j1 = j
+            for j in range(cols + 1):
+                if used[j]:
+                    u[match[j]] += delta
+                    v[j] -= delta
+                else:
+                    min_v[j] -= delta
+            j0 = j1
+            if match[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            match[j0] = match[j1]
+            j0 = j1
+
+    return sum(cost[match[j] - 1][j - 1] for j in range(1, cols + 1) if match[j])
+
+
+def top_savings_bound(costs: Sequence[float], penalty: float, capacity: int) -> float:
+    """
+    Lower bound when at most `capacity` drones can be served: every drone pays its cheapest
+    option, except that only the `capacity` largest savings over the penalty can be realised.
+    """
+    savings: List[float] = sorted((penalty - c for c in costs if c < penalty), reverse=True)
+    return len(costs) * penalty - sum(savings[:capacity])
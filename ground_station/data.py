@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Sequence, Tuple
+from array import array
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
 
+from .fleet import Fleet
 from .models import Drone, Station
 
 # Default drone catalogue pulled from legacy scripts.
@@ -11,62 +14,198 @@ DRONE_CATALOG = [
         "max_speed": 68,
         "battery_capacity_mAh": 3500,
         "battery_voltage_V": 11.55,
+        "motor_power_per_propeller": 50,
+        "num_propellers": 7,
+        "processor_power": 10,
+        "battery_power": 15,
+        "sensor_power": 5,
+        "communication_power": 3,
+        "max_altitude": 5000,
     },
     {
         "name": "Parrot Anafi",
         "max_speed": 55,
         "battery_capacity_mAh": 6800,
         "battery_voltage_V": 11.55,
+        "motor_power_per_propeller": 50,
+        "num_propellers": 4,
+        "processor_power": 8,
+        "battery_power": 12,
+        "sensor_power": 4,
+        "communication_power": 2,
+        "max_altitude": 4500,
     },
     {
         "name": "Skydio 2",
         "max_speed": 55,
         "battery_capacity_mAh": 4280,
         "battery_voltage_V": 13.05,
+        "motor_power_per_propeller": 45,
+        "num_propellers": 4,
+        "processor_power": 7,
+        "battery_power": 10,
+        "sensor_power": 3,
+        "communication_power": 2,
+        "max_altitude": 4500,
     },
     {
         "name": "DJI Phantom 4 Pro",
         "max_speed": 72,
         "battery_capacity_mAh": 5870,
         "battery_voltage_V": 15.2,
+        "motor_power_per_propeller": 60,
+        "num_propellers": 4,
+        "processor_power": 10,
+        "battery_power": 15,
+        "sensor_power": 5,
+        "communication_power": 3,
+        "max_altitude": 4500,
     },
     {
         "name": "Autel Robotics EVO 2",
         "max_speed": 72,
         "battery_capacity_mAh": 7100,
         "battery_voltage_V": 11.55,
+        "motor_power_per_propeller": 55,
+        "num_propellers": 4,
+        "processor_power": 9,
+        "battery_power": 13,
+        "sensor_power": 5,
+        "communication_power": 3,
+        "max_altitude": 4500,
     },
     {
         "name": "Yuunec Typhoon H Pro",
         "max_speed": 70,
         "battery_capacity_mAh": 5400,
         "battery_voltage_V": 14.8,
+        "motor_power_per_propeller": 70,
+        "num_propellers": 6,
+        "processor_power": 12,
+        "battery_power": 18,
+        "sensor_power": 6,
+        "communication_power": 4,
+        "max_altitude": 4500,
     },
 ]
 
+MODEL_INDEX = {model["name"]: idx for idx, model in enumerate(DRONE_CATALOG)}
+
+
+@dataclass(frozen=True)
+class CatalogTable:
+    """The drone catalogue compiled into typed columns indexed by model index."""
+
+    names: Tuple[str, ...]
+    max_speed: array
+    battery_wh: array
+    motor_power_per_propeller: array
+    num_propellers: array
+    processor_power: array
+    battery_power: array
+    sensor_power: array
+    communication_power: array
+    total_power: array  # W drawn in flight: all propellers plus on-board electronics
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def compile_catalog(catalog: Sequence[dict]) -> CatalogTable:
+    def column(typecode: str, key: str) -> array:
+        return array(typecode, [model[key] for model in catalog])
+
+    motor = column("d", "motor_power_per_propeller")
+    propellers = column("i", "num_propellers")
+    processor = column("d", "processor_power")
+    battery = column("d", "battery_power")
+    sensor = column("d", "sensor_power")
+    communication = column("d", "communication_power")
+    return CatalogTable(
+        names=tuple(model["name"] for model in catalog),
+        max_speed=column("d", "max_speed"),
+        battery_wh=array("d", [m["battery_capacity_mAh"] * m["battery_voltage_V"] / 1000 for m in catalog]),
+        motor_power_per_propeller=motor,
+        num_propellers=propellers,
+        processor_power=processor,
+        battery_power=battery,
+        sensor_power=sensor,
+        communication_power=communication,
+        total_power=array(
+            "d",
+            [m * n + p + b + s + c for m, n, p, b, s, c in zip(motor, propellers, processor, battery, sensor, communication)],
+        ),
+    )
+
+
+CATALOG = compile_catalog(DRONE_CATALOG)
+
+
+def station_name(idx: int) -> str:
+    """Spreadsheet-style station names: A..Z, AA..AZ, BA.. with no upper limit."""
+    if idx < 0:
+        raise ValueError("Station index must be non-negative")
+
+    letters = []
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters.append(chr(65 + rem))
+    return f"Istasyon {''.join(reversed(letters))}"
+
+
+def catalog_models(count: int) -> array:
+    """Default model assignment: cycle through the catalogue in order."""
+    size = len(CATALOG)
+    return array("i", [idx % size for idx in range(count)])
+
+
+def build_fleet(xs: Sequence[float], ys: Sequence[float], model: Optional[Sequence[int]] = None) -> Fleet:
+    """Columnar fleet whose per-drone specs are gathered from the compiled catalogue by model index."""
+    if not xs:
+        raise ValueError("At least one drone position is required")
+    if len(xs) != len(ys):
+        raise ValueError("One y coordinate per x coordinate is required")
+
+    model = catalog_models(len(xs)) if model is None else array("i", model)
+    speeds, capacities = CATALOG.max_speed, CATALOG.battery_wh
+    return Fleet(
+        model_names=list(CATALOG.names),
+        model=model,
+        max_speed=array("d", [speeds[idx] for idx in model]),
+        max_battery=array("d", [capacities[idx] for idx in model]),
+        x=array("d", xs),
+        y=array("d", ys),
+    )
+
 
 def build_drones(positions: Sequence[Tuple[float, float]]) -> List[Drone]:
     if not positions:
         raise ValueError("At least one drone position is required")
-    
-    drones: List[Drone] = []
-    for idx, (x, y) in enumerate(positions):
-        model = DRONE_CATALOG[idx % len(DRONE_CATALOG)]
-        battery_wh = (model["battery_capacity_mAh"] * model["battery_voltage_V"]) / 1000
-        drones.append(
-            Drone(
-                model=model["name"],
-                max_speed=model["max_speed"],
-                max_battery_level=battery_wh,
-                x=x,
-                y=y,
-            )
-        )
-    return drones
-
-
-def build_stations(named_positions: Iterable[Tuple[str, Tuple[float, float]]]) -> List[Station]:
-    stations = [Station(name=name, x=pos[0], y=pos[1]) for name, pos in named_positions]
-    if not stations:
+
+    model = catalog_models(len(positions))
+    names, speeds, capacities = CATALOG.names, CATALOG.max_speed, CATALOG.battery_wh
+    return Drone.from_arrays(
+        [names[idx] for idx in model],
+        [speeds[idx] for idx in model],
+        [capacities[idx] for idx in model],
+        [x for x, _ in positions],
+        [y for _, y in positions],
+    )
+
+
+def build_stations(
+    named_positions: Iterable[Tuple[str, Tuple[float, float]]], coverage_radius: Optional[float] = None
+) -> List[Station]:
+    if coverage_radius is not None and coverage_radius < 0:
+        raise ValueError("Coverage radius must be non-negative")
+
+    named_positions = list(named_positions)
+    if not named_positions:
         raise ValueError("At least one station is required")
-    return stations
+    return Station.from_arrays(
+        [name for name, _ in named_positions],
+        [pos[0] for _, pos in named_positions],
+        [pos[1] for _, pos in named_positions],
+        [coverage_radius] * len(named_positions),
+    )
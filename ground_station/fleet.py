@@ -0,0 +1,203 @@
+"""
+Columnar (struct-of-arrays) drone and station data used by the fitness function and solvers.
+The `Drone` / `Station` dataclasses are materialized on demand as read-only views for reporting.
+
+Columns may be `memoryview`s over a mapped scenario file. Those do not pickle, so a pickled
+fleet or station set stores the file's `MappedSource` in their place and maps the file again
+when unpickled; if the file changed since it was mapped, the columns are copied instead.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from .models import Drone, Station
+
+if TYPE_CHECKING:
+    from .scenario_file import MappedSource
+
+Column = Union[array, memoryview]
+
+# Column attribute -> ScenarioData column, used to re-map pickled file-backed columns.
+_FLEET_COLUMNS = {"model": "drone_model", "max_speed": "drone_speed", "max_battery": "drone_battery",
+                  "x": "drone_x", "y": "drone_y", "battery_level": "drone_charge"}
+_STATION_COLUMNS = {"x": "station_x", "y": "station_y", "coverage_radius": "station_radius"}
+
+
+@dataclass
+class Fleet:
+    model_names: List[str]
+    model: Column  # int32 index into model_names
+    max_speed: Column
+    max_battery: Column  # battery capacity (Wh) the energy model works with
+    x: Column
+    y: Column
+    # Remaining charge (Wh) last reported for each drone, e.g. by telemetry; None if not known.
+    # Informational only: `evaluate` and `fingerprint` use `max_battery`.
+    battery_level: Optional[Column] = None
+    source: Optional["MappedSource"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        size = len(self.x)
+        for name in ("model", "max_speed", "max_battery", "y"):
+            if len(getattr(self, name)) != size:
+                raise ValueError(f"Fleet column '{name}' must have one entry per drone")
+        if self.battery_level is not None and len(self.battery_level) != size:
+            raise ValueError("Fleet column 'battery_level' must have one entry per drone")
+        self.drones = DroneView(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return _column_state(self, _FLEET_COLUMNS)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        _restore_columns(self, state, _FLEET_COLUMNS)
+
+    @classmethod
+    def from_drones(cls, drones: Sequence[Drone]) -> "Fleet":
+        model_index: Dict[str, int] = {}
+        return cls(
+            model=array("i", [model_index.setdefault(drone.model, len(model_index)) for drone in drones]),
+            model_names=list(model_index),
+            max_speed=array("d", [drone.max_speed for drone in drones]),
+            max_battery=array("d", [drone.max_battery_level for drone in drones]),
+            x=array("d", [drone.x for drone in drones]),
+            y=array("d", [drone.y for drone in drones]),
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def drone(self, idx: int) -> Drone:
+        return Drone(
+            model=self.model_names[self.model[idx]],
+            max_speed=self.max_speed[idx],
+            max_battery_level=self.max_battery[idx],
+            x=self.x[idx],
+            y=self.y[idx],
+        )
+
+    def make_positions_writable(self) -> None:
+        """Copy memory-mapped position columns into private arrays before moving drones."""
+        if not isinstance(self.x, array):
+            self.x = array("d", self.x)
+        if not isinstance(self.y, array):
+            self.y = array("d", self.y)
+
+
+@dataclass
+class StationSet:
+    names: List[str]
+    x: Column
+    y: Column
+    coverage_radius: Column  # NaN means unlimited coverage
+    source: Optional["MappedSource"] = field(default=None, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        size = len(self.x)
+        if len(self.names) != size or len(self.y) != size or len(self.coverage_radius) != size:
+            raise ValueError("Station columns must have one entry per station")
+        self.stations = StationView(self)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return _column_state(self, _STATION_COLUMNS)
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        _restore_columns(self, state, _STATION_COLUMNS)
+
+    @classmethod
+    def from_stations(cls, stations: Sequence[Station]) -> "StationSet":
+        return cls(
+            names=[station.name for station in stations],
+            x=array("d", [station.x for station in stations]),
+            y=array("d", [station.y for station in stations]),
+            coverage_radius=array(
+                "d", [math.nan if station.coverage_radius is None else station.coverage_radius for station in stations]
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def station(self, idx: int) -> Station:
+        radius = self.coverage_radius[idx]
+        return Station(
+            name=self.names[idx],
+            x=self.x[idx],
+            y=self.y[idx],
+            coverage_radius=None if math.isnan(radius) else radius,
+        )
+
+    def make_positions_writable(self) -> None:
+        if not isinstance(self.x, array):
+            self.x = array("d", self.x)
+        if not isinstance(self.y, array):
+            self.y = array("d", self.y)
+
+
+def _column_state(owner: Any, columns: Dict[str, str]) -> Dict[str, Any]:
+    """Pickle state with mapped columns replaced by None (re-mapped from `source`) or copied."""
+    state = dict(owner.__dict__)
+    remap = owner.source is not None and owner.source.is_current()
+    for name in columns:
+        column = state[name]
+        if isinstance(column, memoryview):
+            state[name] = None if remap else array(column.format, column)
+    if not remap:
+        state["source"] = None
+    return state
+
+
+def _restore_columns(owner: Any, state: Dict[str, Any], columns: Dict[str, str]) -> None:
+    # Optional columns that were never set are None too; they come back as None from the file.
+    missing = [name for name in columns if state.get(name) is None] if state["source"] is not None else []
+    if missing:
+        data = state["source"].open()
+        for name in missing:
+            state[name] = getattr(data, columns[name])
+    owner.__dict__.update(state)
+
+
+class _ColumnView(Sequence):
+    """Read-only sequence materializing one dataclass per access from the backing columns."""
+
+    def __init__(self, columns) -> None:
+        self._columns = columns
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._item(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("index out of range")
+        return self._item(idx)
+
+    def __iter__(self) -> Iterator:
+        return (self._item(i) for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(len={len(self)})"
+
+    def _item(self, idx: int):
+        raise NotImplementedError
+
+
+class DroneView(_ColumnView):
+    def _item(self, idx: int) -> Drone:
+        return self._columns.drone(idx)
+
+
+class StationView(_ColumnView):
+    def _item(self, idx: int) -> Station:
+        return self._columns.station(idx)
@@ -0,0 +1,180 @@
+"""
+Streaming ingestion of drone telemetry (id, model, x, y, battery) from CSV or JSON Lines.
+
+Rows are parsed straight into columnar chunks; no `Drone` object is created per row, and only one
+chunk is held in memory at a time. `battery` is the drone's remaining charge in Wh; it is kept
+apart from the battery capacity, which comes from the drone catalogue like the speed.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Sequence
+
+from .data import CATALOG, MODEL_INDEX
+from .models import Station
+from .scenario_file import ScenarioData, SpilledColumn, write_scenario
+
+FIELDS = ("id", "model", "x", "y", "battery")
+FORMATS = ("csv", "jsonl")
+
+
+@dataclass
+class TelemetryChunk:
+    ids: List[str] = field(default_factory=list)
+    model: array = field(default_factory=lambda: array("i"))  # index into the drone catalogue
+    x: array = field(default_factory=lambda: array("d"))
+    y: array = field(default_factory=lambda: array("d"))
+    battery: array = field(default_factory=lambda: array("d"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+def detect_format(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson"):
+        return "jsonl"
+    raise ValueError(f"Cannot infer telemetry format from '{path}'; pass fmt='csv' or fmt='jsonl'")
+
+
+def iter_telemetry(path: str, chunk_size: int = 65_536, fmt: Optional[str] = None) -> Iterator[TelemetryChunk]:
+    """Yield telemetry from `path` in chunks of at most `chunk_size` rows."""
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive")
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown telemetry format '{fmt}'. Available: {', '.join(FORMATS)}")
+
+    with open(path, newline="" if fmt == "csv" else None, encoding="utf-8") as handle:
+        rows = _csv_rows(handle) if fmt == "csv" else _jsonl_rows(handle)
+        chunk = TelemetryChunk()
+        for line_no, (drone_id, model, x, y, battery) in rows:
+            model_idx = MODEL_INDEX.get(model)
+            if model_idx is None:
+                raise ValueError(f"{path}:{line_no}: unknown drone model '{model}'")
+            chunk.ids.append(drone_id)
+            chunk.model.append(model_idx)
+            chunk.x.append(float(x))
+            chunk.y.append(float(y))
+            battery = float(battery)
+            if not battery >= 0 or math.isinf(battery):
+                raise ValueError(f"{path}:{line_no}: battery must be a finite non-negative number, got {battery}")
+            chunk.battery.append(battery)
+            if len(chunk.ids) >= chunk_size:
+                yield chunk
+                chunk = TelemetryChunk()
+        if chunk.ids:
+            yield chunk
+
+
+def ingest_to_scenario_file(
+    telemetry_path: str,
+    stations: Sequence[Station],
+    out_path: str,
+    chunk_size: int = 65_536,
+    fmt: Optional[str] = None,
+    unassigned_penalty: float = 100.0,
+    require_unique_station: bool = True,
+) -> int:
+    """
+    Stream a telemetry dump into a binary scenario file and return the number of drones.
+
+    Drone columns are spilled chunk by chunk to temporary files next to `out_path` and then
+    copied into place, so memory use is bounded by `chunk_size` regardless of the input size.
+    Speeds and battery capacities come from the drone catalogue; the remaining charge reported
+    in the telemetry is stored in the file's `drone_charge` column (`Fleet.battery_level`).
+    """
+    if not stations:
+        raise ValueError("At least one station is required")
+
+    spill_dir = os.path.dirname(os.path.abspath(out_path))
+    with tempfile.TemporaryDirectory(dir=spill_dir) as tmp:
+        names = ("x", "y", "speed", "battery", "model", "charge")
+        spills = {name: open(os.path.join(tmp, name), "w+b") for name in names}
+        try:
+            count = 0
+            for chunk in iter_telemetry(telemetry_path, chunk_size=chunk_size, fmt=fmt):
+                columns = {
+                    "x": chunk.x,
+                    "y": chunk.y,
+                    "speed": array("d", [CATALOG.max_speed[idx] for idx in chunk.model]),
+                    "battery": array("d", [CATALOG.battery_wh[idx] for idx in chunk.model]),
+                    "model": chunk.model,
+                    "charge": chunk.battery,
+                }
+                for name, column in columns.items():
+                    _spill(spills[name], column)
+                count += len(chunk)
+
+            if count == 0:
+                raise ValueError(f"'{telemetry_path}' contains no drones")
+
+            write_scenario(
+                out_path,
+                ScenarioData(
+                    drone_x=SpilledColumn(spills["x"], "d", count),
+                    drone_y=SpilledColumn(spills["y"], "d", count),
+                    drone_speed=SpilledColumn(spills["speed"], "d", count),
+                    drone_battery=SpilledColumn(spills["battery"], "d", count),
+                    drone_model=SpilledColumn(spills["model"], "i", count),
+                    drone_charge=SpilledColumn(spills["charge"], "d", count),
+                    station_x=array("d", [station.x for station in stations]),
+                    station_y=array("d", [station.y for station in stations]),
+                    station_radius=array(
+                        "d",
+                        [math.nan if s.coverage_radius is None else s.coverage_radius for s in stations],
+                    ),
+                    station_names=[station.name for station in stations],
+                    model_names=list(CATALOG.names),
+                    unassigned_penalty=unassigned_penalty,
+                    require_unique_station=require_unique_station,
+                ),
+            )
+        finally:
+            for handle in spills.values():
+                handle.close()
+    return count
+
+
+def _csv_rows(handle) -> Iterator:
+    reader = csv.reader(handle)
+    header = next(reader, None)
+    if header is None:
+        return
+    positions = {name.strip().lower(): idx for idx, name in enumerate(header)}
+    missing = [name for name in FIELDS if name not in positions]
+    if missing:
+        raise ValueError(f"Telemetry CSV is missing columns: {', '.join(missing)}")
+
+    i_id, i_model, i_x, i_y, i_battery = (positions[name] for name in FIELDS)
+    for line_no, row in enumerate(reader, start=2):
+        if row:
+            yield line_no, (row[i_id], row[i_model], row[i_x], row[i_y], row[i_battery])
+
+
+def _jsonl_rows(handle) -> Iterator:
+    for line_no, line in enumerate(handle, start=1):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        try:
+            yield line_no, (str(record["id"]), record["model"], record["x"], record["y"], record["battery"])
+        except KeyError as exc:
+            raise ValueError(f"Telemetry line {line_no} is missing field {exc}") from None
+
+
+def _spill(handle, column: array) -> None:
+    if sys.byteorder != "little":
+        column = array(column.typecode, column)
+        column.byteswap()
+    column.tofile(handle)
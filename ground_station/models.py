@@ -1,28 +1,81 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+import math
+from collections import deque
+from dataclasses import dataclass, field, fields
+from typing import Iterable, List, Optional, Sequence, Tuple, Type, TypeVar
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Station:
     name: str
     x: float
     y: float
+    coverage_radius: Optional[float] = None  # None means the station reaches every drone
+    # Stored rather than a property so hot loops read one slot instead of building a tuple.
+    position: Tuple[float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "position", (self.x, self.y))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        names: Iterable[str],
+        xs: Iterable[float],
+        ys: Iterable[float],
+        coverage_radii: Optional[Iterable[Optional[float]]] = None,
+    ) -> List["Station"]:
+        """Bulk constructor from parallel columns."""
+        names = list(names)
+        if coverage_radii is None:
+            coverage_radii = [None] * len(names)
+        return _from_columns(cls, (names, xs, ys, coverage_radii))
 
-    @property
-    def position(self) -> Tuple[float, float]:
-        return self.x, self.y
+    def is_inside_coverage_area(self, x: float, y: float) -> bool:
+        if self.coverage_radius is None:
+            return True
+        return math.hypot(x - self.x, y - self.y) <= self.coverage_radius
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Drone:
     model: str
     max_speed: float
     max_battery_level: float
     x: float
     y: float
+    position: Tuple[float, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "position", (self.x, self.y))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        models: Iterable[str],
+        max_speeds: Iterable[float],
+        max_battery_levels: Iterable[float],
+        xs: Iterable[float],
+        ys: Iterable[float],
+    ) -> List["Drone"]:
+        """Bulk constructor from parallel columns."""
+        return _from_columns(cls, (models, max_speeds, max_battery_levels, xs, ys))
+
 
-    @property
-    def position(self) -> Tuple[float, float]:
-        return self.x, self.y
+def _from_columns(cls: Type[T], columns: Sequence[Iterable]) -> List[T]:
+    # Frozen dataclasses route every field through object.__setattr__ in __init__; writing the
+    # slot descriptors directly on bare instances skips that. Filling one slot at a time across
+    # all instances keeps the per-instance work in C (`map`) and builds large lists faster.
+    values = dict(zip([f.name for f in fields(cls) if f.init], map(list, columns)))
+    lengths = {name: len(column) for name, column in values.items()}
+    if len(set(lengths.values())) > 1:
+        raise ValueError(f"{cls.__name__} columns must have the same length, got {lengths}")
+    values["position"] = list(zip(values["x"], values["y"]))
+    new = object.__new__
+    instances = [new(cls) for _ in range(len(values["x"]))]
+    for name in cls.__slots__:
+        deque(map(getattr(cls, name).__set__, instances, values[name]), maxlen=0)
+    return instances
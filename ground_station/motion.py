@@ -0,0 +1,70 @@
+"""
+Column-wise motion kernel: positions and velocities are kept as parallel `array('d')` columns and
+advanced with one comprehension per axis instead of per-drone tuple handling.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from typing import List, Sequence, Tuple
+
+from .spatial import SpatialHashGrid
+
+
+def integrate(
+    positions: Sequence[float], velocities: Sequence[float], dt: float, upper: float, lower: float = 0.0
+) -> array:
+    """Advance one axis by `velocity * dt` and clamp the result to [lower, upper]."""
+    return array(
+        "d",
+        [
+            lower if p < lower else upper if p > upper else p
+            for p in [x + v * dt for x, v in zip(positions, velocities)]
+        ],
+    )
+
+
+def changed_indices(
+    old_xs: Sequence[float], old_ys: Sequence[float], new_xs: Sequence[float], new_ys: Sequence[float]
+) -> List[int]:
+    return [
+        idx
+        for idx, (ox, oy, nx, ny) in enumerate(zip(old_xs, old_ys, new_xs, new_ys))
+        if ox != nx or oy != ny
+    ]
+
+
+def near_collisions(xs: Sequence[float], ys: Sequence[float], radius: float) -> List[Tuple[int, int]]:
+    """Index pairs closer than `radius`, found with a uniform spatial hash grid (cell size = radius)."""
+    if radius <= 0 or len(xs) < 2:
+        return []
+    return SpatialHashGrid.build(xs, ys, radius).pairs_within(xs, ys, radius)
+
+
+def separate(
+    xs: array,
+    ys: array,
+    pairs: Sequence[Tuple[int, int]],
+    radius: float,
+    bounds: Tuple[float, float],
+    rng: random.Random,
+) -> List[int]:
+    """
+    Push the second drone of each colliding pair out to `radius` from the first (random heading
+    when they coincide), clamped to the area. Single pass; returns the nudged indices.
+    """
+    width, height = bounds
+    nudged: List[int] = []
+    for i, j in pairs:
+        dx, dy = xs[j] - xs[i], ys[j] - ys[i]
+        dist = math.hypot(dx, dy)
+        if dist == 0.0:
+            angle = rng.uniform(0.0, 2 * math.pi)
+            dx, dy, dist = math.cos(angle), math.sin(angle), 1.0
+        scale = radius / dist
+        xs[j] = max(0.0, min(width, xs[i] + dx * scale))
+        ys[j] = max(0.0, min(height, ys[i] + dy * scale))
+        nudged.append(j)
+    return nudged
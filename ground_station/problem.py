@@ -2,34 +2,103 @@ from __future__ import annotations
 
 import math
 import random
+import struct
+import sys
+from array import array
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Container, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from .bounds import min_cost_assignment, top_savings_bound
+from .data import CATALOG, MODEL_INDEX
+from .fleet import DroneView, Fleet, StationSet, StationView
 from .models import Drone, Station
+from .spatial import SpatialHashGrid
 
 AssignmentGene = Union[int, Tuple[int, float]]
 
+# Instances with at most this many drone x station pairs get the exact (Hungarian) lower bound.
+EXACT_BOUND_MAX_PAIRS = 2_500
+# Occupancy buffers with fewer than 1 / ratio of their stations taken are cleared entry by entry.
+SPARSE_CLEAR_RATIO = 256
+
+
+@dataclass(slots=True)
+class ProblemCounters:
+    """Running totals a solver trace samples per iteration."""
+
+    evaluations: int = 0
+    cache_hits: int = 0  # evaluations served from the cached travel-time matrix
+    repairs: int = 0  # infeasible or duplicate genes repaired (`pick_station`, `StationPool.assign`)
+
 
 @dataclass
 class AssignmentResult:
+    """
+    A solver's best assignment. Solvers pass their `problem` instead of a `lower_bound`; the bound
+    is filled in by `compute_lower_bound` (and cached on the problem), so results stay cheap for
+    callers that never need it. `gap` is None until the bound is known. The problem reference is
+    not pickled.
+    """
+
     assignments: List[int]
     fitness: float
     elapsed_seconds: float
     history: Dict[str, List[float]] = field(default_factory=dict)
+    lower_bound: Optional[float] = field(default=None, repr=False, compare=False)
+    trace: Dict[str, array] = field(default_factory=dict)
+    problem: Optional["AssignmentProblem"] = field(default=None, repr=False, compare=False)
+
+    def compute_lower_bound(self) -> Optional[float]:
+        """Fill `lower_bound` from `problem` unless it is already set; returns the bound."""
+        if self.lower_bound is None and self.problem is not None:
+            self.lower_bound = self.problem.lower_bound()
+        return self.lower_bound
+
+    def __getstate__(self) -> Dict[str, object]:
+        state = dict(self.__dict__)
+        state["problem"] = None
+        return state
+
+    @property
+    def gap(self) -> Optional[float]:
+        """Relative optimality gap `(fitness - lower_bound) / |fitness|`, or None without a bound."""
+        if self.lower_bound is None:
+            return None
+        if self.fitness == 0:
+            return 0.0
+        return max(0.0, (self.fitness - self.lower_bound) / abs(self.fitness))
 
 
 class AssignmentProblem:
     """
     Represents the drone-to-station assignment problem and provides a single fitness function
     used by all algorithms. A station index of -1 means unassigned.
+
+    Drones and stations are stored column-wise (`fleet`, `station_set`); `drones` and `stations`
+    are read-only dataclass views over those columns for reporting.
+
+    Station occupancy (for `require_unique_station`) is tracked in reusable `bytearray` buffers
+    owned by the problem, so neither `evaluate` nor the solvers' repair pools allocate per call.
+
+    Stations with a `coverage_radius` only accept drones inside it. The feasible pairs are
+    precomputed per drone (via a spatial hash over the stations); assigning a drone outside
+    coverage costs the same as leaving it unassigned.
+
+    With `energy_weight > 0` the fitness adds `energy_weight * needed_wh / battery_level`, where
+    `needed_wh` is the flight time to the station times the model's total power draw (catalogue
+    models only; coordinates are converted with `distance_unit_km`). A drone whose battery level
+    cannot cover the flight is penalized like an unassigned one.
     """
 
     def __init__(
         self,
-        drones: Sequence[Drone],
-        stations: Sequence[Station],
+        drones: Union[Sequence[Drone], Fleet],
+        stations: Union[Sequence[Station], StationSet],
         unassigned_penalty: float = 100.0,
         require_unique_station: bool = True,
+        energy_weight: float = 0.0,
+        distance_unit_km: float = 0.001,
     ) -> None:
         if not drones:
             raise ValueError("At least one drone is required")
@@ -37,38 +106,114 @@ class AssignmentProblem:
             raise ValueError("At least one station is required")
         if unassigned_penalty < 0:
             raise ValueError("Unassigned penalty must be non-negative")
-        
-        self.drones = list(drones)
-        self.stations = list(stations)
+        if distance_unit_km <= 0:
+            raise ValueError("Distance unit must be positive")
+
+        self.fleet = drones if isinstance(drones, Fleet) else Fleet.from_drones(drones)
+        self.station_set = stations if isinstance(stations, StationSet) else StationSet.from_stations(stations)
+        self.num_drones = len(self.fleet)
+        self.num_stations = len(self.station_set)
         self.unassigned_penalty = unassigned_penalty
         self.require_unique_station = require_unique_station
+        self.distance_unit_km = distance_unit_km
+        self.counters = ProblemCounters()
+        self._best_costs: Optional[array] = None
+        self._lower_bound: Optional[float] = None
+        self._nearest_grid: Optional[SpatialHashGrid] = None
+        # Zeroed station-occupancy buffers reused by `evaluate` and the solvers' station pools.
+        self._occupancy: List[bytearray] = []
+        self._zeros = bytes(self.num_stations)
+        self.energy_weight = energy_weight
+        self._travel_times: Optional[List[array]] = None
+        self._feasible: Optional[List[array]] = None
+        self._build_feasibility()
+
+    @property
+    def energy_weight(self) -> float:
+        return self._energy_weight
+
+    @energy_weight.setter
+    def energy_weight(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("Energy weight must be non-negative")
+        self._energy_weight = value
+        self._energy_coeff = self._build_energy_coefficients() if value > 0 else None
+        self._best_costs = None
+        self._lower_bound = None
+
+    @property
+    def drones(self) -> DroneView:
+        return self.fleet.drones
+
+    @property
+    def stations(self) -> StationView:
+        return self.station_set.stations
+
+    @classmethod
+    def from_scenario_file(cls, path: str) -> "AssignmentProblem":
+        """Load a problem saved with `scenario_file.save_problem` (memory-mapped, no parsing)."""
+        from .scenario_file import load_scenario
+
+        return load_scenario(path).to_problem()
 
     def evaluate(self, solution: Sequence[AssignmentGene]) -> float:
         if solution is None:
             return math.inf
 
-        assigned_stations = set()
+        travel_times = self._travel_times
+        counters = self.counters
+        counters.evaluations += 1
+        if travel_times is not None:
+            counters.cache_hits += 1
+        feasible = self._feasible
+        max_battery = self.fleet.max_battery
+        drone_x, drone_y = self.fleet.x, self.fleet.y
+        station_x, station_y = self.station_set.x, self.station_set.y
+        max_speed = self.fleet.max_speed
+        penalty = self.unassigned_penalty
+        unique = self.require_unique_station
+        energy_coeff = self._energy_coeff
+        energy_weight = self.energy_weight
+        occupied = self._acquire_occupancy()
         total = 0.0
 
-        for idx, drone in enumerate(self.drones):
-            gene = solution[idx]
-            station_index, battery_level = self._parse_gene(gene, drone)
+        for idx in range(self.num_drones):
+            station_index, battery_level = self._parse_gene(solution[idx], max_battery[idx])
 
             if station_index is None:
-                total += self.unassigned_penalty
+                total += penalty
                 continue
 
-            if self.require_unique_station and station_index in assigned_stations:
-                total += self.unassigned_penalty
+            if feasible is not None and not self._contains(feasible[idx], station_index):
+                total += penalty
                 continue
 
-            assigned_stations.add(station_index)
+            if unique and occupied[station_index]:
+                total += penalty
+                continue
+
+            if travel_times is not None:
+                travel = travel_times[idx][station_index]
+            else:
+                dx = drone_x[idx] - station_x[station_index]
+                dy = drone_y[idx] - station_y[station_index]
+                travel = math.sqrt(dx * dx + dy * dy) / max(max_speed[idx], 1e-9)
 
-            station = self.stations[station_index]
-            distance = self._distance(drone.position, station.position)
-            battery_fitness = 1 - (battery_level / drone.max_battery_level)
-            total += (distance / max(drone.max_speed, 1e-9)) + battery_fitness
+            if energy_coeff is not None:
+                needed = travel * energy_coeff[idx]
+                if needed > battery_level:
+                    total += penalty
+                    continue
+                if battery_level > 0:
+                    total += energy_weight * needed / battery_level
 
+            occupied[station_index] = 1
+            battery_fitness = 1 - (battery_level / max_battery[idx])
+            total += travel + battery_fitness
+
+        # An exception above simply drops the buffer, so a dirty one is never handed out again.
+        self._clear_occupancy(occupied)
+        self._occupancy.append(occupied)
         return total
 
     def random_assignment(self, randomize_battery: bool = False) -> List[Tuple[int, float]]:
@@ -79,28 +224,316 @@ class AssignmentProblem:
             randomize_battery: If True, assigns random battery levels; 
                              if False, uses max battery level (default).
         """
-        available = list(range(len(self.stations)))
-        random.shuffle(available)
         assignments: List[Tuple[int, float]] = []
+        if self._feasible is not None:
+            taken = set()
+            for idx, max_battery in enumerate(self.fleet.max_battery):
+                station_idx = self._pick_station(idx, taken if self.require_unique_station else ())
+                if station_idx >= 0:
+                    taken.add(station_idx)
+                battery = random.uniform(0, max_battery) if randomize_battery else max_battery
+                assignments.append((station_idx, battery))
+            return assignments
 
-        for drone in self.drones:
+        available = list(range(self.num_stations))
+        random.shuffle(available)
+
+        for max_battery in self.fleet.max_battery:
             station_idx = available.pop() if available else -1
-            battery = random.uniform(0, drone.max_battery_level) if randomize_battery else drone.max_battery_level
+            battery = random.uniform(0, max_battery) if randomize_battery else max_battery
             assignments.append((station_idx, battery))
 
         return assignments
 
-    def _parse_gene(self, gene: AssignmentGene, drone: Drone) -> Tuple[Optional[int], float]:
+    def lower_bound(self) -> float:
+        """
+        Lower bound on `evaluate` over all assignments, cached until drones or stations move.
+
+        Each drone's cheapest option is its nearest reachable station at full battery (or the
+        penalty). Without unique stations the bound is the sum of those; with them only the
+        `num_stations` largest savings over the penalty count. Instances with at most
+        `EXACT_BOUND_MAX_PAIRS` pairs are solved exactly with the Hungarian method instead.
+        """
+        if self._lower_bound is None:
+            if self.require_unique_station and self.num_drones * self.num_stations <= EXACT_BOUND_MAX_PAIRS:
+                penalty = self.unassigned_penalty
+                dummies = [penalty] * self.num_drones
+                cost = [
+                    [self.pair_cost(idx, station_idx) for station_idx in range(self.num_stations)] + dummies
+                    for idx in range(self.num_drones)
+                ]
+                self._lower_bound = min_cost_assignment(cost)
+            else:
+                costs = self._drone_best_costs()
+                if self.require_unique_station:
+                    self._lower_bound = top_savings_bound(costs, self.unassigned_penalty, self.num_stations)
+                else:
+                    self._lower_bound = math.fsum(costs)
+        return self._lower_bound
+
+    def energy_needed(self, drone_idx: int, station_idx: int) -> float:
+        """Wh the drone spends flying to the station under the catalogue power model."""
+        coeff = self._energy_coeff if self._energy_coeff is not None else self._build_energy_coefficients()
+        dx = self.fleet.x[drone_idx] - self.station_set.x[station_idx]
+        dy = self.fleet.y[drone_idx] - self.station_set.y[station_idx]
+        travel = math.sqrt(dx * dx + dy * dy) / max(self.fleet.max_speed[drone_idx], 1e-9)
+        return travel * coeff[drone_idx]
+
+    def can_reach(self, drone_idx: int, station_idx: int, battery_level: Optional[float] = None) -> bool:
+        """Whether `battery_level` (default: full battery) covers the flight to the station."""
+        if battery_level is None:
+            battery_level = self.fleet.max_battery[drone_idx]
+        return self.energy_needed(drone_idx, station_idx) <= battery_level
+
+    def best_cost(self, drone_idx: int) -> float:
+        """Lowest fitness contribution the drone can have: its nearest feasible station at full battery."""
+        # Cost and energy both grow with distance, so the nearest feasible station is the best one.
+        x, y = self.fleet.x[drone_idx], self.fleet.y[drone_idx]
+        station_x, station_y = self.station_set.x, self.station_set.y
+        if self._feasible is None:
+            _, distance = self._station_index().nearest(station_x, station_y, x, y)
+        else:
+            distance = min(
+                (math.hypot(station_x[s] - x, station_y[s] - y) for s in self._feasible[drone_idx]),
+                default=math.inf,
+            )
+        return self._cost_at_distance(drone_idx, distance)
+
+    def pair_cost(self, drone_idx: int, station_idx: int) -> float:
+        """Fitness contribution of the drone at full battery at the station (the penalty if infeasible)."""
+        if self._feasible is not None and not self._contains(self._feasible[drone_idx], station_idx):
+            return self.unassigned_penalty
+        dx = self.fleet.x[drone_idx] - self.station_set.x[station_idx]
+        dy = self.fleet.y[drone_idx] - self.station_set.y[station_idx]
+        return self._cost_at_distance(drone_idx, math.sqrt(dx * dx + dy * dy))
+
+    @property
+    def has_coverage_limits(self) -> bool:
+        return self._feasible is not None
+
+    def feasible_stations(self, drone_idx: int) -> Sequence[int]:
+        """Sorted indices of the stations whose coverage contains the drone."""
+        if self._feasible is None:
+            return range(self.num_stations)
+        return self._feasible[drone_idx]
+
+    def is_feasible(self, drone_idx: int, station_idx: int) -> bool:
+        if self._feasible is None:
+            return 0 <= station_idx < self.num_stations
+        return self._contains(self._feasible[drone_idx], station_idx)
+
+    def pick_station(self, drone_idx: int, taken: Container[int] = ()) -> int:
+        """Random feasible station for the drone that is not in `taken`, or -1 if none is left."""
+        self.counters.repairs += 1
+        return self._pick_station(drone_idx, taken)
+
+    def _pick_station(self, drone_idx: int, taken: Container[int]) -> int:
+        available = [s for s in self.feasible_stations(drone_idx) if s not in taken]
+        return random.choice(available) if available else -1
+
+    def _acquire_occupancy(self) -> bytearray:
+        """A zeroed `num_stations` bytearray (1 = taken), reused across evaluations."""
+        try:
+            return self._occupancy.pop()  # atomic, so threads sharing the problem never share a buffer
+        except IndexError:
+            return bytearray(self.num_stations)
+
+    def _clear_occupancy(self, occupied: bytearray, touched: Optional[Sequence[int]] = None) -> None:
+        """
+        Zero `occupied`. A few `touched` stations are cleared one by one; otherwise the buffer is
+        overwritten from a zero block at memcpy speed, which beats a Python loop beyond a handful.
+        """
+        if touched is not None and len(touched) * SPARSE_CLEAR_RATIO < len(occupied):
+            for station_idx in touched:
+                occupied[station_idx] = 0
+        else:
+            occupied[:] = self._zeros
+
+    def fingerprint(self) -> str:
+        """
+        Canonical SHA-256 of everything `evaluate` depends on: drone models, speeds, battery
+        capacities and positions, station positions and coverage, and the fitness settings.
+        Identical problems hash alike whether built from dataclasses, columns or a scenario file.
+        """
+        import hashlib  # deferred: only needed for caching/dedup, keeps CLI startup lean
+
+        digest = hashlib.sha256()
+        digest.update(b"ground-station-problem/1")
+        # Model indices depend on how the fleet was built; hash them as ranks among the used names.
+        names = self.fleet.model_names
+        used = sorted({names[idx] for idx in set(self.fleet.model)})
+        rank = {name: pos for pos, name in enumerate(used)}
+        remap = [rank.get(name, -1) for name in names]
+        model = self.fleet.model
+        if any(pos != idx for idx, pos in enumerate(remap) if pos >= 0):
+            model = array("i", [remap[idx] for idx in model])
+        digest.update("\x1f".join(used).encode("utf-8"))
+        columns = (
+            ("i", model),
+            ("d", self.fleet.max_speed),
+            ("d", self.fleet.max_battery),
+            ("d", self.fleet.x),
+            ("d", self.fleet.y),
+            ("d", self.station_set.x),
+            ("d", self.station_set.y),
+            ("d", self.station_set.coverage_radius),
+        )
+        for typecode, column in columns:
+            digest.update(struct.pack("<Q", len(column)))
+            if sys.byteorder != "little":
+                column = array(typecode, column)
+                column.byteswap()
+            digest.update(column)
+        digest.update(
+            struct.pack(
+                "<d?dd",
+                self.unassigned_penalty,
+                self.require_unique_station,
+                self.energy_weight,
+                self.distance_unit_km,
+            )
+        )
+        return digest.hexdigest()
+
+    def travel_time_matrix(self) -> List[array]:
+        """
+        Return the cached drone x station travel-time matrix, building it on first use.
+
+        Row `i` holds `distance / max_speed` from drone `i` to every station. Once built, `evaluate`
+        reads from the matrix instead of recomputing distances.
+        """
+        if self._travel_times is None:
+            self._travel_times = [self._travel_time_row(idx) for idx in range(self.num_drones)]
+        return self._travel_times
+
+    def move_drones(self, updates: Iterable[Tuple[int, Tuple[float, float]]]) -> None:
+        """Move drones to new positions, refreshing only their rows of the travel-time matrix."""
+        fleet = self.fleet
+        fleet.make_positions_writable()
+        for idx, (x, y) in updates:
+            fleet.x[idx] = x
+            fleet.y[idx] = y
+            if self._travel_times is not None:
+                self._travel_times[idx] = self._travel_time_row(idx)
+            if self._feasible is not None:
+                self._feasible[idx] = self._feasible_row(x, y)
+        # Rebuilt on the next `lower_bound` call rather than with a nearest-station search per move.
+        self._best_costs = None
+        self._lower_bound = None
+
+    def move_stations(self, updates: Iterable[Tuple[int, Tuple[float, float]]]) -> None:
+        """Move stations to new positions, refreshing only their columns of the travel-time matrix."""
+        station_set = self.station_set
+        station_set.make_positions_writable()
+        drone_x, drone_y, max_speed = self.fleet.x, self.fleet.y, self.fleet.max_speed
+        for station_idx, (x, y) in updates:
+            station_set.x[station_idx] = x
+            station_set.y[station_idx] = y
+            if self._travel_times is not None:
+                for idx, row in enumerate(self._travel_times):
+                    dx, dy = drone_x[idx] - x, drone_y[idx] - y
+                    row[station_idx] = math.sqrt(dx * dx + dy * dy) / max(max_speed[idx], 1e-9)
+        if self._feasible is not None:
+            self._build_feasibility()
+        self._best_costs = None
+        self._lower_bound = None
+        self._nearest_grid = None
+
+    def _travel_time_row(self, drone_idx: int) -> array:
+        x, y = self.fleet.x[drone_idx], self.fleet.y[drone_idx]
+        speed = max(self.fleet.max_speed[drone_idx], 1e-9)
+        return array(
+            "d",
+            [
+                math.sqrt((x - sx) * (x - sx) + (y - sy) * (y - sy)) / speed
+                for sx, sy in zip(self.station_set.x, self.station_set.y)
+            ],
+        )
+
+    def _drone_best_costs(self) -> array:
+        if self._best_costs is None:
+            self._best_costs = array("d", [self.best_cost(idx) for idx in range(self.num_drones)])
+        return self._best_costs
+
+    def _cost_at_distance(self, drone_idx: int, distance: float) -> float:
+        """Fitness of a drone flying `distance` at full battery, capped at the penalty."""
+        penalty = self.unassigned_penalty
+        if math.isinf(distance):
+            return penalty
+        travel = distance / max(self.fleet.max_speed[drone_idx], 1e-9)
+        cost = travel
+        if self._energy_coeff is not None:
+            needed = travel * self._energy_coeff[drone_idx]
+            battery = self.fleet.max_battery[drone_idx]
+            if needed > battery:
+                return penalty
+            if battery > 0:
+                cost += self.energy_weight * needed / battery
+        return min(cost, penalty)
+
+    def _station_index(self) -> SpatialHashGrid:
+        if self._nearest_grid is None:
+            xs, ys = self.station_set.x, self.station_set.y
+            # The longer side keeps cells sensible for a single station or colinear stations.
+            side = max(max(xs) - min(xs), max(ys) - min(ys))
+            cell_size = max(side / math.sqrt(self.num_stations), 1.0)
+            self._nearest_grid = SpatialHashGrid.build(xs, ys, cell_size)
+        return self._nearest_grid
+
+    def _build_energy_coefficients(self) -> array:
+        # Per model: W drawn in flight times the km per coordinate unit, so that
+        # travel_time (units / km/h) * coefficient gives Wh. Unknown models draw nothing.
+        per_model = [
+            CATALOG.total_power[MODEL_INDEX[name]] * self.distance_unit_km if name in MODEL_INDEX else 0.0
+            for name in self.fleet.model_names
+        ]
+        return array("d", [per_model[model] for model in self.fleet.model])
+
+    def _build_feasibility(self) -> None:
+        radii = self.station_set.coverage_radius
+        limited = [idx for idx, radius in enumerate(radii) if not math.isnan(radius)]
+        if not limited:
+            self._feasible = None
+            return
+
+        self._unlimited_stations = [idx for idx, radius in enumerate(radii) if math.isnan(radius)]
+        self._limited_stations = limited
+        self._max_radius = max(radii[idx] for idx in limited)
+        self._station_grid = SpatialHashGrid.build(
+            [self.station_set.x[idx] for idx in limited],
+            [self.station_set.y[idx] for idx in limited],
+            max(self._max_radius, 1.0),
+        )
+        self._feasible = [self._feasible_row(x, y) for x, y in zip(self.fleet.x, self.fleet.y)]
+
+    def _feasible_row(self, x: float, y: float) -> array:
+        station_x, station_y = self.station_set.x, self.station_set.y
+        radii = self.station_set.coverage_radius
+        row = list(self._unlimited_stations)
+        for local_idx in self._station_grid.candidates(x, y, self._max_radius):
+            station_idx = self._limited_stations[local_idx]
+            dx, dy = station_x[station_idx] - x, station_y[station_idx] - y
+            if dx * dx + dy * dy <= radii[station_idx] ** 2:
+                row.append(station_idx)
+        row.sort()
+        return array("i", row)
+
+    @staticmethod
+    def _contains(row: array, station_idx: int) -> bool:
+        pos = bisect_left(row, station_idx)
+        return pos < len(row) and row[pos] == station_idx
+
+    def _parse_gene(self, gene: AssignmentGene, max_battery: float) -> Tuple[Optional[int], float]:
         if isinstance(gene, tuple):
             station_idx, battery_level = gene
         else:
-            station_idx, battery_level = gene, drone.max_battery_level
+            station_idx, battery_level = gene, max_battery
 
-        if station_idx is None or station_idx < 0 or station_idx >= len(self.stations):
-            return None, max(0.0, min(battery_level, drone.max_battery_level))
+        if station_idx is None or station_idx < 0 or station_idx >= self.num_stations:
+            return None, max(0.0, min(battery_level, max_battery))
 
         station_idx = int(station_idx)
-        battery_level = max(0.0, min(battery_level, drone.max_battery_level))
+        battery_level = max(0.0, min(battery_level, max_battery))
         return station_idx, battery_level
 
     def distance(self, a: Iterable[float], b: Iterable[float]) -> float:
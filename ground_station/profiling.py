@@ -0,0 +1,115 @@
+"""
+Profiling helpers for a single call (typically `solver.solve(problem)`).
+
+- `cprofile`: deterministic profile written as a pstats file.
+- `sampling`: a background thread samples the calling thread's stack every `interval` seconds and
+  writes collapsed stacks (`frame;frame;frame count` lines, as consumed by flamegraph tools).
+
+Both report the hottest functions defined inside the `ground_station` package; for sampling, a
+sample's self count goes to its innermost package frame (so library calls count towards the caller).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Tuple
+
+MODES = ("cprofile", "sampling")
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_THIS_FILE = os.path.abspath(__file__)
+
+
+@dataclass
+class ProfileReport:
+    mode: str
+    output_path: str
+    # (function label, self time in seconds or self sample count, cumulative time or samples)
+    hot_functions: List[Tuple[str, float, float]] = field(default_factory=list)
+
+    def format(self, limit: int = 10) -> str:
+        unit = "samples" if self.mode == "sampling" else "s"
+        lines = [f"Profile ({self.mode}) written to {self.output_path}"]
+        for label, own, cumulative in self.hot_functions[:limit]:
+            lines.append(f"  {own:>10.4g} {unit} self | {cumulative:>10.4g} {unit} total | {label}")
+        return "\n".join(lines)
+
+
+def profile_call(func: Callable[[], Any], mode: str, output_path: str, interval: float = 0.001) -> Tuple[Any, ProfileReport]:
+    """Run `func()` under the chosen profiler and return its result with the report."""
+    if mode == "cprofile":
+        return _run_cprofile(func, output_path)
+    if mode == "sampling":
+        return _run_sampling(func, output_path, interval)
+    raise ValueError(f"Unknown profile mode '{mode}'. Available: {', '.join(MODES)}")
+
+
+def _in_package(filename: str) -> bool:
+    path = os.path.abspath(filename)
+    return path.startswith(PACKAGE_DIR + os.sep) and path != _THIS_FILE
+
+
+def _label(filename: str, lineno: int, name: str) -> str:
+    return f"{os.path.relpath(filename, os.path.dirname(PACKAGE_DIR))}:{lineno}({name})"
+
+
+def _run_cprofile(func: Callable[[], Any], output_path: str) -> Tuple[Any, ProfileReport]:
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+    profiler.dump_stats(output_path)
+
+    stats = pstats.Stats(profiler).stats
+    hot = [
+        (_label(filename, lineno, name), own, cumulative)
+        for (filename, lineno, name), (_, _, own, cumulative, _) in stats.items()
+        if _in_package(filename)
+    ]
+    hot.sort(key=lambda entry: entry[1], reverse=True)
+    return result, ProfileReport(mode="cprofile", output_path=output_path, hot_functions=hot)
+
+
+def _run_sampling(func: Callable[[], Any], output_path: str, interval: float) -> Tuple[Any, ProfileReport]:
+    if interval <= 0:
+        raise ValueError("Sampling interval must be positive")
+
+    target = threading.get_ident()
+    stacks: Counter = Counter()
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                frame = frame.f_back
+            stacks[tuple(reversed(stack))] += 1
+
+    sampler = threading.Thread(target=sample, name="ground-station-sampler", daemon=True)
+    sampler.start()
+    try:
+        result = func()
+    finally:
+        done.set()
+        sampler.join()
+
+    own: Counter = Counter()
+    cumulative: Counter = Counter()
+    with open(output_path, "w", encoding="utf-8") as handle:
+        for stack, count in stacks.items():
+            labels = [_label(*frame) if _in_package(frame[0]) else f"{frame[2]}" for frame in stack]
+            handle.write(f"{';'.join(labels)} {count}\n")
+            package_frames = [label for frame, label in zip(stack, labels) if _in_package(frame[0])]
+            if package_frames:
+                own[package_frames[-1]] += count
+                for label in set(package_frames):
+                    cumulative[label] += count
+
+    hot = [(label, float(count), float(cumulative[label])) for label, count in own.most_common()]
+    return result, ProfileReport(mode="sampling", output_path=output_path, hot_functions=hot)
@@ -0,0 +1,193 @@
+"""
+Persistent cache of solver results in a local SQLite file.
+
+Entries are keyed by the problem fingerprint (`AssignmentProblem.fingerprint()`), the solver class
+and its configuration, and the random seed, so an identical re-solve returns the stored
+`AssignmentResult` instantly. Each entry also records the fingerprint and an optional tag (e.g.
+the scenario name): a stored fingerprint that no longer matches the problem marks the entry as
+stale. The file is kept under `max_bytes` by evicting the least recently used entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import time
+import zlib
+from array import array
+from typing import Any, Dict, Optional
+
+from .problem import AssignmentProblem, AssignmentResult
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    tag TEXT,
+    solver TEXT NOT NULL,
+    config TEXT NOT NULL,
+    seed INTEGER NOT NULL,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+CREATE INDEX IF NOT EXISTS results_tag ON results (tag);
+"""
+
+
+def solver_config(solver: object) -> Dict[str, Any]:
+    """Public scalar settings of a solver (its constructor arguments), including portfolio members."""
+    config: Dict[str, Any] = {}
+    for name, value in sorted(vars(solver).items()):
+        if name.startswith("_"):
+            continue
+        if value is None or isinstance(value, (bool, int, float, str)):
+            config[name] = value
+        elif isinstance(value, (list, tuple)) and all(hasattr(item, "solve") for item in value):
+            config[name] = [[type(item).__name__, solver_config(item)] for item in value]
+    return config
+
+
+def cache_key(fingerprint: str, solver: object, seed: int) -> str:
+    payload = json.dumps(
+        [fingerprint, type(solver).__name__, solver_config(solver), seed], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def encode_result(result: AssignmentResult) -> bytes:
+    payload = {
+        "assignments": result.assignments,
+        "fitness": result.fitness,
+        "elapsed_seconds": result.elapsed_seconds,
+        "history": result.history,
+        "lower_bound": result.lower_bound,
+        "trace": {name: [column.typecode, column.tolist()] for name, column in result.trace.items()},
+    }
+    return zlib.compress(json.dumps(payload, separators=(",", ":")).encode("utf-8"))
+
+
+def decode_result(blob: bytes, problem: Optional[AssignmentProblem] = None) -> AssignmentResult:
+    """Inverse of `encode_result`; `problem` lets `compute_lower_bound` fill a bound that was not stored."""
+    payload = json.loads(zlib.decompress(blob))
+    return AssignmentResult(
+        assignments=payload["assignments"],
+        fitness=payload["fitness"],
+        elapsed_seconds=payload["elapsed_seconds"],
+        history=payload["history"],
+        lower_bound=payload["lower_bound"],
+        trace={name: array(typecode, values) for name, (typecode, values) in payload["trace"].items()},
+        problem=problem,
+    )
+
+
+class ResultCache:
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        if max_bytes <= 0:
+            raise ValueError("Cache size limit must be positive")
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self._db = sqlite3.connect(path)
+        self._db.executescript(_SCHEMA)
+
+    def get(
+        self, problem: AssignmentProblem, solver: object, seed: int, fingerprint: Optional[str] = None
+    ) -> Optional[AssignmentResult]:
+        """Cached result for this problem, solver configuration and seed, or None."""
+        fingerprint = fingerprint or problem.fingerprint()
+        key = cache_key(fingerprint, solver, seed)
+        row = self._db.execute("SELECT fingerprint, payload FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        stored_fingerprint, blob = row
+        result = decode_result(blob, problem) if stored_fingerprint == fingerprint else None
+        if result is None or len(result.assignments) != problem.num_drones:
+            with self._db:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        with self._db:
+            self._db.execute("UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key))
+        self.hits += 1
+        return result
+
+    def put(
+        self,
+        problem: AssignmentProblem,
+        solver: object,
+        seed: int,
+        result: AssignmentResult,
+        tag: Optional[str] = None,
+        fingerprint: Optional[str] = None,
+    ) -> None:
+        fingerprint = fingerprint or problem.fingerprint()
+        blob = encode_result(result)
+        now = time.time()
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cache_key(fingerprint, solver, seed),
+                    fingerprint,
+                    tag,
+                    type(solver).__name__,
+                    json.dumps(solver_config(solver), sort_keys=True),
+                    seed,
+                    blob,
+                    len(blob),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+
+    def purge_stale(self, tag: str, problem: AssignmentProblem, fingerprint: Optional[str] = None) -> int:
+        """
+        Delete entries stored under `tag` whose fingerprint no longer matches `problem`. The tag must
+        identify one instance source (a file, or a generator with all its arguments); a tag shared
+        by different instances would make each of them evict the others.
+        """
+        fingerprint = fingerprint or problem.fingerprint()
+        with self._db:
+            removed = self._db.execute(
+                "DELETE FROM results WHERE tag = ? AND fingerprint != ?", (tag, fingerprint)
+            ).rowcount
+        self.stale += removed
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results").fetchone()
+        return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses, "stale": self.stale}
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()
+        if total <= self.max_bytes:
+            return
+        doomed = []
+        for key, size in self._db.execute("SELECT key, size FROM results ORDER BY last_used ASC"):
+            if total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            total -= size
+        self._db.executemany("DELETE FROM results WHERE key = ?", doomed)
@@ -0,0 +1,332 @@
+"""
+Compact binary scenario format, loadable through `mmap` without parsing.
+
+Layout (little-endian, every section 8-byte aligned):
+
+    header          struct HEADER (magic, version, flags, counts, names size, penalty)
+    drone_x         float64[num_drones]
+    drone_y         float64[num_drones]
+    drone_speed     float64[num_drones]
+    drone_battery   float64[num_drones]
+    drone_model     int32[num_drones]              index into the model names table
+    drone_charge    float64[num_drones]            only with FLAG_DRONE_CHARGE: remaining charge (Wh)
+    station_x       float64[num_stations]
+    station_y       float64[num_stations]
+    station_radius  float64[num_stations]          NaN = unlimited coverage
+    station_names   int32[num_stations + 1]        offsets into the names blob
+    model_names     int32[num_models + 1]          offsets into the names blob
+    names           utf-8 blob
+
+Arrays are exposed as `memoryview`s cast over the mapping, so loading costs a few syscalls and
+the pages are shared between every process that maps the same file. A problem built from a
+mapped file pickles as a reference to the file (`MappedSource`), so worker processes map it
+again rather than receiving a copy of the columns.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import shutil
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Sequence, Union
+
+from .fleet import Fleet, StationSet
+from .problem import AssignmentProblem
+
+MAGIC = b"GSSF"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIIId")
+FLAG_UNIQUE_STATION = 1
+FLAG_DRONE_CHARGE = 2
+
+
+class SpilledColumn:
+    """
+    A column already serialized as little-endian values in a binary file (e.g. a temporary spill
+    written chunk by chunk); `write_scenario` streams it into place instead of holding it in memory.
+    """
+
+    def __init__(self, handle: BinaryIO, typecode: str, length: int) -> None:
+        self.handle = handle
+        self.typecode = typecode
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def copy_to(self, target: BinaryIO) -> None:
+        self.handle.flush()
+        self.handle.seek(0)
+        shutil.copyfileobj(self.handle, target)
+
+
+ArrayLike = Union[array, memoryview, SpilledColumn]
+
+
+@dataclass(frozen=True)
+class MappedSource:
+    """Identity of a mapped scenario file: its path plus the size and mtime it had when mapped."""
+
+    path: str
+    size: int
+    mtime_ns: int
+
+    @classmethod
+    def of(cls, path: str, stat: Optional[os.stat_result] = None) -> "MappedSource":
+        stat = stat or os.stat(path)
+        return cls(os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+    def is_current(self) -> bool:
+        """Whether the file on disk is still the one that was mapped."""
+        try:
+            return MappedSource.of(self.path) == self
+        except OSError:
+            return False
+
+    def open(self) -> "ScenarioData":
+        if not self.is_current():
+            raise ValueError(f"Scenario file '{self.path}' changed or vanished since it was mapped")
+        return load_scenario(self.path)
+
+
+@dataclass
+class ScenarioData:
+    drone_x: ArrayLike
+    drone_y: ArrayLike
+    drone_speed: ArrayLike
+    drone_battery: ArrayLike
+    drone_model: ArrayLike
+    station_x: ArrayLike
+    station_y: ArrayLike
+    station_radius: ArrayLike
+    station_names: List[str]
+    model_names: List[str]
+    unassigned_penalty: float = 100.0
+    require_unique_station: bool = True
+    drone_charge: Optional[ArrayLike] = None  # remaining charge per drone; `drone_battery` is the capacity
+    source: Optional[MappedSource] = None
+    _mapping: Optional[mmap.mmap] = None
+
+    @property
+    def num_drones(self) -> int:
+        return len(self.drone_x)
+
+    @property
+    def num_stations(self) -> int:
+        return len(self.station_x)
+
+    def to_problem(self) -> AssignmentProblem:
+        """Build a problem whose columns are the mapped views themselves (no per-drone objects)."""
+        fleet = Fleet(
+            model_names=list(self.model_names),
+            model=self.drone_model,
+            max_speed=self.drone_speed,
+            max_battery=self.drone_battery,
+            x=self.drone_x,
+            y=self.drone_y,
+            battery_level=self.drone_charge,
+            source=self.source,
+        )
+        station_set = StationSet(
+            names=list(self.station_names),
+            x=self.station_x,
+            y=self.station_y,
+            coverage_radius=self.station_radius,
+            source=self.source,
+        )
+        return AssignmentProblem(
+            drones=fleet,
+            stations=station_set,
+            unassigned_penalty=self.unassigned_penalty,
+            require_unique_station=self.require_unique_station,
+        )
+
+    def close(self) -> None:
+        """Release the array views and unmap the file (no-op for in-memory data)."""
+        if self._mapping is None:
+            return
+        for name in ("drone_x", "drone_y", "drone_speed", "drone_battery", "drone_model", "drone_charge",
+                     "station_x", "station_y", "station_radius"):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        self._mapping.close()
+        self._mapping = None
+
+
+def save_problem(path: str, problem: AssignmentProblem) -> None:
+    fleet, station_set = problem.fleet, problem.station_set
+    write_scenario(
+        path,
+        ScenarioData(
+            drone_x=fleet.x,
+            drone_y=fleet.y,
+            drone_speed=fleet.max_speed,
+            drone_battery=fleet.max_battery,
+            drone_model=fleet.model,
+            station_x=station_set.x,
+            station_y=station_set.y,
+            station_radius=station_set.coverage_radius,
+            station_names=station_set.names,
+            model_names=fleet.model_names,
+            unassigned_penalty=problem.unassigned_penalty,
+            require_unique_station=problem.require_unique_station,
+            drone_charge=fleet.battery_level,
+        ),
+    )
+
+
+def write_scenario(path: str, data: ScenarioData) -> None:
+    num_drones, num_stations, num_models = data.num_drones, data.num_stations, len(data.model_names)
+    for name in ("drone_y", "drone_speed", "drone_battery", "drone_model"):
+        if len(getattr(data, name)) != num_drones:
+            raise ValueError(f"Column '{name}' must have one entry per drone")
+    if data.drone_charge is not None and len(data.drone_charge) != num_drones:
+        raise ValueError("Column 'drone_charge' must have one entry per drone")
+    for name in ("station_y", "station_radius"):
+        if len(getattr(data, name)) != num_stations:
+            raise ValueError(f"Column '{name}' must have one entry per station")
+    if len(data.station_names) != num_stations:
+        raise ValueError("One name per station is required")
+
+    blob = bytearray()
+    station_offsets = _append_names(blob, data.station_names)
+    model_offsets = _append_names(blob, data.model_names)
+    flags = FLAG_UNIQUE_STATION if data.require_unique_station else 0
+    if data.drone_charge is not None:
+        flags |= FLAG_DRONE_CHARGE
+
+    with open(path, "wb") as handle:
+        handle.write(
+            HEADER.pack(MAGIC, VERSION, flags, num_drones, num_stations, num_models, len(blob), data.unassigned_penalty)
+        )
+        for column, typecode in (
+            (data.drone_x, "d"),
+            (data.drone_y, "d"),
+            (data.drone_speed, "d"),
+            (data.drone_battery, "d"),
+            (data.drone_model, "i"),
+            (data.drone_charge, "d"),
+            (data.station_x, "d"),
+            (data.station_y, "d"),
+            (data.station_radius, "d"),
+            (station_offsets, "i"),
+            (model_offsets, "i"),
+        ):
+            if column is not None:
+                _write_column(handle, column, typecode)
+        handle.write(blob)
+
+
+def load_scenario(path: str) -> ScenarioData:
+    """Map `path` read-only and expose its columns as zero-copy views."""
+    with open(path, "rb") as handle:
+        source = MappedSource.of(path, os.fstat(handle.fileno()))
+        if source.size < HEADER.size:
+            raise ValueError(f"'{path}' is too small to be a scenario file")
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    magic, version, flags, num_drones, num_stations, num_models, names_size, penalty = HEADER.unpack_from(mapping)
+    if magic != MAGIC:
+        mapping.close()
+        raise ValueError(f"'{path}' is not a scenario file")
+    if version != VERSION:
+        mapping.close()
+        raise ValueError(f"Unsupported scenario file version {version}")
+
+    has_charge = bool(flags & FLAG_DRONE_CHARGE)
+    layout = []
+    offset = HEADER.size
+    for count, typecode in (
+        (num_drones, "d"),
+        (num_drones, "d"),
+        (num_drones, "d"),
+        (num_drones, "d"),
+        (num_drones, "i"),
+        (num_drones if has_charge else 0, "d"),
+        (num_stations, "d"),
+        (num_stations, "d"),
+        (num_stations, "d"),
+        (num_stations + 1, "i"),
+        (num_models + 1, "i"),
+    ):
+        offset = _align(offset)
+        size = count * struct.calcsize(typecode)
+        layout.append((offset, size, typecode))
+        offset += size
+    if source.size < offset + names_size:
+        mapping.close()
+        raise ValueError(
+            f"'{path}' is truncated: its header needs {offset + names_size} bytes, the file has {source.size}"
+        )
+
+    buffer = memoryview(mapping)
+    columns = [_view(buffer[start:start + size], typecode) for start, size, typecode in layout]
+    names = bytes(buffer[offset:offset + names_size])
+    try:
+        station_names = _read_names(names, columns[9])
+        model_names = _read_names(names, columns[10])
+    except ValueError as exc:
+        for view in columns + [buffer]:
+            if isinstance(view, memoryview):
+                view.release()
+        mapping.close()
+        raise ValueError(f"'{path}' has a corrupt names table: {exc}") from None
+    charge = columns.pop(5)
+    for view in (columns[8], columns[9], buffer) + (() if has_charge else (charge,)):
+        if isinstance(view, memoryview):
+            view.release()
+    return ScenarioData(
+        *columns[:8],
+        station_names=station_names,
+        model_names=model_names,
+        unassigned_penalty=penalty,
+        require_unique_station=bool(flags & FLAG_UNIQUE_STATION),
+        drone_charge=charge if has_charge else None,
+        source=source,
+        _mapping=mapping,
+    )
+
+
+def _align(offset: int) -> int:
+    return (offset + 7) & ~7
+
+
+def _write_column(handle, column: Sequence, typecode: str) -> None:
+    handle.write(b"\0" * (_align(handle.tell()) - handle.tell()))
+    if isinstance(column, SpilledColumn):
+        if column.typecode != typecode:
+            raise ValueError(f"Spilled column has type '{column.typecode}', expected '{typecode}'")
+        column.copy_to(handle)
+        return
+    values = column if isinstance(column, array) and column.typecode == typecode else array(typecode, column)
+    if sys.byteorder != "little":
+        values = array(typecode, values)
+        values.byteswap()
+    handle.write(values.tobytes())
+
+
+def _view(raw: memoryview, typecode: str) -> ArrayLike:
+    if sys.byteorder == "little":
+        return raw.cast(typecode)
+    values = array(typecode, raw.tobytes())
+    values.byteswap()
+    return values
+
+
+def _append_names(blob: bytearray, names: Sequence[str]) -> array:
+    offsets = array("i", [len(blob)])
+    for name in names:
+        blob.extend(name.encode("utf-8"))
+        offsets.append(len(blob))
+    return offsets
+
+
+def _read_names(blob: bytes, offsets: ArrayLike) -> List[str]:
+    if offsets[0] < 0 or any(end < start for start, end in zip(offsets[:-1], offsets[1:])) or offsets[-1] > len(blob):
+        raise ValueError("name offsets are out of order or past the names blob")
+    return [blob[start:end].decode("utf-8") for start, end in zip(offsets[:-1], offsets[1:])]
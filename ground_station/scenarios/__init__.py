@@ -1,14 +1,41 @@
 """
 Pre-defined scenarios used for benchmarking algorithms.
 Each scenario returns an `AssignmentProblem` populated with drones and stations.
+
+Scenario modules are imported on first attribute access (PEP 562).
 """
 
-from .static_drones_static_stations import static_scenario
-from .moving_drones_static_stations import moving_drones_static_stations
-from .moving_all import moving_drones_and_stations
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .generated import LAYOUTS, generate_positions, generated_scenario
+    from .moving_all import moving_drones_and_stations
+    from .moving_drones_static_stations import moving_drones_static_stations
+    from .static_drones_static_stations import static_scenario
+
+_EXPORTS = {
+    "LAYOUTS": ".generated",
+    "generate_positions": ".generated",
+    "generated_scenario": ".generated",
+    "static_scenario": ".static_drones_static_stations",
+    "moving_drones_static_stations": ".moving_drones_static_stations",
+    "moving_drones_and_stations": ".moving_all",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = [
-    "static_scenario",
-    "moving_drones_static_stations",
-    "moving_drones_and_stations",
-]
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+from array import array
+from typing import Optional, Tuple
+
+from ..data import build_fleet, build_stations, station_name
+from ..problem import AssignmentProblem
+
+LAYOUTS = ("uniform", "clustered", "road-grid")
+
+AREA_SIZE = 10_000
+
+MAX_DRONES = 1_000_000
+MAX_STATIONS = 100_000
+
+
+def generate_positions(
+    count: int,
+    layout: str,
+    area_size: float,
+    rng: random.Random,
+    num_hotspots: int = 8,
+    hotspot_spread: float = 0.05,
+    road_spacing: Optional[float] = None,
+) -> Tuple[array, array]:
+    """
+    Generate `count` points inside [0, area_size]^2 as two `array('d')` columns.
+
+    - `uniform`: independent uniform coordinates.
+    - `clustered`: Gaussian hot-spots with std-dev `hotspot_spread * area_size` around uniformly
+      placed centres.
+    - `road-grid`: points on a Manhattan grid of roads every `road_spacing` units (default: ten
+      roads per axis), with a small lateral jitter.
+    """
+    if count < 0:
+        raise ValueError("Count must be non-negative")
+    if area_size <= 0:
+        raise ValueError("Area size must be positive")
+
+    uniform = rng.random
+    if layout == "uniform":
+        xs = array("d", [uniform() * area_size for _ in range(count)])
+        ys = array("d", [uniform() * area_size for _ in range(count)])
+        return xs, ys
+
+    if layout == "clustered":
+        if num_hotspots <= 0:
+            raise ValueError("Number of hot-spots must be positive")
+        sigma = hotspot_spread * area_size
+        centres = [(uniform() * area_size, uniform() * area_size) for _ in range(num_hotspots)]
+        picks = [centres[int(uniform() * num_hotspots)] for _ in range(count)]
+        gauss = rng.gauss
+        xs = array("d", [_clamp(cx + gauss(0.0, sigma), area_size) for cx, _ in picks])
+        ys = array("d", [_clamp(cy + gauss(0.0, sigma), area_size) for _, cy in picks])
+        return xs, ys
+
+    if layout == "road-grid":
+        spacing = road_spacing if road_spacing is not None else area_size / 10
+        if spacing <= 0:
+            raise ValueError("Road spacing must be positive")
+        num_roads = int(area_size // spacing) + 1
+        jitter = spacing * 0.02
+        along = [uniform() * area_size for _ in range(count)]
+        across = [
+            _clamp(int(uniform() * num_roads) * spacing + (uniform() - 0.5) * jitter, area_size) for _ in range(count)
+        ]
+        horizontal = [uniform() < 0.5 for _ in range(count)]
+        xs = array("d", [a if h else c for a, c, h in zip(along, across, horizontal)])
+        ys = array("d", [c if h else a for a, c, h in zip(along, across, horizontal)])
+        return xs, ys
+
+    raise ValueError(f"Unknown layout '{layout}'. Available: {', '.join(LAYOUTS)}")
+
+
+def generated_scenario(
+    num_drones: int = 1000,
+    num_stations: int = 100,
+    layout: str = "uniform",
+    area_size: float = AREA_SIZE,
+    seed: int = 2024,
+    coverage_radius: Optional[float] = None,
+    num_hotspots: int = 8,
+    hotspot_spread: float = 0.05,
+    road_spacing: Optional[float] = None,
+) -> AssignmentProblem:
+    """Large synthetic instance (up to 10^6 drones / 10^5 stations) with the chosen layout."""
+    if not 0 < num_drones <= MAX_DRONES:
+        raise ValueError(f"Number of drones must be between 1 and {MAX_DRONES}")
+    if not 0 < num_stations <= MAX_STATIONS:
+        raise ValueError(f"Number of stations must be between 1 and {MAX_STATIONS}")
+
+    rng = random.Random(seed)
+    layout_options = dict(num_hotspots=num_hotspots, hotspot_spread=hotspot_spread, road_spacing=road_spacing)
+    station_x, station_y = generate_positions(num_stations, layout, area_size, rng, **layout_options)
+    drone_x, drone_y = generate_positions(num_drones, layout, area_size, rng, **layout_options)
+
+    stations = build_stations(
+        ((station_name(idx), (x, y)) for idx, (x, y) in enumerate(zip(station_x, station_y))),
+        coverage_radius=coverage_radius,
+    )
+    return AssignmentProblem(drones=build_fleet(drone_x, drone_y), stations=stations)
+
+
+def _clamp(value: float, upper: float) -> float:
+    return 0.0 if value < 0.0 else upper if value > upper else value
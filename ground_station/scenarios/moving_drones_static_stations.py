@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import random
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..data import build_drones, build_stations
 from ..problem import AssignmentProblem
 
 
 def moving_drones_static_stations(
-    num_drones: int = 6, area_size: int = 800, seed: int = 42
+    num_drones: int = 6, area_size: int = 800, seed: int = 42, coverage_radius: Optional[float] = None
 ) -> AssignmentProblem:
     random.seed(seed)
     station_positions: Tuple[Tuple[str, Tuple[float, float]], ...] = (
@@ -19,6 +19,6 @@ def moving_drones_static_stations(
         ("Istasyon E", (350, 350)),
     )
     drones_positions = tuple((random.randint(0, area_size), random.randint(0, area_size)) for _ in range(num_drones))
-    stations = build_stations(station_positions)
+    stations = build_stations(station_positions, coverage_radius=coverage_radius)
     drones = build_drones(drones_positions)
     return AssignmentProblem(drones=drones, stations=stations)
@@ -0,0 +1,234 @@
+"""
+Algorithm selection from instance features.
+
+`instance_features` summarises a problem in a few scale-free numbers (sizes, station ratio, spatial
+dispersion, sampled pair-cost statistics). `SelectorModel` is a k-nearest-neighbour model over
+those features, trained from `benchmarks.scaling` reports: it finds the training instances most
+similar to a problem, averages the log time-to-target of every solver configuration run on them,
+and `select` returns the configuration predicted to converge fastest. Runs that missed the target are
+penalised. The model is plain JSON:
+
+    python -m benchmarks.scaling --output scaling.json
+    python -m ground_station.selection scaling.json --output selector.json
+    python run.py --scenario generated --algo auto --selector selector.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .algorithms.registry import solver_spec
+from .problem import AssignmentProblem
+
+FEATURES = (
+    "log_drones",
+    "log_stations",
+    "station_ratio",
+    "drone_dispersion",
+    "station_dispersion",
+    "nearest_cost",
+    "pair_cost_mean",
+    "pair_cost_cv",
+    "coverage",
+    "unique",
+)
+SAMPLE_SIZE = 512
+# Added to the log time of runs that stopped without reaching the target gap.
+MISS_PENALTY = math.log(4.0)
+MODEL_VERSION = 1
+EXAMPLE_FIELDS = frozenset({"x", "algorithm", "population", "score"})
+
+
+def instance_features(problem: AssignmentProblem, sample_size: int = SAMPLE_SIZE) -> Dict[str, float]:
+    """Scale-free features of `problem`; pair costs are sampled with a fixed seed."""
+    n, m = problem.num_drones, problem.num_stations
+    fleet, stations = problem.fleet, problem.station_set
+    min_x = min(min(fleet.x), min(stations.x))
+    max_x = max(max(fleet.x), max(stations.x))
+    min_y = min(min(fleet.y), min(stations.y))
+    max_y = max(max(fleet.y), max(stations.y))
+    diagonal = max(math.hypot(max_x - min_x, max_y - min_y), 1e-9)
+    penalty = problem.unassigned_penalty or 1.0
+
+    rng = random.Random(0)
+    drones = rng.sample(range(n), min(n, sample_size))
+    nearest = [problem.best_cost(idx) for idx in drones]
+    pairs = [problem.pair_cost(rng.randrange(n), rng.randrange(m)) for _ in range(sample_size)]
+    pair_mean = math.fsum(pairs) / len(pairs)
+    pair_std = math.sqrt(math.fsum((cost - pair_mean) ** 2 for cost in pairs) / len(pairs))
+
+    return {
+        "log_drones": math.log10(n),
+        "log_stations": math.log10(m),
+        "station_ratio": m / n,
+        "drone_dispersion": _dispersion(fleet.x, fleet.y) / diagonal,
+        "station_dispersion": _dispersion(stations.x, stations.y) / diagonal,
+        "nearest_cost": math.fsum(nearest) / len(nearest) / penalty,
+        "pair_cost_mean": pair_mean / penalty,
+        "pair_cost_cv": pair_std / pair_mean if pair_mean > 0 else 0.0,
+        "coverage": sum(1 for cost in pairs if cost < penalty) / len(pairs),
+        "unique": 1.0 if problem.require_unique_station else 0.0,
+    }
+
+
+def _dispersion(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Root-mean-square distance to the centroid."""
+    count = len(xs)
+    cx, cy = math.fsum(xs) / count, math.fsum(ys) / count
+    return math.sqrt(math.fsum((x - cx) ** 2 + (y - cy) ** 2 for x, y in zip(xs, ys)) / count)
+
+
+@dataclass
+class Selection:
+    algorithm: str
+    params: Dict[str, Any]
+    predicted_seconds: float
+
+
+class SelectorModel:
+    def __init__(
+        self,
+        mean: Sequence[float],
+        scale: Sequence[float],
+        examples: List[Dict[str, Any]],
+        k: int = 5,
+    ) -> None:
+        if not examples:
+            raise ValueError("A selector model needs at least one training example")
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.mean = list(mean)
+        self.scale = list(scale)
+        self.examples = examples
+        self.k = k
+
+    @classmethod
+    def train(cls, runs: Iterable[Dict[str, Any]], k: int = 5) -> "SelectorModel":
+        """
+        Fit from scaling-benchmark runs. Each run needs `features`, `algorithm`, `population`,
+        `seconds` and `reached`.
+        """
+        rows = []
+        for run in runs:
+            if "features" not in run:
+                raise ValueError("Scaling runs carry no instance features; re-run benchmarks.scaling")
+            if not solver_spec(run["algorithm"]).population:
+                raise ValueError(f"Algorithm '{run['algorithm']}' has no population size to select")
+            vector = [float(run["features"][name]) for name in FEATURES]
+            score = math.log(max(run["seconds"], 1e-6)) + (0.0 if run["reached"] else MISS_PENALTY)
+            rows.append((vector, run["algorithm"], int(run["population"]), score))
+        if not rows:
+            raise ValueError("No training runs")
+
+        mean = [math.fsum(row[0][i] for row in rows) / len(rows) for i in range(len(FEATURES))]
+        scale = []
+        for i, centre in enumerate(mean):
+            spread = math.sqrt(math.fsum((row[0][i] - centre) ** 2 for row in rows) / len(rows))
+            scale.append(spread if spread > 1e-12 else 1.0)
+        examples = [
+            {
+                "x": [(value - mean[i]) / scale[i] for i, value in enumerate(vector)],
+                "algorithm": algorithm,
+                "population": population,
+                "score": score,
+            }
+            for vector, algorithm, population, score in rows
+        ]
+        return cls(mean, scale, examples, k=k)
+
+    def predict(self, features: Dict[str, float]) -> List[Selection]:
+        """
+        Configurations run on the `k` training instances most similar to `features`, with their
+        distance-weighted mean time-to-target, fastest first.
+        """
+        x = [(features[name] - self.mean[i]) / self.scale[i] for i, name in enumerate(FEATURES)]
+        instances: Dict[Tuple[float, ...], List[Dict[str, Any]]] = {}
+        for example in self.examples:
+            instances.setdefault(tuple(example["x"]), []).append(example)
+        nearest = sorted(instances, key=lambda point: math.dist(x, point))[: self.k]
+
+        totals: Dict[Tuple[str, int], List[float]] = {}
+        for point in nearest:
+            weight = 1.0 / (math.dist(x, point) + 1e-6)
+            for example in instances[point]:
+                total = totals.setdefault((example["algorithm"], example["population"]), [0.0, 0.0])
+                total[0] += weight * example["score"]
+                total[1] += weight
+
+        selections = []
+        for (algorithm, population), (score, weight) in totals.items():
+            params = {name: population for name in solver_spec(algorithm).population}
+            selections.append(Selection(algorithm, params, math.exp(score / weight)))
+        selections.sort(key=lambda selection: selection.predicted_seconds)
+        return selections
+
+    def select(self, problem: AssignmentProblem) -> Selection:
+        return self.predict(instance_features(problem))[0]
+
+    def save(self, path: str) -> None:
+        payload = {
+            "version": MODEL_VERSION,
+            "features": list(FEATURES),
+            "k": self.k,
+            "mean": self.mean,
+            "scale": self.scale,
+            "examples": self.examples,
+        }
+        with open(path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: str) -> "SelectorModel":
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if not isinstance(payload, dict):
+            raise ValueError(f"{path} is not a selector model")
+        if payload.get("version") != MODEL_VERSION or payload.get("features") != list(FEATURES):
+            raise ValueError(f"{path} was trained for a different feature set; retrain the selector")
+        try:
+            model = cls(payload["mean"], payload["scale"], payload["examples"], k=payload["k"])
+        except KeyError as exc:
+            raise ValueError(f"{path} is missing field {exc}") from None
+        except TypeError as exc:
+            raise ValueError(f"{path} is not a selector model: {exc}") from None
+        width = len(FEATURES)
+        examples_ok = isinstance(model.examples, list) and all(
+            isinstance(example, dict)
+            and EXAMPLE_FIELDS <= example.keys()
+            and isinstance(example["x"], list)
+            and len(example["x"]) == width
+            for example in model.examples
+        )
+        if len(model.mean) != width or len(model.scale) != width or not examples_ok:
+            raise ValueError(f"{path} is not a selector model: malformed statistics or examples")
+        return model
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Train the algorithm selector from scaling reports")
+    parser.add_argument("reports", nargs="+", help="benchmarks.scaling JSON reports")
+    parser.add_argument("--output", default="selector.json", help="Model path")
+    parser.add_argument("-k", type=int, default=5, help="Neighbouring training instances to consult")
+    args = parser.parse_args(argv)
+
+    runs: List[Dict[str, Any]] = []
+    for path in args.reports:
+        with open(path, "r", encoding="utf-8") as handle:
+            runs.extend(json.load(handle)["runs"])
+    try:
+        model = SelectorModel.train(runs, k=args.k)
+    except ValueError as exc:
+        parser.error(str(exc))
+    model.save(args.output)
+    print(f"Trained on {len(runs)} runs; model written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
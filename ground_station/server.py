@@ -0,0 +1,607 @@
+"""
+Long-lived assignment service: a small asyncio HTTP/1.1 JSON endpoint that keeps registered
+problems warm and runs solves on a process pool without blocking the event loop.
+
+Endpoints (JSON bodies, keep-alive connections):
+
+- `GET /health`, `GET /stats`
+- `POST /problems` with a problem spec -> `{"problem_id", "num_drones", "num_stations", "lower_bound"}`
+- `DELETE /problems/{problem_id}`
+- `POST /solve` with `{"problem_id" | "problem", "algorithm", "params", "seed", "job_id"}`
+- `DELETE /jobs/{job_id}` cancels a queued or running solve (the solve answers 409)
+
+A problem spec is either `{"scenario": name, "options": {...}, "seed": int}`,
+`{"scenario_file": path}` or inline `{"drones": [...], "stations": [...]}`; any of them may add
+`unassigned_penalty`, `require_unique_station` and `energy_weight`. Scenario files are only
+served from the `--scenario-dir` given at start-up (paths are relative to it). Problem ids are
+content fingerprints, so identical problems are stored once. Building, fingerprinting and bounding
+a new problem (and decoding large request bodies) run on a helper thread, off the event loop. Workers rebuild a spec once and keep the
+problem (with its cached travel times and bounds) for later solves. Identical concurrent solve
+requests are coalesced into a single pool job.
+
+    python -m ground_station.server --port 8080 --workers 4 --scenario-dir scenarios/
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .algorithms.registry import build_solver
+from .data import CATALOG, MODEL_INDEX
+from .models import Drone, Station
+from .problem import AssignmentProblem, AssignmentResult
+
+MAX_BODY_BYTES = 64 * 1024 * 1024
+# Request bodies above this size are decoded on the helper thread.
+INLINE_DECODE_BYTES = 64 * 1024
+MAX_JOBS = 1024
+MAX_PROBLEMS = 256
+WORKER_CACHE_SIZE = 32
+
+# Set in every pool worker by `_init_worker`: one cancellation flag per job slot, and the
+# problems the worker has already built.
+_CANCEL_FLAGS = None
+_WORKER_PROBLEMS: "OrderedDict[str, AssignmentProblem]" = OrderedDict()
+
+
+class HttpError(Exception):
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+def problem_from_spec(spec: Dict[str, Any]) -> AssignmentProblem:
+    """Build an `AssignmentProblem` from a JSON problem spec (see module docstring)."""
+    if not isinstance(spec, dict):
+        raise ValueError("Problem spec must be a JSON object")
+
+    if "scenario" in spec:
+        from .scenarios import (
+            generated_scenario,
+            moving_drones_and_stations,
+            moving_drones_static_stations,
+            static_scenario,
+        )
+
+        factories = {
+            "static": static_scenario,
+            "moving-drones": moving_drones_static_stations,
+            "moving-all": moving_drones_and_stations,
+            "generated": generated_scenario,
+        }
+        factory = factories.get(spec["scenario"])
+        if factory is None:
+            raise ValueError(f"Unknown scenario '{spec['scenario']}'. Available: {', '.join(factories)}")
+        # Random scenarios must come out identical in the server and in every worker.
+        state = random.getstate()
+        random.seed(spec.get("seed", 0))
+        try:
+            problem = factory(**spec.get("options", {}))
+        finally:
+            random.setstate(state)
+    elif "scenario_file" in spec:
+        problem = AssignmentProblem.from_scenario_file(spec["scenario_file"])
+    elif "drones" in spec and "stations" in spec:
+        problem = AssignmentProblem(
+            drones=[_drone_from_spec(item) for item in spec["drones"]],
+            stations=[
+                Station(
+                    name=str(item.get("name", f"station-{idx}")),
+                    x=float(item["x"]),
+                    y=float(item["y"]),
+                    coverage_radius=item.get("coverage_radius"),
+                )
+                for idx, item in enumerate(spec["stations"])
+            ],
+        )
+    else:
+        raise ValueError("Problem spec needs 'scenario', 'scenario_file' or 'drones' and 'stations'")
+
+    if "unassigned_penalty" in spec:
+        if spec["unassigned_penalty"] < 0:
+            raise ValueError("Unassigned penalty must be non-negative")
+        problem.unassigned_penalty = float(spec["unassigned_penalty"])
+    if "require_unique_station" in spec:
+        problem.require_unique_station = bool(spec["require_unique_station"])
+    if "energy_weight" in spec:
+        problem.energy_weight = float(spec["energy_weight"])
+    return problem
+
+
+def resolve_scenario_file(scenario_dir: str, path: str) -> str:
+    """Absolute path of `path` (relative to `scenario_dir`), refusing anything outside the directory."""
+    root = os.path.realpath(scenario_dir)
+    full = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, full]) != root:
+        raise HttpError(403, f"Scenario file '{path}' is outside the scenario directory")
+    return full
+
+
+def _prepare_problem(spec: Dict[str, Any]) -> Tuple[str, AssignmentProblem]:
+    """Helper-thread entry point: build the spec and fingerprint it."""
+    problem = problem_from_spec(spec)
+    return problem.fingerprint(), problem
+
+
+def _drone_from_spec(item: Dict[str, Any]) -> Drone:
+    model = str(item["model"])
+    model_idx = MODEL_INDEX.get(model)
+    if model_idx is None and ("max_speed" not in item or "max_battery_level" not in item):
+        raise ValueError(f"Drone model '{model}' is not in the catalogue; give max_speed and max_battery_level")
+    return Drone(
+        model=model,
+        max_speed=float(item["max_speed"] if "max_speed" in item else CATALOG.max_speed[model_idx]),
+        max_battery_level=float(
+            item["max_battery_level"] if "max_battery_level" in item else CATALOG.battery_wh[model_idx]
+        ),
+        x=float(item["x"]),
+        y=float(item["y"]),
+    )
+
+
+def result_to_dict(result: AssignmentResult) -> Dict[str, Any]:
+    return {
+        "assignments": result.assignments,
+        "fitness": result.fitness,
+        "elapsed_seconds": result.elapsed_seconds,
+        "lower_bound": result.compute_lower_bound(),
+        "gap": result.gap,
+        "iterations": len(result.history.get("best_fitness", ())),
+    }
+
+
+def _init_worker(cancel_flags) -> None:
+    global _CANCEL_FLAGS
+    _CANCEL_FLAGS = cancel_flags
+
+
+def _worker_problem(problem_id: str, spec: Dict[str, Any]) -> AssignmentProblem:
+    problem = _WORKER_PROBLEMS.get(problem_id)
+    if problem is None:
+        problem = problem_from_spec(spec)
+        _WORKER_PROBLEMS[problem_id] = problem
+        if len(_WORKER_PROBLEMS) > WORKER_CACHE_SIZE:
+            _WORKER_PROBLEMS.popitem(last=False)
+    else:
+        _WORKER_PROBLEMS.move_to_end(problem_id)
+    return problem
+
+
+def _solve_job(
+    problem_id: str, spec: Dict[str, Any], algorithm: str, params: Dict[str, Any], seed: Optional[int], slot: int
+) -> Dict[str, Any]:
+    """Pool entry point: solve on the worker's warm copy of the problem."""
+    problem = _worker_problem(problem_id, spec)
+    if seed is not None:
+        random.seed(seed)
+    solver = build_solver(algorithm, params)
+    flags = _CANCEL_FLAGS
+    solver.interrupt = lambda: flags[slot] != 0
+    return result_to_dict(solver.solve(problem))
+
+
+@dataclass
+class _SharedSolve:
+    """One pool job answering every request with the same problem, solver config and seed."""
+
+    key: Tuple[Any, ...]
+    slot: int
+    task: Optional[asyncio.Task] = None
+    future: Optional[Future] = None
+    waiters: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class _Job:
+    job_id: str
+    shared: _SharedSolve
+    cancelled: "asyncio.Future[None]"  # resolved by DELETE /jobs/<id>; only this request gives up
+
+
+class AssignmentServer:
+    """
+    Request handling runs on the event loop; every solve is submitted to `executor` (a process
+    pool by default) and awaited, so one slow solve never blocks other requests.
+
+    Problems are deduplicated by `AssignmentProblem.fingerprint()`, which also serves as the
+    problem id. Solve requests with the same problem, algorithm, params and seed share one pool job
+    while it runs and for `coalesce_window` seconds after it finishes. Cancelling a job only
+    detaches its request; the shared solve stops once no request is waiting for it.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        use_processes: bool = True,
+        max_jobs: int = MAX_JOBS,
+        coalesce_window: float = 0.05,
+        max_problems: int = MAX_PROBLEMS,
+        scenario_dir: Optional[str] = None,
+    ) -> None:
+        if max_jobs <= 0 or max_problems <= 0:
+            raise ValueError("Max jobs and max problems must be positive")
+        if coalesce_window < 0:
+            raise ValueError("Coalesce window must be non-negative")
+        workers = workers or os.cpu_count() or 1
+        if use_processes:
+            import multiprocessing
+
+            self._cancel_flags = multiprocessing.Array("b", max_jobs, lock=False)
+            pool_cls = ProcessPoolExecutor
+        else:
+            self._cancel_flags = bytearray(max_jobs)
+            pool_cls = ThreadPoolExecutor
+        self.executor: Executor = pool_cls(
+            max_workers=workers, initializer=_init_worker, initargs=(self._cancel_flags,)
+        )
+        # Problem construction, fingerprints and bounds are CPU-bound; keep them off the event loop.
+        self._builder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="problem-builder")
+        self.coalesce_window = coalesce_window
+        self.max_problems = max_problems
+        self.scenario_dir = scenario_dir
+        self.problems: "OrderedDict[str, Tuple[Dict[str, Any], AssignmentProblem]]" = OrderedDict()
+        self.jobs: Dict[str, _Job] = {}
+        self._shared: Dict[Tuple[Any, ...], _SharedSolve] = {}
+        self._free_slots: List[int] = list(range(max_jobs - 1, -1, -1))
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.Task] = set()
+        self.stats = {"requests": 0, "solves": 0, "coalesced": 0, "cancelled": 0}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> Tuple[str, int]:
+        """Start listening and return the bound (host, port)."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        for shared in list(self._shared.values()):
+            self._abort(shared)
+        for task in self._connections:
+            task.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self._builder.shutdown(wait=True, cancel_futures=True)
+
+    async def register_problem(self, spec: Dict[str, Any]) -> Tuple[str, AssignmentProblem]:
+        """Build the spec and return its fingerprint id, reusing an identical registered problem."""
+        if isinstance(spec, dict) and "scenario_file" in spec:
+            if self.scenario_dir is None:
+                raise HttpError(403, "Scenario files are disabled; start the server with --scenario-dir")
+            spec = dict(spec, scenario_file=resolve_scenario_file(self.scenario_dir, str(spec["scenario_file"])))
+
+        loop = asyncio.get_running_loop()
+        problem_id, problem = await loop.run_in_executor(self._builder, _prepare_problem, spec)
+        entry = self.problems.get(problem_id)
+        if entry is None:
+            await loop.run_in_executor(self._builder, problem.lower_bound)
+            entry = self.problems.get(problem_id)  # an identical problem may have registered meanwhile
+        if entry is not None:
+            self.problems.move_to_end(problem_id)
+            return problem_id, entry[1]
+
+        self.problems[problem_id] = (spec, problem)
+        if len(self.problems) > self.max_problems:
+            self.problems.popitem(last=False)
+        return problem_id, problem
+
+    async def solve(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        if "problem_id" in request:
+            entry = self.problems.get(request["problem_id"])
+            if entry is None:
+                raise HttpError(404, f"Unknown problem '{request['problem_id']}'")
+            problem_id, spec = request["problem_id"], entry[0]
+        elif "problem" in request:
+            problem_id, _ = await self.register_problem(request["problem"])
+            spec = self.problems[problem_id][0]
+        else:
+            raise HttpError(400, "Solve request needs 'problem_id' or 'problem'")
+
+        algorithm = request.get("algorithm", "pso")
+        params = request.get("params") or {}
+        seed = request.get("seed")
+        build_solver(algorithm, params)  # reject bad configs before they reach the pool
+        job_id = str(request.get("job_id") or uuid.uuid4().hex)
+        if job_id in self.jobs:
+            raise HttpError(409, f"Job '{job_id}' is already running")
+
+        key = (problem_id, algorithm, json.dumps(params, sort_keys=True), seed)
+        shared = self._shared.get(key)
+        if shared is None:
+            if not self._free_slots:
+                raise HttpError(503, "Too many concurrent jobs")
+            shared = _SharedSolve(key=key, slot=self._free_slots.pop())
+            self._cancel_flags[shared.slot] = 0
+            self._shared[key] = shared
+            shared.task = asyncio.create_task(self._run_shared(shared, spec, algorithm, params, seed))
+            self.stats["solves"] += 1
+        else:
+            self.stats["coalesced"] += 1
+
+        job = _Job(job_id=job_id, shared=shared, cancelled=asyncio.get_running_loop().create_future())
+        self.jobs[job_id] = job
+        shared.waiters.add(job_id)
+        try:
+            # asyncio.wait never cancels what it waits on, so the shared solve outlives this request.
+            await asyncio.wait((shared.task, job.cancelled), return_when=asyncio.FIRST_COMPLETED)
+            if job.cancelled.done():
+                raise HttpError(409, f"Job '{job_id}' was cancelled")
+            result = shared.task.result()
+        finally:
+            del self.jobs[job_id]
+            shared.waiters.discard(job_id)
+            if not shared.waiters and not shared.task.done():
+                self._abort(shared)
+        return dict(result, job_id=job_id, problem_id=problem_id)
+
+    async def _run_shared(
+        self, shared: _SharedSolve, spec: Dict[str, Any], algorithm: str, params: Dict[str, Any], seed: Optional[int]
+    ) -> Dict[str, Any]:
+        shared.future = self.executor.submit(
+            _solve_job, shared.key[0], spec, algorithm, params, seed, shared.slot
+        )
+        try:
+            result = await asyncio.wrap_future(shared.future)
+        except BaseException:
+            self._forget(shared)
+            raise
+        finally:
+            # The worker may read the slot's flag until its job has finished.
+            if shared.future.done():
+                self._free_slots.append(shared.slot)
+            else:
+                shared.future.add_done_callback(lambda _, slot=shared.slot: self._free_slots.append(slot))
+        # Late duplicates within the window get this result without a new solve.
+        asyncio.get_running_loop().call_later(self.coalesce_window, self._forget, shared)
+        return result
+
+    def _forget(self, shared: _SharedSolve) -> None:
+        if self._shared.get(shared.key) is shared:
+            del self._shared[shared.key]
+
+    def _abort(self, shared: _SharedSolve) -> None:
+        """Stop a shared solve nobody waits for any more."""
+        self._forget(shared)
+        self._cancel_flags[shared.slot] = 1
+        if shared.future is not None:
+            shared.future.cancel()  # only succeeds while the job is still queued
+        if shared.task is not None:
+            shared.task.cancel()
+
+    def _cancel(self, job: _Job) -> None:
+        if not job.cancelled.done():
+            job.cancelled.set_result(None)
+            self.stats["cancelled"] += 1
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        self.stats["requests"] += 1
+        try:
+            if len(body) > INLINE_DECODE_BYTES:
+                payload = await asyncio.get_running_loop().run_in_executor(self._builder, json.loads, body)
+            else:
+                payload = json.loads(body) if body else {}
+        except json.JSONDecodeError as exc:
+            return 400, {"error": f"Invalid JSON: {exc}"}
+
+        try:
+            if method == "GET" and path == "/health":
+                return 200, {"status": "ok"}
+            if method == "GET" and path == "/stats":
+                return 200, dict(self.stats, problems=len(self.problems), running=len(self.jobs))
+            if method == "POST" and path == "/problems":
+                problem_id, problem = await self.register_problem(payload)
+                return 201, {
+                    "problem_id": problem_id,
+                    "num_drones": problem.num_drones,
+                    "num_stations": problem.num_stations,
+                    "lower_bound": problem.lower_bound(),
+                }
+            if method == "DELETE" and path.startswith("/problems/"):
+                if self.problems.pop(path[len("/problems/"):], None) is None:
+                    raise HttpError(404, "Unknown problem")
+                return 200, {"deleted": True}
+            if method == "POST" and path == "/solve":
+                return 200, await self.solve(payload)
+            if method == "DELETE" and path.startswith("/jobs/"):
+                job = self.jobs.get(path[len("/jobs/"):])
+                if job is None:
+                    raise HttpError(404, "Unknown job")
+                self._cancel(job)
+                return 202, {"cancelled": True}
+            raise HttpError(404, f"No route for {method} {path}")
+        except HttpError as exc:
+            return exc.status, {"error": exc.message}
+        except (ValueError, KeyError, TypeError) as exc:
+            return 400, {"error": str(exc)}
+        except Exception as exc:  # keep serving; report the failure to this client only
+            return 500, {"error": f"{type(exc).__name__}: {exc}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except HttpError as exc:
+                    await _write_response(writer, exc.status, {"error": exc.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await _write_response(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, path, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "Malformed request line") from None
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", 0) or 0)
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, "Request body too large")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), path, headers, body
+
+
+_REASONS = {
+    200: "OK",
+    201: "Created",
+    202: "Accepted",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    409: "Conflict",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+async def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool = True) -> None:
+    body = json.dumps(payload).encode("utf-8")
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, 'Error')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+
+
+class ServiceClient:
+    """Minimal asyncio client for the service (one keep-alive connection, one request at a time)."""
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock = asyncio.Lock()
+
+    async def request(self, method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+        async with self._lock:
+            if self._writer is None:
+                self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+            body = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Length: {len(body)}\r\n\r\n"
+            self._writer.write(head.encode("latin-1") + body)
+            await self._writer.drain()
+
+            status_line = await self._reader.readline()
+            if not status_line:
+                raise ConnectionError("Server closed the connection")
+            status = int(status_line.split()[1])
+            length = 0
+            while True:
+                line = await self._reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            data = await self._reader.readexactly(length) if length else b""
+            return status, json.loads(data) if data else None
+
+    async def register_problem(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        return _expect(await self.request("POST", "/problems", spec), 201)
+
+    async def solve(self, **request: Any) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("POST", "/solve", request)
+
+    async def cancel(self, job_id: str) -> Tuple[int, Dict[str, Any]]:
+        return await self.request("DELETE", f"/jobs/{job_id}")
+
+    async def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            with suppress(ConnectionError):
+                await self._writer.wait_closed()
+            self._reader = self._writer = None
+
+
+def _expect(response: Tuple[int, Any], status: int) -> Any:
+    actual, payload = response
+    if actual != status:
+        raise RuntimeError(f"Unexpected status {actual}: {payload}")
+    return payload
+
+
+async def serve(
+    host: str,
+    port: int,
+    workers: Optional[int],
+    coalesce_window: float = 0.05,
+    scenario_dir: Optional[str] = None,
+) -> None:
+    server = AssignmentServer(workers=workers, coalesce_window=coalesce_window, scenario_dir=scenario_dir)
+    bound_host, bound_port = await server.start(host, port)
+    print(f"Assignment service listening on http://{bound_host}:{bound_port}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drone -> ground station assignment service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=None, help="Solver processes (default: CPU count)")
+    parser.add_argument(
+        "--coalesce-window",
+        type=float,
+        default=0.05,
+        help="Seconds a finished result keeps answering identical requests",
+    )
+    parser.add_argument(
+        "--scenario-dir",
+        default=None,
+        help="Directory scenario_file specs may load from (scenario files are refused without it)",
+    )
+    args = parser.parse_args()
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(args.host, args.port, args.workers, args.coalesce_window, args.scenario_dir))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Headless time-stepped simulation: drones (and optionally stations) move every step and the
+assignment is re-optimized against the updated positions.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import motion
+from .problem import AssignmentProblem
+
+Velocity = Tuple[float, float]
+
+
+@dataclass
+class SimulationReport:
+    steps: int
+    assignments: List[int]
+    step_latency_ns: array = field(default_factory=lambda: array("q"))
+    fitness: array = field(default_factory=lambda: array("d"))
+
+    def latency_percentiles(self, points: Sequence[float] = (50, 90, 99)) -> Dict[str, float]:
+        """Per-step latency percentiles in milliseconds (nearest-rank), plus the maximum."""
+        if not self.step_latency_ns:
+            return {}
+        ordered = sorted(self.step_latency_ns)
+        report: Dict[str, float] = {}
+        for point in points:
+            rank = max(0, min(len(ordered) - 1, int(round(point / 100 * len(ordered))) - 1))
+            report[f"p{point:g}"] = ordered[rank] / 1e6
+        report["max"] = ordered[-1] / 1e6
+        return report
+
+
+def problem_bounds(problem: AssignmentProblem) -> Tuple[float, float]:
+    """Upper corner of the area spanned by the problem's drones and stations (the origin is the lower one)."""
+    fleet, stations = problem.fleet, problem.station_set
+    return max(max(fleet.x), max(stations.x)), max(max(fleet.y), max(stations.y))
+
+
+class Simulation:
+    """
+    Advances drone/station positions in fixed time steps and re-optimizes each step.
+
+    Only entities that actually moved have their travel-time rows/columns refreshed. When
+    `step_budget` is given it is installed as the solver's `time_limit`, so each re-optimization
+    stops after the iteration that exhausts the budget. The previous assignment is kept whenever
+    the solver does not beat it on the new positions.
+
+    Entities move inside `[0, width] x [0, height]`; `bounds` defaults to the problem's extent
+    (`problem_bounds`), so nothing is pulled in from where the scenario placed it.
+    """
+
+    def __init__(
+        self,
+        problem: AssignmentProblem,
+        solver,
+        drone_velocities: Optional[Sequence[Velocity]] = None,
+        station_velocities: Optional[Sequence[Velocity]] = None,
+        bounds: Optional[Tuple[float, float]] = None,
+        time_step: float = 1.0,
+        step_budget: Optional[float] = None,
+        reoptimize_every: int = 1,
+        collision_radius: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        if time_step <= 0:
+            raise ValueError("Time step must be positive")
+        if reoptimize_every <= 0:
+            raise ValueError("Re-optimization interval must be positive")
+        if collision_radius < 0:
+            raise ValueError("Collision radius must be non-negative")
+        if drone_velocities is not None and len(drone_velocities) != problem.num_drones:
+            raise ValueError("One velocity per drone is required")
+        if station_velocities is not None and len(station_velocities) != problem.num_stations:
+            raise ValueError("One velocity per station is required")
+
+        self.problem = problem
+        self.solver = solver
+        self.bounds = bounds if bounds is not None else problem_bounds(problem)
+        self.time_step = time_step
+        self.reoptimize_every = reoptimize_every
+        self.collision_radius = collision_radius
+        self._rng = random.Random(seed)
+
+        if drone_velocities is None:
+            drone_velocities = [(self._rng.uniform(-5, 5), self._rng.uniform(-5, 5)) for _ in range(problem.num_drones)]
+        self.drone_x = array("d", problem.fleet.x)
+        self.drone_y = array("d", problem.fleet.y)
+        self.drone_vx = array("d", [vx for vx, _ in drone_velocities])
+        self.drone_vy = array("d", [vy for _, vy in drone_velocities])
+
+        self.moving_stations = station_velocities is not None
+        if station_velocities is not None:
+            self.station_x = array("d", problem.station_set.x)
+            self.station_y = array("d", problem.station_set.y)
+            self.station_vx = array("d", [vx for vx, _ in station_velocities])
+            self.station_vy = array("d", [vy for _, vy in station_velocities])
+
+        if step_budget is not None:
+            solver.time_limit = step_budget
+
+        problem.travel_time_matrix()
+        self.assignments: List[int] = [station_idx for station_idx, _ in problem.random_assignment()]
+        self.steps_taken = 0
+
+    def step(self) -> float:
+        """Advance one time step and return the fitness of the assignment in force afterwards."""
+        problem = self.problem
+        width, height = self.bounds
+        dt = self.time_step
+
+        new_x = motion.integrate(self.drone_x, self.drone_vx, dt, width)
+        new_y = motion.integrate(self.drone_y, self.drone_vy, dt, height)
+        moved = motion.changed_indices(self.drone_x, self.drone_y, new_x, new_y)
+        pairs = motion.near_collisions(new_x, new_y, self.collision_radius)
+        if pairs:
+            nudged = motion.separate(new_x, new_y, pairs, self.collision_radius, self.bounds, self._rng)
+            moved = sorted(set(moved).union(nudged))
+        self.drone_x, self.drone_y = new_x, new_y
+        problem.move_drones((idx, (new_x[idx], new_y[idx])) for idx in moved)
+
+        if self.moving_stations:
+            new_x = motion.integrate(self.station_x, self.station_vx, dt, width)
+            new_y = motion.integrate(self.station_y, self.station_vy, dt, height)
+            moved = motion.changed_indices(self.station_x, self.station_y, new_x, new_y)
+            self.station_x, self.station_y = new_x, new_y
+            problem.move_stations((idx, (new_x[idx], new_y[idx])) for idx in moved)
+
+        self.steps_taken += 1
+        fitness = problem.evaluate(self.assignments)
+        if self.steps_taken % self.reoptimize_every == 0:
+            result = self.solver.solve(problem)
+            candidate = problem.evaluate(result.assignments)
+            if candidate < fitness:
+                self.assignments = list(result.assignments)
+                fitness = candidate
+        return fitness
+
+    def run(self, steps: int) -> SimulationReport:
+        if steps <= 0:
+            raise ValueError("Steps must be positive")
+
+        report = SimulationReport(steps=steps, assignments=[])
+        for _ in range(steps):
+            started = time.perf_counter_ns()
+            fitness = self.step()
+            report.step_latency_ns.append(time.perf_counter_ns() - started)
+            report.fitness.append(fitness)
+        report.assignments = list(self.assignments)
+        return report
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import math
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SpatialHashGrid:
+    """
+    Uniform grid bucketing point indices by `(floor(x / cell_size), floor(y / cell_size))`.
+    Radius queries only visit the cells overlapping the query box, so lookups stay O(local density).
+    """
+
+    def __init__(self, cell_size: float) -> None:
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        self.cell_size = cell_size
+        self.cells: Dict[Cell, List[int]] = {}
+        self._cached_extent: Optional[Tuple[int, int, int, int]] = None
+
+    @classmethod
+    def build(cls, xs: Sequence[float], ys: Sequence[float], cell_size: float) -> "SpatialHashGrid":
+        grid = cls(cell_size)
+        inv = 1.0 / cell_size
+        cells = grid.cells
+        floor = math.floor
+        for idx, (x, y) in enumerate(zip(xs, ys)):
+            key = (floor(x * inv), floor(y * inv))
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = [idx]
+            else:
+                bucket.append(idx)
+        return grid
+
+    def candidates(self, x: float, y: float, radius: float) -> Iterator[int]:
+        """Yield indices in every cell overlapping the square of side `2 * radius` around (x, y)."""
+        inv = 1.0 / self.cell_size
+        min_cx, max_cx = math.floor((x - radius) * inv), math.floor((x + radius) * inv)
+        min_cy, max_cy = math.floor((y - radius) * inv), math.floor((y + radius) * inv)
+        cells = self.cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    yield from bucket
+
+    def query_radius(
+        self, xs: Sequence[float], ys: Sequence[float], x: float, y: float, radius: float
+    ) -> List[int]:
+        """Indices of the points (xs, ys) the grid was built from lying within `radius` of (x, y)."""
+        limit = radius * radius
+        return [
+            idx
+            for idx in self.candidates(x, y, radius)
+            if (xs[idx] - x) ** 2 + (ys[idx] - y) ** 2 <= limit
+        ]
+
+    def nearest(
+        self,
+        xs: Sequence[float],
+        ys: Sequence[float],
+        x: float,
+        y: float,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> Tuple[int, float]:
+        """
+        Index of, and distance to, the point closest to (x, y); (-1, inf) for an empty grid.
+        Searches square rings of cells outwards and stops once no unvisited cell can be closer.
+        Rings are clipped to the occupied extent, and rings lying wholly outside it are skipped,
+        so a query far from the points costs O(extent) rather than O(distance / cell_size)^2.
+        With `accept`, only points it returns True for are considered.
+        """
+        if not self.cells:
+            return -1, math.inf
+
+        size = self.cell_size
+        cx, cy = math.floor(x / size), math.floor(y / size)
+        min_cx, min_cy, max_cx, max_cy = self._extent()
+        first_ring = max(min_cx - cx, cx - max_cx, min_cy - cy, cy - max_cy, 0)
+        max_ring = max(cx - min_cx, max_cx - cx, cy - min_cy, max_cy - cy, 0)
+        cells = self.cells
+        best_idx, best_sq = -1, math.inf
+        for ring in range(first_ring, max_ring + 1):
+            # Any point in ring r is at least (r - 1) * size away from (x, y).
+            if best_idx >= 0 and ((ring - 1) * size) ** 2 > best_sq:
+                break
+            low_y, high_y = max(cy - ring, min_cy), min(cy + ring, max_cy)
+            for kx in range(max(cx - ring, min_cx), min(cx + ring, max_cx) + 1):
+                if abs(kx - cx) == ring:
+                    rows = range(low_y, high_y + 1)
+                else:
+                    rows = [ky for ky in (cy - ring, cy + ring) if low_y <= ky <= high_y]
+                for ky in rows:
+                    bucket = cells.get((kx, ky))
+                    if bucket is None:
+                        continue
+                    for idx in bucket:
+                        dist_sq = (xs[idx] - x) ** 2 + (ys[idx] - y) ** 2
+                        if dist_sq < best_sq and (accept is None or accept(idx)):
+                            best_idx, best_sq = idx, dist_sq
+        return best_idx, math.sqrt(best_sq)
+
+    def _extent(self) -> Tuple[int, int, int, int]:
+        if self._cached_extent is None:
+            keys = self.cells.keys()
+            self._cached_extent = (
+                min(k[0] for k in keys),
+                min(k[1] for k in keys),
+                max(k[0] for k in keys),
+                max(k[1] for k in keys),
+            )
+        return self._cached_extent
+
+    def pairs_within(self, xs: Sequence[float], ys: Sequence[float], radius: float) -> List[Tuple[int, int]]:
+        """
+        All index pairs (i < j) closer than `radius`. Requires `cell_size >= radius`; each cell is
+        only compared with itself and four forward neighbours so every pair is visited once.
+        """
+        if radius > self.cell_size:
+            raise ValueError("Radius must not exceed the grid cell size")
+
+        limit = radius * radius
+        cells = self.cells
+        pairs: List[Tuple[int, int]] = []
+        for (cx, cy), bucket in cells.items():
+            for pos, i in enumerate(bucket):
+                xi, yi = xs[i], ys[i]
+                for j in bucket[pos + 1:]:
+                    if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 < limit:
+                        pairs.append((i, j) if i < j else (j, i))
+            for neighbour in ((cx + 1, cy - 1), (cx + 1, cy), (cx + 1, cy + 1), (cx, cy + 1)):
+                other = cells.get(neighbour)
+                if other is None:
+                    continue
+                for i in bucket:
+                    xi, yi = xs[i], ys[i]
+                    for j in other:
+                        if (xs[j] - xi) ** 2 + (ys[j] - yi) ** 2 < limit:
+                            pairs.append((i, j) if i < j else (j, i))
+        return pairs
@@ -0,0 +1,303 @@
+"""
+Hyperparameter tuning with successive halving (Hyperband).
+
+For every scenario class and solver, random configurations are drawn from `SEARCH_SPACES` and
+scored by their mean optimality gap (`AssignmentResult.gap`) over a few seeded instances of the
+class. Successive halving runs all configurations on a small iteration budget, keeps the best
+`1 / eta` and multiplies the budget by `eta`, until the full budget is reached; Hyperband repeats
+this over brackets that trade the number of configurations against the starting budget. Solves
+run in parallel on a process pool. The best configuration per class and solver is merged into a
+JSON file that `run.py --tuned` passes to `build_algorithm`:
+
+    python -m ground_station.tuning --scenarios static generated/clustered --output tuned.json
+    python run.py --scenario generated --layout clustered --algo aco --tuned tuned.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .algorithms.registry import build_solver
+from .problem import AssignmentProblem
+
+TUNED_VERSION = 1
+
+# name -> (kind, low, high); ints are sampled uniformly, floats log-uniformly when `low` > 0.
+SEARCH_SPACES: Dict[str, Dict[str, Tuple[str, float, float]]] = {
+    "pso": {
+        "num_particles": ("int", 5, 60),
+        "inertia_weight": ("float", 0.2, 1.0),
+        "cognitive_weight": ("float", 0.5, 2.5),
+        "social_weight": ("float", 0.5, 2.5),
+    },
+    "gwo": {"num_wolves": ("int", 3, 60)},
+    "aco": {
+        "num_ants": ("int", 5, 60),
+        "evaporation_rate": ("float", 0.05, 0.95),
+        "alpha": ("float", 0.5, 3.0),
+        "beta": ("float", 0.5, 5.0),
+    },
+    "ga": {
+        "population_size": ("int", 4, 80),
+        "mutation_rate": ("float", 0.01, 0.5),
+        "crossover_rate": ("float", 0.3, 1.0),
+    },
+    "abc": {
+        "num_employed_bees": ("int", 4, 60),
+        "num_onlooker_bees": ("int", 4, 60),
+        "limit": ("int", 5, 100),
+    },
+    "goa": {"population_size": ("int", 4, 60)},
+    "dea": {
+        "population_size": ("int", 4, 60),
+        "scaling_factor": ("float", 0.2, 1.2),
+        "crossover_rate": ("float", 0.1, 1.0),
+    },
+}
+
+
+def scenario_classes(drones: int = 200, stations: int = 40) -> Dict[str, Callable[[int], AssignmentProblem]]:
+    """Scenario class name -> factory(seed). Class names match `run.py`'s `scenario_class`."""
+    from .scenarios import (
+        LAYOUTS,
+        generated_scenario,
+        moving_drones_and_stations,
+        moving_drones_static_stations,
+        static_scenario,
+    )
+
+    classes: Dict[str, Callable[[int], AssignmentProblem]] = {
+        "static": lambda seed: static_scenario(),
+        "moving-drones": lambda seed: moving_drones_static_stations(seed=seed),
+        "moving-all": lambda seed: moving_drones_and_stations(seed=seed),
+    }
+    for layout in LAYOUTS:
+        classes[f"generated/{layout}"] = lambda seed, layout=layout: generated_scenario(
+            num_drones=drones, num_stations=stations, layout=layout, seed=seed
+        )
+    return classes
+
+
+def sample_config(space: Dict[str, Tuple[str, float, float]], rng: random.Random) -> Dict[str, Any]:
+    config: Dict[str, Any] = {}
+    for name, (kind, low, high) in space.items():
+        if kind == "int":
+            config[name] = rng.randint(int(low), int(high))
+        elif low > 0:
+            config[name] = round(math.exp(rng.uniform(math.log(low), math.log(high))), 4)
+        else:
+            config[name] = round(rng.uniform(low, high), 4)
+    return config
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    algorithm: str
+    params: Tuple[Tuple[str, Any], ...]
+    iterations: int
+    scenario_class: str
+    seed: int
+    drones: int
+    stations: int
+
+
+@lru_cache(maxsize=32)
+def _instance(scenario_class: str, seed: int, drones: int, stations: int) -> AssignmentProblem:
+    problem = scenario_classes(drones, stations)[scenario_class](seed)
+    problem.lower_bound()
+    return problem
+
+
+def evaluate(task: Evaluation) -> float:
+    """Gap of one solve; pool entry point."""
+    problem = _instance(task.scenario_class, task.seed, task.drones, task.stations)
+    random.seed(task.seed)
+    solver = build_solver(task.algorithm, dict(task.params), iterations=task.iterations)
+    result = solver.solve(problem)
+    result.compute_lower_bound()
+    return result.gap
+
+
+@dataclass
+class Trial:
+    params: Dict[str, Any]
+    scores: Dict[int, float] = field(default_factory=dict)  # iterations -> mean gap
+
+    @property
+    def score(self) -> float:
+        return self.scores[max(self.scores)]
+
+
+class Tuner:
+    def __init__(
+        self,
+        scenario_class: str,
+        instances: int = 3,
+        drones: int = 200,
+        stations: int = 40,
+        min_iterations: int = 5,
+        max_iterations: int = 135,
+        eta: int = 3,
+        workers: int = 1,
+        seed: int = 0,
+    ) -> None:
+        if scenario_class not in scenario_classes(drones, stations):
+            raise ValueError(f"Unknown scenario class '{scenario_class}'")
+        if instances <= 0:
+            raise ValueError("Instances must be positive")
+        if not 0 < min_iterations <= max_iterations:
+            raise ValueError("Iteration budgets must satisfy 0 < min <= max")
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        if workers <= 0:
+            raise ValueError("Workers must be positive")
+
+        self.scenario_class = scenario_class
+        self.instances = instances
+        self.drones = drones
+        self.stations = stations
+        self.min_iterations = min_iterations
+        self.max_iterations = max_iterations
+        self.eta = eta
+        self.workers = workers
+        self.seed = seed
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def successive_halving(self, algorithm: str, trials: List[Trial], iterations: int) -> List[Trial]:
+        """Race `trials` from `iterations` up to the full budget; returns the survivors of the last rung."""
+        while True:
+            self._score(algorithm, trials, iterations)
+            trials.sort(key=lambda trial: trial.scores[iterations])
+            if iterations >= self.max_iterations or len(trials) == 1:
+                return trials
+            trials = trials[: max(len(trials) // self.eta, 1)]
+            iterations = min(iterations * self.eta, self.max_iterations)
+
+    def hyperband(self, algorithm: str) -> Trial:
+        """Best configuration over all Hyperband brackets, judged at the full iteration budget."""
+        if algorithm not in SEARCH_SPACES:
+            raise ValueError(f"Unknown algorithm '{algorithm}'")
+        rng = random.Random(f"{self.seed}/{self.scenario_class}/{algorithm}")
+        brackets = int(math.log(self.max_iterations / self.min_iterations, self.eta) + 1e-9)
+        finalists: List[Trial] = []
+        for bracket in range(brackets, -1, -1):
+            count = math.ceil((brackets + 1) / (bracket + 1) * self.eta**bracket)
+            iterations = max(self.max_iterations // self.eta**bracket, self.min_iterations)
+            trials = [Trial(sample_config(SEARCH_SPACES[algorithm], rng)) for _ in range(count)]
+            survivors = self.successive_halving(algorithm, trials, iterations)
+            self._score(algorithm, survivors[:1], self.max_iterations)
+            finalists.append(survivors[0])
+        return min(finalists, key=lambda trial: trial.scores[self.max_iterations])
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "Tuner":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _score(self, algorithm: str, trials: Sequence[Trial], iterations: int) -> None:
+        pending = [trial for trial in trials if iterations not in trial.scores]
+        tasks = [
+            Evaluation(
+                algorithm,
+                tuple(sorted(trial.params.items())),
+                iterations,
+                self.scenario_class,
+                self.seed + instance,
+                self.drones,
+                self.stations,
+            )
+            for trial in pending
+            for instance in range(self.instances)
+        ]
+        if self.workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            gaps = list(self._pool.map(evaluate, tasks))
+        else:
+            gaps = [evaluate(task) for task in tasks]
+        for index, trial in enumerate(pending):
+            chunk = gaps[index * self.instances : (index + 1) * self.instances]
+            trial.scores[iterations] = math.fsum(chunk) / len(chunk)
+
+
+def save_tuned(path: str, scenario_class: str, algorithm: str, trial: Trial, iterations: int) -> None:
+    """Merge the best configuration for (`scenario_class`, `algorithm`) into the tuned-config file."""
+    payload: Dict[str, Any] = {"version": TUNED_VERSION, "classes": {}}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    payload["classes"].setdefault(scenario_class, {})[algorithm] = {
+        "params": trial.params,
+        "gap": trial.score,
+        "iterations": iterations,
+    }
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+
+
+def load_tuned(path: str, scenario_class: str, algorithm: str) -> Optional[Dict[str, Any]]:
+    """Tuned constructor arguments for `algorithm` on `scenario_class`, or None if not tuned."""
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    if payload.get("version") != TUNED_VERSION:
+        raise ValueError(f"{path} is not a tuned-config file of version {TUNED_VERSION}")
+    entry = payload["classes"].get(scenario_class, {}).get(algorithm)
+    return None if entry is None else dict(entry["params"])
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Tune solver hyperparameters with Hyperband")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SEARCH_SPACES), default=list(SEARCH_SPACES))
+    parser.add_argument("--scenarios", nargs="+", default=["generated/uniform"], help="Scenario classes")
+    parser.add_argument("--instances", type=int, default=3, help="Seeded instances per scenario class")
+    parser.add_argument("--drones", type=int, default=200, help="Drones in generated instances")
+    parser.add_argument("--stations", type=int, default=40, help="Stations in generated instances")
+    parser.add_argument("--min-iterations", type=int, default=5)
+    parser.add_argument("--max-iterations", type=int, default=135)
+    parser.add_argument("--eta", type=int, default=3, help="Keep 1/eta of the configurations per rung")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="tuned.json", help="Tuned-config file (merged if it exists)")
+    args = parser.parse_args(argv)
+
+    for scenario_class in args.scenarios:
+        try:
+            tuner = Tuner(
+                scenario_class,
+                instances=args.instances,
+                drones=args.drones,
+                stations=args.stations,
+                min_iterations=args.min_iterations,
+                max_iterations=args.max_iterations,
+                eta=args.eta,
+                workers=args.workers,
+                seed=args.seed,
+            )
+        except ValueError as exc:
+            parser.error(str(exc))
+        with tuner:
+            for algorithm in args.algorithms:
+                best = tuner.hyperband(algorithm)
+                save_tuned(args.output, scenario_class, algorithm, best, args.max_iterations)
+                print(f"{scenario_class:>20} | {algorithm:>4} | gap {best.score:.4f} | {best.params}", flush=True)
+    print(f"Tuned configurations written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
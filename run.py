@@ -1,84 +1,252 @@
 import argparse
+import os
 import random
-from typing import Callable, Dict
-
-from ground_station.algorithms import (
-    AntColony,
-    ArtificialBeeColony,
-    DifferentialEvolution,
-    Genetic,
-    Grasshopper,
-    GreyWolf,
-    ParticleSwarm,
-)
+from typing import Any, Callable, Dict, Optional
+
+from ground_station.algorithms.registry import build_solver, load_config, solver_names
 from ground_station.problem import AssignmentProblem
-from ground_station.scenarios import (
-    moving_drones_and_stations,
-    moving_drones_static_stations,
-    static_scenario,
-)
-
-
-ScenarioFactory = Callable[[], AssignmentProblem]
-
-
-def get_scenarios() -> Dict[str, ScenarioFactory]:
-    return {
-        "static": static_scenario,
-        "moving-drones": moving_drones_static_stations,
-        "moving-all": moving_drones_and_stations,
-    }
-
-
-def build_algorithm(name: str, iterations: int):
-    name = name.lower()
-    algorithms = {
-        "pso": lambda: ParticleSwarm(max_iterations=iterations),
-        "gwo": lambda: GreyWolf(max_iterations=iterations),
-        "aco": lambda: AntColony(num_iterations=iterations),
-        "ga": lambda: Genetic(max_generations=iterations),
-        "abc": lambda: ArtificialBeeColony(max_iterations=iterations),
-        "goa": lambda: Grasshopper(max_iterations=iterations),
-        "dea": lambda: DifferentialEvolution(max_iterations=iterations),
-    }
-    
-    if name not in algorithms:
-        available = ", ".join(sorted(algorithms.keys()))
-        raise ValueError(f"Unknown algorithm '{name}'. Available: {available}")
-    
-    return algorithms[name]()
+
+
+ScenarioFactory = Callable[..., AssignmentProblem]
+
+# Scenario name -> factory exported by `ground_station.scenarios`; only the chosen one is imported.
+SCENARIOS = {
+    "static": "static_scenario",
+    "moving-drones": "moving_drones_static_stations",
+    "moving-all": "moving_drones_and_stations",
+    "generated": "generated_scenario",
+}
+
+
+def get_scenario(name: str) -> ScenarioFactory:
+    from ground_station import scenarios
+
+    return getattr(scenarios, SCENARIOS[name])
+
+
+def build_algorithm(
+    name: str, iterations: int, params: Optional[Dict[str, Any]] = None, population: Optional[int] = None
+):
+    """Build a registered solver; `params` (e.g. from a tuned-config file) override its constructor defaults."""
+    return build_solver(name, params, iterations=iterations, population=population)
+
+
+def cache_tag(args: argparse.Namespace) -> str:
+    """
+    Result-cache tag for the scenario source: the scenario file or name, with every argument that
+    shapes the instance (the energy weight, and for named scenarios the seed and generator
+    settings). Cached results under the same tag whose problem fingerprint no longer matches are
+    stale (the file or the generator changed), so differing instances never evict each other.
+    """
+    settings = {"energy_weight": args.energy_weight}
+    if args.scenario_file:
+        source = os.path.abspath(args.scenario_file)
+    else:
+        source = args.scenario
+        settings["seed"] = args.seed
+        if args.scenario == "generated":
+            settings.update(
+                drones=args.drones, stations=args.stations, layout=args.layout, coverage_radius=args.coverage_radius
+            )
+    return source + "?" + "&".join(f"{name}={value}" for name, value in sorted(settings.items()))
+
+
+def print_trace_summary(trace) -> None:
+    iterations = len(trace["iteration_ns"])
+    total_ms = sum(trace["iteration_ns"]) / 1e6
+    print(
+        f"Iterations: {iterations} | Mean iteration: {total_ms / max(iterations, 1):.3f}ms"
+        f" | Evaluations: {sum(trace['evaluations'])} | Cache hits: {sum(trace['cache_hits'])}"
+        f" | Repairs: {sum(trace['repairs'])}"
+    )
+    if iterations:
+        print(f"Final diversity: {trace['diversity'][-1]:.3f} | Final mean fitness: {trace['mean_fitness'][-1]:.4f}")
+    if "peak_memory_bytes" in trace:
+        print(f"Peak traced memory: {max(trace['peak_memory_bytes'], default=0) / 1024:.1f} KiB")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Drone -> ground station assignment simulation")
     parser.add_argument(
         "--scenario",
-        choices=list(get_scenarios().keys()),
+        choices=list(SCENARIOS),
         default="static",
         help="Which scenario to run",
     )
     parser.add_argument(
         "--algo",
-        choices=["pso", "gwo", "aco", "ga", "abc", "goa", "dea"],
+        choices=solver_names() + ["auto"],
         default="pso",
         help="Optimization algorithm",
     )
+    parser.add_argument("--config", default=None, help="Solver config file (.toml/.json); overrides --algo")
+    parser.add_argument("--tuned", default=None, help="Tuned-config file from ground_station.tuning")
+    parser.add_argument("--selector", default="selector.json", help="Selector model used by --algo auto")
+    parser.add_argument("--scenario-file", default=None, help="Load a binary scenario file instead of --scenario")
+    parser.add_argument("--save-scenario", default=None, help="Write the scenario to a binary file before solving")
     parser.add_argument("--iterations", type=int, default=200, help="Iteration count")
+    parser.add_argument("--drones", type=int, default=1000, help="Drone count for the generated scenario")
+    parser.add_argument("--stations", type=int, default=100, help="Station count for the generated scenario")
+    parser.add_argument("--layout", default="uniform", help="Layout for the generated scenario")
+    parser.add_argument("--coverage-radius", type=float, default=None, help="Station coverage radius (generated)")
     parser.add_argument("--seed", type=int, default=42, help="Randomness seed")
+    parser.add_argument("--time-limit", type=float, default=None, help="Wall-clock budget for the solve in seconds")
+    parser.add_argument("--energy-weight", type=float, default=0.0, help="Weight of the energy-consumption term")
+    parser.add_argument("--steps", type=int, default=0, help="Run a time-stepped simulation for this many steps")
+    parser.add_argument("--step-budget", type=float, default=None, help="Per-step solver time budget in seconds")
+    parser.add_argument("--instrument", action="store_true", help="Record per-iteration solver instrumentation")
+    parser.add_argument("--trace-memory", action="store_true", help="Also record tracemalloc peaks (slow)")
+    parser.add_argument(
+        "--profile",
+        choices=["cprofile", "sampling"],
+        default=None,
+        help="Profile only the solve() call and print the hottest ground_station functions",
+    )
+    parser.add_argument("--cache", default=None, help="SQLite result cache; reuse results of identical solves")
+    parser.add_argument("--cache-max-mb", type=float, default=256.0, help="Result cache size limit in MiB")
+    parser.add_argument(
+        "--profile-output",
+        default=None,
+        help="Profile output path (default: solve.pstats for cprofile, solve.collapsed for sampling)",
+    )
     args = parser.parse_args()
 
     if args.iterations <= 0:
         parser.error("Iterations must be positive")
+    if args.energy_weight < 0:
+        parser.error("Energy weight must be non-negative")
+    if args.steps < 0:
+        parser.error("Steps must be non-negative")
+    if args.step_budget is not None and args.step_budget <= 0:
+        parser.error("Step budget must be positive")
+    if args.time_limit is not None and args.time_limit <= 0:
+        parser.error("Time limit must be positive")
+    if args.cache_max_mb <= 0:
+        parser.error("Cache size limit must be positive")
 
     random.seed(args.seed)
-    scenarios = get_scenarios()
-    problem = scenarios[args.scenario]()
-    algorithm = build_algorithm(args.algo, args.iterations)
+    if args.scenario_file:
+        problem = AssignmentProblem.from_scenario_file(args.scenario_file)
+    elif args.scenario == "generated":
+        from ground_station.scenarios.generated import LAYOUTS
+
+        if args.layout not in LAYOUTS:
+            parser.error(f"Unknown layout '{args.layout}'. Available: {', '.join(LAYOUTS)}")
+        problem = get_scenario("generated")(
+            num_drones=args.drones,
+            num_stations=args.stations,
+            layout=args.layout,
+            seed=args.seed,
+            coverage_radius=args.coverage_radius,
+        )
+    else:
+        problem = get_scenario(args.scenario)()
+    problem.energy_weight = args.energy_weight
+    if args.save_scenario:
+        from ground_station.scenario_file import save_problem
+
+        save_problem(args.save_scenario, problem)
+    scenario_label = args.scenario_file or args.scenario
+    config = None
+    if args.config:
+        try:
+            config = load_config(args.config)
+        except (OSError, ValueError) as exc:
+            parser.error(f"Cannot read solver config: {exc}")
+    algo_name = config.solver if config else args.algo
+    selection = None
+    if algo_name == "auto":
+        from ground_station.selection import SelectorModel
+
+        try:
+            selection = SelectorModel.load(args.selector).select(problem)
+        except (OSError, ValueError) as exc:
+            parser.error(f"--algo auto needs a trained selector model: {exc}")
+        algo_name = selection.algorithm
+        print(f"Selected {algo_name} {selection.params} (predicted {selection.predicted_seconds:.3f}s to target)")
+    params: Dict[str, Any] = {}
+    if args.tuned:
+        from ground_station.tuning import load_tuned
+
+        scenario_class = f"generated/{args.layout}" if args.scenario == "generated" else scenario_label
+        try:
+            params = load_tuned(args.tuned, scenario_class, algo_name) or {}
+        except (OSError, ValueError) as exc:
+            parser.error(f"Cannot read tuned configs: {exc}")
+        if not params:
+            print(f"No tuned configuration for {algo_name} on {scenario_class}; using defaults")
+    if selection is not None:
+        params.update(selection.params)
+    if config is not None:
+        params.update(config.params)
+    try:
+        algorithm = build_algorithm(
+            algo_name,
+            (config.iterations if config else None) or args.iterations,
+            params,
+            population=config.population if config else None,
+        )
+    except ValueError as exc:
+        parser.error(str(exc))
+    algorithm.instrument = args.instrument
+    algorithm.trace_memory = args.trace_memory
+    if args.time_limit is not None:
+        algorithm.time_limit = args.time_limit
+
+    if args.steps:
+        from ground_station.simulation import Simulation, problem_bounds
+
+        if args.scenario == "generated" and not args.scenario_file:
+            from ground_station.scenarios.generated import AREA_SIZE
+
+            bounds = (AREA_SIZE, AREA_SIZE)
+        else:
+            bounds = problem_bounds(problem)
+        simulation = Simulation(problem, algorithm, bounds=bounds, step_budget=args.step_budget, seed=args.seed)
+        report = simulation.run(args.steps)
+        latency = ", ".join(f"{name}={value:.3f}ms" for name, value in report.latency_percentiles().items())
+        print(f"Scenario: {scenario_label} | Algorithm: {algo_name} | Steps: {report.steps}")
+        print(f"Final fitness: {report.fitness[-1]:.4f}")
+        print(f"Step latency: {latency}")
+        return
+
+    cache, cached = None, None
+    if args.cache and not args.profile:
+        from ground_station.result_cache import ResultCache
+
+        cache = ResultCache(args.cache, max_bytes=int(args.cache_max_mb * 1024 * 1024))
+        fingerprint = problem.fingerprint()
+        stale = cache.purge_stale(cache_tag(args), problem, fingerprint=fingerprint)
+        if stale:
+            print(f"Dropped {stale} stale cached result(s) for {scenario_label}")
+        cached = cache.get(problem, algorithm, args.seed, fingerprint=fingerprint)
+
+    if cached is not None:
+        result, profile = cached, None
+    elif args.profile:
+        from ground_station.profiling import profile_call
 
-    result = algorithm.solve(problem)
+        output = args.profile_output or ("solve.pstats" if args.profile == "cprofile" else "solve.collapsed")
+        result, profile = profile_call(lambda: algorithm.solve(problem), args.profile, output)
+    else:
+        result, profile = algorithm.solve(problem), None
+    if cache is not None:
+        if cached is None:
+            cache.put(problem, algorithm, args.seed, result, tag=cache_tag(args), fingerprint=fingerprint)
+        cache.close()
 
-    print(f"Scenario: {args.scenario} | Algorithm: {args.algo}")
+    print(f"Scenario: {scenario_label} | Algorithm: {algo_name}" + (" | cached" if cached is not None else ""))
     print(f"Best fitness: {result.fitness:.4f} | Duration: {result.elapsed_seconds:.3f}s")
+    if result.trace:
+        print_trace_summary(result.trace)
+    for member in getattr(result, "members", ()):
+        status = "cut" if member.cut else "done"
+        print(
+            f"  {member.name:<22} fitness={member.fitness:.4f} iterations={member.iterations}"
+            f" time={member.elapsed_seconds:.3f}s ({status})"
+        )
+    if profile is not None:
+        print(profile.format())
     print("\nAssignments:")
     for idx, station_idx in enumerate(result.assignments):
         drone = problem.drones[idx]
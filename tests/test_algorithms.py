@@ -1,3 +1,4 @@
+import random
 import unittest
 
 from ground_station.algorithms import (
@@ -9,7 +10,8 @@ from ground_station.algorithms import (
     GreyWolf,
     ParticleSwarm,
 )
-from ground_station.scenarios import static_scenario
+from ground_station.algorithms.repair import StationPool
+from ground_station.scenarios import generated_scenario, static_scenario
 
 
 class AlgorithmSmokeTests(unittest.TestCase):
@@ -40,6 +42,19 @@ class AlgorithmSmokeTests(unittest.TestCase):
         result = ArtificialBeeColony(num_employed_bees=6, num_onlooker_bees=6, max_iterations=5).solve(self.problem)
         self._assert_solution(result)
 
+    def test_abc_neighbor_never_hands_out_vacated_stations(self):
+        # Each drone's current station leaves the pool for the rest of the sweep, and every pick is
+        # taken, so drone j never lands on a station held by drones 0..j and picks never repeat.
+        random.seed(4)
+        problem = generated_scenario(num_drones=12, num_stations=40, seed=4)
+        problem.require_unique_station = False
+        solution = [(idx, 1.0) for idx in range(12)]
+        neighbor = ArtificialBeeColony()._neighbor(problem, solution, StationPool(problem))
+        stations = [station_idx for station_idx, _ in neighbor]
+        self.assertEqual(len(set(stations)), 12)
+        for idx, station_idx in enumerate(stations):
+            self.assertGreater(station_idx, idx)
+
     def test_goa(self):
         result = Grasshopper(population_size=8, max_iterations=5).solve(self.problem)
         self._assert_solution(result)
@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from benchmarks.micro import BenchmarkResult, compare, load_baseline, run_suite, save_baseline
+from benchmarks.startup import ROOT
+
+
+class MicroBenchmarkTests(unittest.TestCase):
+    def test_suite_runs_every_requested_case(self):
+        results = run_suite(sizes=[10], cases=["evaluate", "iteration/aco"], min_time=0.001, repeat=1)
+        self.assertEqual([result.key for result in results], ["evaluate[10]", "iteration/aco[10]"])
+        self.assertTrue(all(result.ops_per_sec > 0 for result in results))
+
+    def test_rejects_unknown_case(self):
+        with self.assertRaises(ValueError):
+            run_suite(sizes=[10], cases=["nope"])
+
+    def test_baseline_round_trip_and_comparison(self):
+        baseline = [BenchmarkResult("evaluate", 100, 1000.0, 100_000), BenchmarkResult("parse_gene", 100, 500.0, 0)]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "baseline.json")
+            save_baseline(path, baseline)
+            loaded = load_baseline(path)
+        self.assertEqual(loaded["evaluate[100]"], baseline[0])
+
+        current = [BenchmarkResult("evaluate", 100, 950.0, 105_000), BenchmarkResult("parse_gene", 100, 400.0, 0)]
+        self.assertEqual(len(compare(current, loaded)), 1)
+        self.assertIn("parse_gene[100]", compare(current, loaded)[0])
+
+        hungrier = [BenchmarkResult("evaluate", 100, 1000.0, 120_000)]
+        self.assertIn("peak", compare(hungrier, loaded)[0])
+
+
+class StartupTests(unittest.TestCase):
+    def test_cli_import_skips_solvers_scenarios_and_heavy_modules(self):
+        script = (
+            "import sys, run\n"
+            "heavy = [name for name in sys.modules if name.startswith('ground_station.algorithms.')"
+            " and name != 'ground_station.algorithms.registry' or name.startswith('ground_station.scenarios.')"
+            " or name in ('multiprocessing', 'tracemalloc', 'hashlib', 'ground_station.simulation')]\n"
+            "print(','.join(sorted(heavy)))\n"
+        )
+        output = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+        self.assertEqual(output.stdout.strip(), "")
+
+    def test_lazy_exports_resolve_on_access(self):
+        import ground_station.algorithms as algorithms
+        from ground_station.algorithms.pso import ParticleSwarm
+
+        self.assertIs(algorithms.ParticleSwarm, ParticleSwarm)
+        self.assertIn("Portfolio", dir(algorithms))
+        with self.assertRaises(AttributeError):
+            algorithms.NotASolver
+
+
+if __name__ == "__main__":
+    unittest.main()
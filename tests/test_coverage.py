@@ -0,0 +1,56 @@
+import math
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.algorithms import (
+    AntColony,
+    ArtificialBeeColony,
+    DifferentialEvolution,
+    Genetic,
+    Grasshopper,
+    GreyWolf,
+    ParticleSwarm,
+)
+from ground_station.data import build_drones, build_stations
+from ground_station.scenarios import moving_drones_and_stations
+
+
+class CoverageTests(unittest.TestCase):
+    def setUp(self):
+        self.problem = moving_drones_and_stations(num_drones=20, num_stations=12, coverage_radius=250)
+
+    def test_feasible_pairs_match_brute_force(self):
+        for idx, drone in enumerate(self.problem.drones):
+            expected = [
+                s
+                for s, station in enumerate(self.problem.stations)
+                if math.hypot(drone.x - station.x, drone.y - station.y) <= station.coverage_radius
+            ]
+            self.assertEqual(list(self.problem.feasible_stations(idx)), expected)
+
+    def test_out_of_coverage_assignment_is_penalized(self):
+        stations = build_stations([("A", (0, 0)), ("B", (1000, 1000))], coverage_radius=10)
+        problem = AssignmentProblem(drones=build_drones([(1, 1)]), stations=stations)
+        self.assertFalse(problem.is_feasible(0, 1))
+        self.assertEqual(problem.evaluate([1]), problem.unassigned_penalty)
+        self.assertLess(problem.evaluate([0]), problem.unassigned_penalty)
+
+    def test_solvers_only_use_feasible_pairs(self):
+        solvers = [
+            ParticleSwarm(num_particles=6, max_iterations=5),
+            GreyWolf(num_wolves=6, max_iterations=5),
+            Genetic(population_size=6, max_generations=5),
+            AntColony(num_ants=6, num_iterations=5),
+            ArtificialBeeColony(num_employed_bees=4, num_onlooker_bees=4, max_iterations=5),
+            Grasshopper(population_size=6, max_iterations=5),
+            DifferentialEvolution(population_size=6, max_iterations=5),
+        ]
+        for solver in solvers:
+            result = solver.solve(self.problem)
+            for idx, station_idx in enumerate(result.assignments):
+                if station_idx >= 0:
+                    self.assertTrue(self.problem.is_feasible(idx, station_idx), type(solver).__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
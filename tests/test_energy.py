@@ -0,0 +1,37 @@
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.data import CATALOG, build_drones, build_stations
+
+
+class EnergyModelTests(unittest.TestCase):
+    def setUp(self):
+        # One DJI Mavic Air 2 (68 km/h) 0.68 km from station A and 3.4 km from station B.
+        self.drones = build_drones([(0, 0)])
+        self.stations = build_stations([("A", (680, 0)), ("B", (3400, 0))])
+
+    def test_energy_term_follows_power_model(self):
+        problem = AssignmentProblem(self.drones, self.stations, energy_weight=2.0)
+        needed = 0.01 * CATALOG.total_power[0]  # 0.68 km at 68 km/h = 0.01 h
+        self.assertAlmostEqual(problem.energy_needed(0, 0), needed)
+
+        battery = self.drones[0].max_battery_level
+        base = AssignmentProblem(self.drones, self.stations).evaluate([(0, battery)])
+        self.assertAlmostEqual(problem.evaluate([(0, battery)]), base + 2.0 * needed / battery)
+
+    def test_unreachable_station_is_penalized(self):
+        problem = AssignmentProblem(self.drones, self.stations, energy_weight=1.0)
+        self.assertFalse(problem.can_reach(0, 1, battery_level=10.0))
+        self.assertTrue(problem.can_reach(0, 1))
+        self.assertEqual(problem.evaluate([(1, 10.0)]), problem.unassigned_penalty)
+        self.assertEqual(problem.evaluate([(0, 0.5)]), problem.unassigned_penalty)
+
+    def test_disabled_by_default(self):
+        problem = AssignmentProblem(self.drones, self.stations)
+        self.assertLess(problem.evaluate([(1, 10.0)]), problem.unassigned_penalty)
+        problem.energy_weight = 1.0
+        self.assertEqual(problem.evaluate([(1, 10.0)]), problem.unassigned_penalty)
+
+
+if __name__ == "__main__":
+    unittest.main()
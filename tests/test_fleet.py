@@ -0,0 +1,35 @@
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.fleet import Fleet, StationSet
+from ground_station.scenarios import moving_drones_and_stations, static_scenario
+
+
+class FleetTests(unittest.TestCase):
+    def test_views_round_trip_dataclasses(self):
+        problem = moving_drones_and_stations(coverage_radius=300)
+        drones = list(problem.drones)
+        stations = list(problem.stations)
+
+        self.assertEqual(Fleet.from_drones(drones).drones, drones)
+        self.assertEqual(StationSet.from_stations(stations).stations, stations)
+        self.assertEqual(problem.drones[-1], drones[-1])
+        with self.assertRaises(IndexError):
+            problem.drones[len(drones)]
+
+    def test_problem_accepts_columns_directly(self):
+        problem = static_scenario()
+        columnar = AssignmentProblem(drones=problem.fleet, stations=problem.station_set)
+        solution = problem.random_assignment(randomize_battery=True)
+        self.assertEqual(columnar.evaluate(solution), problem.evaluate(solution))
+
+    def test_travel_time_matrix_matches_direct_evaluation(self):
+        problem = static_scenario()
+        solution = problem.random_assignment(randomize_battery=True)
+        direct = problem.evaluate(solution)
+        problem.travel_time_matrix()
+        self.assertAlmostEqual(problem.evaluate(solution), direct)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import random
+import unittest
+
+from ground_station.data import station_name
+from ground_station.scenarios import LAYOUTS, generate_positions, generated_scenario
+
+
+class GeneratedScenarioTests(unittest.TestCase):
+    def test_station_names_go_past_the_alphabet(self):
+        self.assertEqual(station_name(0), "Istasyon A")
+        self.assertEqual(station_name(25), "Istasyon Z")
+        self.assertEqual(station_name(26), "Istasyon AA")
+        self.assertEqual(station_name(27), "Istasyon AB")
+        self.assertEqual(station_name(701), "Istasyon ZZ")
+        self.assertEqual(station_name(702), "Istasyon AAA")
+
+    def test_layouts_stay_inside_area(self):
+        for layout in LAYOUTS:
+            xs, ys = generate_positions(2000, layout, 500.0, random.Random(5))
+            self.assertEqual(len(xs), 2000)
+            self.assertTrue(all(0 <= v <= 500 for v in xs), layout)
+            self.assertTrue(all(0 <= v <= 500 for v in ys), layout)
+
+    def test_generated_scenario_is_reproducible(self):
+        first = generated_scenario(num_drones=50, num_stations=40, layout="clustered", seed=9)
+        second = generated_scenario(num_drones=50, num_stations=40, layout="clustered", seed=9)
+        self.assertEqual(first.drones, second.drones)
+        self.assertEqual(len({station.name for station in first.stations}), 40)
+
+    def test_rejects_unknown_layout(self):
+        with self.assertRaises(ValueError):
+            generated_scenario(num_drones=5, num_stations=5, layout="spiral")
+
+
+if __name__ == "__main__":
+    unittest.main()
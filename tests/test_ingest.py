@@ -0,0 +1,79 @@
+import json
+import os
+import pickle
+import tempfile
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.data import CATALOG, DRONE_CATALOG, build_stations
+from ground_station.ingest import ingest_to_scenario_file, iter_telemetry
+
+
+class TelemetryIngestTests(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rows = [
+            {"id": f"d{idx}", "model": DRONE_CATALOG[idx % len(DRONE_CATALOG)]["name"], "x": idx, "y": 2 * idx,
+             "battery": 30.5}
+            for idx in range(25)
+        ]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_csv(self):
+        path = os.path.join(self.tmp.name, "feed.csv")
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write("model,id,x,y,battery\n")
+            for row in self.rows:
+                handle.write(f"{row['model']},{row['id']},{row['x']},{row['y']},{row['battery']}\n")
+        return path
+
+    def _write_jsonl(self):
+        path = os.path.join(self.tmp.name, "feed.jsonl")
+        with open(path, "w", encoding="utf-8") as handle:
+            for row in self.rows:
+                handle.write(json.dumps(row) + "\n")
+        return path
+
+    def test_csv_and_jsonl_yield_same_chunks(self):
+        csv_chunks = list(iter_telemetry(self._write_csv(), chunk_size=10))
+        jsonl_chunks = list(iter_telemetry(self._write_jsonl(), chunk_size=10))
+
+        self.assertEqual([len(chunk) for chunk in csv_chunks], [10, 10, 5])
+        for a, b in zip(csv_chunks, jsonl_chunks):
+            self.assertEqual(a.ids, b.ids)
+            self.assertEqual(a.model, b.model)
+            self.assertEqual(a.x, b.x)
+            self.assertEqual(a.y, b.y)
+        self.assertEqual(csv_chunks[0].model[1], 1)
+
+    def test_unknown_model_is_rejected(self):
+        self.rows[3]["model"] = "Paper Plane"
+        with self.assertRaises(ValueError):
+            list(iter_telemetry(self._write_jsonl()))
+
+    def test_ingest_to_scenario_file(self):
+        out = os.path.join(self.tmp.name, "fleet.gss")
+        stations = build_stations([("A", (0, 0)), ("B", (10, 10))])
+        count = ingest_to_scenario_file(self._write_csv(), stations, out, chunk_size=7)
+
+        problem = AssignmentProblem.from_scenario_file(out)
+        self.assertEqual(count, 25)
+        self.assertEqual(len(problem.drones), 25)
+        self.assertEqual(problem.drones[24].position, (24.0, 48.0))
+        self.assertEqual(problem.drones[1].model, DRONE_CATALOG[1]["name"])
+        self.assertEqual(list(problem.fleet.max_battery), [CATALOG.battery_wh[idx] for idx in problem.fleet.model])
+        self.assertEqual(list(problem.fleet.battery_level), [30.5] * 25)
+        self.assertEqual(list(pickle.loads(pickle.dumps(problem)).fleet.battery_level), [30.5] * 25)
+
+    def test_invalid_battery_is_rejected(self):
+        for value in ("-1", "nan", "inf"):
+            with self.subTest(battery=value):
+                self.rows[3]["battery"] = value
+                with self.assertRaisesRegex(ValueError, "feed.csv:5"):
+                    list(iter_telemetry(self._write_csv()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest import mock
+
+from ground_station.algorithms import (
+    AntColony,
+    ArtificialBeeColony,
+    DifferentialEvolution,
+    Genetic,
+    Grasshopper,
+    GreyWolf,
+    ParticleSwarm,
+)
+from ground_station.algorithms.instrumentation import SolverTrace
+from ground_station.scenarios import generated_scenario
+
+
+class InstrumentationTests(unittest.TestCase):
+    def setUp(self):
+        self.problem = generated_scenario(num_drones=30, num_stations=10, seed=6)
+
+    def test_every_solver_records_one_entry_per_iteration(self):
+        solvers = [
+            ParticleSwarm(max_iterations=4, instrument=True),
+            GreyWolf(max_iterations=4, instrument=True),
+            AntColony(num_iterations=4, num_ants=5, instrument=True),
+            Genetic(max_generations=4, instrument=True),
+            ArtificialBeeColony(max_iterations=4, instrument=True),
+            Grasshopper(max_iterations=4, instrument=True),
+            DifferentialEvolution(max_iterations=4, instrument=True),
+        ]
+        for solver in solvers:
+            with self.subTest(solver=type(solver).__name__):
+                trace = solver.solve(self.problem).trace
+                self.assertEqual(len(trace["iteration_ns"]), 4)
+                self.assertTrue(all(count > 0 for count in trace["evaluations"]))
+                self.assertTrue(all(0.0 <= value <= 1.0 for value in trace["diversity"]))
+                self.assertTrue(all(value > 0 for value in trace["mean_fitness"]))
+                self.assertNotIn("peak_memory_bytes", trace)
+
+    def test_recorded_genes_are_the_scored_genes(self):
+        record = SolverTrace.record
+        recorded = []
+
+        def spy(trace, fitnesses, population=None):
+            recorded.append((list(fitnesses), [list(member) for member in population]))
+            record(trace, fitnesses, population)
+
+        for solver in (ParticleSwarm(max_iterations=3, instrument=True),
+                       Grasshopper(max_iterations=3, instrument=True)):
+            with self.subTest(solver=type(solver).__name__):
+                recorded.clear()
+                with mock.patch.object(SolverTrace, "record", spy):
+                    solver.solve(self.problem)
+                self.assertEqual(len(recorded), 3)
+                for fitnesses, population in recorded:
+                    self.assertEqual(fitnesses, [self.problem.evaluate(member) for member in population])
+
+    def test_counters_track_cache_hits_and_repairs(self):
+        self.problem.travel_time_matrix()
+        trace = ParticleSwarm(max_iterations=3, instrument=True).solve(self.problem).trace
+        self.assertEqual(list(trace["cache_hits"]), list(trace["evaluations"]))
+        self.assertGreater(sum(trace["repairs"]), 0)
+
+    def test_memory_tracing(self):
+        trace = Genetic(max_generations=2, trace_memory=True).solve(self.problem).trace
+        self.assertEqual(len(trace["peak_memory_bytes"]), 2)
+        self.assertTrue(all(peak > 0 for peak in trace["peak_memory_bytes"]))
+
+    def test_disabled_by_default(self):
+        self.assertEqual(ParticleSwarm(max_iterations=2).solve(self.problem).trace, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import itertools
+import pickle
+import random
+import time
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.algorithms.pso import ParticleSwarm
+from ground_station.bounds import min_cost_assignment
+from ground_station.data import build_stations
+from ground_station.scenarios import generated_scenario
+
+
+def brute_force_optimum(problem):
+    choices = list(range(-1, problem.num_stations))
+    return min(
+        problem.evaluate(list(genes)) for genes in itertools.product(choices, repeat=problem.num_drones)
+    )
+
+
+class LowerBoundTests(unittest.TestCase):
+    def test_hungarian_matches_brute_force(self):
+        rng = random.Random(3)
+        for _ in range(20):
+            cost = [[rng.uniform(0, 10) for _ in range(5)] for _ in range(3)]
+            best = min(
+                sum(cost[row][col] for row, col in enumerate(cols))
+                for cols in itertools.permutations(range(5), 3)
+            )
+            self.assertAlmostEqual(min_cost_assignment(cost), best)
+
+    def test_small_instance_bound_is_exact(self):
+        problem = generated_scenario(num_drones=4, num_stations=3, area_size=1500, seed=11)
+        self.assertAlmostEqual(problem.lower_bound(), brute_force_optimum(problem))
+
+        problem.energy_weight = 1.0
+        self.assertAlmostEqual(problem.lower_bound(), brute_force_optimum(problem))
+
+    def test_bound_holds_on_large_instances(self):
+        for unique, radius in ((True, None), (False, None), (True, 1500.0)):
+            scenario = generated_scenario(num_drones=200, num_stations=40, seed=5, coverage_radius=radius)
+            problem = AssignmentProblem(scenario.fleet, scenario.station_set, require_unique_station=unique)
+            result = ParticleSwarm(num_particles=5, max_iterations=5).solve(problem)
+            self.assertLessEqual(result.compute_lower_bound(), result.fitness)
+            self.assertGreaterEqual(result.gap, 0.0)
+
+    def test_bound_tracks_moving_drones(self):
+        problem = generated_scenario(num_drones=100, num_stations=30, seed=8)
+        problem.lower_bound()
+        problem.move_drones([(0, (problem.station_set.x[0], problem.station_set.y[0]))])
+        fresh = generated_scenario(num_drones=100, num_stations=30, seed=8)
+        fresh.move_drones([(0, (fresh.station_set.x[0], fresh.station_set.y[0]))])
+        self.assertAlmostEqual(problem.lower_bound(), fresh.lower_bound())
+
+    def test_gap_tolerance_stops_early(self):
+        problem = generated_scenario(num_drones=3, num_stations=6, area_size=1000, seed=4)
+        result = ParticleSwarm(num_particles=10, max_iterations=500, gap_tolerance=1.0).solve(problem)
+        self.assertEqual(len(result.history["best_fitness"]), 2)
+
+    def test_gap_property(self):
+        problem = generated_scenario(num_drones=5, num_stations=5, seed=1)
+        result = ParticleSwarm(num_particles=5, max_iterations=3).solve(problem)
+        self.assertIsNone(result.gap)
+        expected = (result.fitness - problem.lower_bound()) / result.fitness
+        result.compute_lower_bound()
+        self.assertAlmostEqual(result.gap, expected)
+
+    def test_bound_is_computed_only_on_request(self):
+        problem = generated_scenario(num_drones=60, num_stations=20, seed=2)
+        result = ParticleSwarm(num_particles=4, max_iterations=2).solve(problem)
+        repr(result)
+        self.assertEqual(result, pickle.loads(pickle.dumps(result)))
+        self.assertIsNone(problem._lower_bound)
+        self.assertIsNone(result.lower_bound)
+        self.assertIsNone(pickle.loads(pickle.dumps(result)).lower_bound)
+        self.assertAlmostEqual(result.compute_lower_bound(), problem.lower_bound())
+        self.assertEqual(pickle.loads(pickle.dumps(result)).lower_bound, result.lower_bound)
+
+    def test_moving_drones_invalidates_best_costs(self):
+        problem = generated_scenario(num_drones=100, num_stations=30, seed=8)
+        problem.lower_bound()
+        problem.move_drones([(0, (1.0, 1.0))])
+        self.assertIsNone(problem._best_costs)
+
+    def test_degenerate_station_layouts_keep_nearest_lookups_fast(self):
+        scenario = generated_scenario(num_drones=3000, num_stations=1, seed=9)
+        colinear = build_stations([(f"S{idx}", (20.0 * idx, 5000.0)) for idx in range(50)])
+        for problem in (scenario, AssignmentProblem(scenario.fleet, colinear)):
+            with self.subTest(num_stations=problem.num_stations):
+                start = time.perf_counter()
+                best = [problem.best_cost(idx) for idx in range(problem.num_drones)]
+                self.assertLess(time.perf_counter() - start, 2.0)
+                for idx in range(0, problem.num_drones, 97):
+                    expected = min(problem.pair_cost(idx, s) for s in range(problem.num_stations))
+                    self.assertAlmostEqual(best[idx], expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+import pickle
+import unittest
+
+from ground_station.data import CATALOG, DRONE_CATALOG, build_drones, build_fleet, build_stations
+from ground_station.fleet import Fleet
+from ground_station.models import Drone, Station
+
+
+class ModelTests(unittest.TestCase):
+    def test_models_are_slotted(self):
+        drone = Drone("DJI Mavic Air 2", 68, 40.4, 1.0, 2.0)
+        station = Station("A", 3.0, 4.0)
+        self.assertFalse(hasattr(drone, "__dict__"))
+        self.assertFalse(hasattr(station, "__dict__"))
+        self.assertEqual(pickle.loads(pickle.dumps(drone)), drone)
+        self.assertEqual(pickle.loads(pickle.dumps(drone)).position, (1.0, 2.0))
+
+    def test_position_is_a_stored_slot(self):
+        self.assertIn("position", Drone.__slots__)
+        self.assertIn("position", Station.__slots__)
+        drone = Drone("DJI Mavic Air 2", 68, 40.4, 1.0, 2.0)
+        self.assertIs(drone.position, drone.position)
+        self.assertEqual(Station("A", 3.0, 4.0, 5.0).position, (3.0, 4.0))
+        self.assertEqual([d.position for d in Drone.from_arrays("ab", [1, 2], [1, 2], [5.0, 6.0], [7.0, 8.0])],
+                         [(5.0, 7.0), (6.0, 8.0)])
+        self.assertEqual(Station.from_arrays(["A"], iter([1.0]), iter([2.0]))[0].position, (1.0, 2.0))
+
+    def test_from_arrays_matches_constructor(self):
+        drones = Drone.from_arrays(["a", "b"], [10, 20], [5.0, 6.0], [1.0, 2.0], [3.0, 4.0])
+        self.assertEqual(drones, [Drone("a", 10, 5.0, 1.0, 3.0), Drone("b", 20, 6.0, 2.0, 4.0)])
+        stations = Station.from_arrays(["A", "B"], [0.0, 1.0], [2.0, 3.0], [None, 5.0])
+        self.assertEqual(stations, [Station("A", 0.0, 2.0), Station("B", 1.0, 3.0, 5.0)])
+
+    def test_from_arrays_rejects_ragged_columns(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            Drone.from_arrays(["a", "b"], [10, 20], [5.0], [1.0, 2.0], [3.0, 4.0])
+        with self.assertRaisesRegex(ValueError, "same length"):
+            Station.from_arrays(["A"], [0.0, 1.0], [2.0, 3.0])
+
+    def test_builders_use_catalog_and_radius(self):
+        drones = build_drones([(0, 0), (1, 1)])
+        self.assertEqual(drones[1].model, "Parrot Anafi")
+        self.assertAlmostEqual(drones[1].max_battery_level, 6800 * 11.55 / 1000)
+        stations = build_stations([("A", (0, 0))], coverage_radius=25)
+        self.assertEqual(stations[0].coverage_radius, 25)
+        with self.assertRaises(ValueError):
+            build_stations([])
+
+    def test_compiled_catalog_columns(self):
+        self.assertEqual(len(CATALOG), len(DRONE_CATALOG))
+        self.assertEqual(CATALOG.names[3], "DJI Phantom 4 Pro")
+        self.assertEqual(CATALOG.num_propellers[0], 7)
+        self.assertAlmostEqual(CATALOG.total_power[1], 50 * 4 + 8 + 12 + 4 + 2)
+
+    def test_build_fleet_matches_build_drones(self):
+        positions = [(float(i), float(2 * i)) for i in range(14)]
+        fleet = build_fleet([x for x, _ in positions], [y for _, y in positions])
+        self.assertEqual(fleet.drones, build_drones(positions))
+        self.assertEqual(Fleet.from_drones(build_drones(positions)).max_battery, fleet.max_battery)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import random
+import unittest
+from array import array
+from itertools import combinations
+
+from ground_station import motion
+from ground_station.spatial import SpatialHashGrid
+
+
+class MotionKernelTests(unittest.TestCase):
+    def test_integrate_clamps_to_bounds(self):
+        xs = array("d", [0.0, 50.0, 99.0])
+        vxs = array("d", [-5.0, 2.0, 5.0])
+        self.assertEqual(list(motion.integrate(xs, vxs, 1.0, 100.0)), [0.0, 52.0, 100.0])
+
+    def test_near_collisions_match_brute_force(self):
+        rng = random.Random(7)
+        xs = array("d", [rng.uniform(0, 100) for _ in range(400)])
+        ys = array("d", [rng.uniform(0, 100) for _ in range(400)])
+        radius = 3.0
+
+        expected = {
+            (i, j)
+            for i, j in combinations(range(len(xs)), 2)
+            if (xs[i] - xs[j]) ** 2 + (ys[i] - ys[j]) ** 2 < radius * radius
+        }
+        found = motion.near_collisions(xs, ys, radius)
+        self.assertEqual(len(found), len(expected))
+        self.assertEqual(set(found), expected)
+
+    def test_separate_moves_coincident_drones_apart(self):
+        xs = array("d", [10.0, 10.0])
+        ys = array("d", [10.0, 10.0])
+        pairs = motion.near_collisions(xs, ys, 2.0)
+        nudged = motion.separate(xs, ys, pairs, 2.0, (100.0, 100.0), random.Random(0))
+
+        self.assertEqual(nudged, [1])
+        self.assertAlmostEqual(((xs[1] - xs[0]) ** 2 + (ys[1] - ys[0]) ** 2) ** 0.5, 2.0)
+
+    def test_grid_radius_query(self):
+        xs, ys = [0.0, 3.0, 10.0], [0.0, 4.0, 10.0]
+        grid = SpatialHashGrid.build(xs, ys, 5.0)
+        self.assertEqual(sorted(grid.query_radius(xs, ys, 0.0, 0.0, 5.0)), [0, 1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from ground_station import AssignmentProblem
+from ground_station.algorithms import AntColony, Genetic, ParticleSwarm, Portfolio
+from ground_station.scenario_file import save_problem
+from ground_station.scenarios import generated_scenario
+
+
+class PortfolioTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.problem = generated_scenario(num_drones=60, num_stations=20, seed=7)
+
+    def test_returns_best_member(self):
+        members = [ParticleSwarm(num_particles=4, max_iterations=5), AntColony(num_ants=4, num_iterations=5)]
+        result = Portfolio(members, use_processes=False).solve(self.problem)
+        self.assertEqual([stats.name for stats in result.members], ["ParticleSwarm", "AntColony"])
+        self.assertEqual(result.fitness, min(stats.fitness for stats in result.members))
+        self.assertEqual(result.fitness, self.problem.evaluate(result.assignments))
+        self.assertGreaterEqual(result.fitness, result.compute_lower_bound())
+        self.assertIsNone(members[0].time_limit)
+
+    def test_losers_are_cut(self):
+        members = [Genetic(population_size=4, max_generations=10**6), AntColony(num_iterations=10**6)]
+        result = Portfolio(members, time_limit=2.0, cutoff=0.0, grace=0.0, use_processes=False).solve(self.problem)
+        self.assertLess(result.elapsed_seconds, 5.0)
+        self.assertTrue(any(stats.cut for stats in result.members))
+        self.assertFalse(next(s for s in result.members if s.name == result.winner).cut)
+
+    def test_sequential_thread_members_are_reproducible(self):
+        def run():
+            random.seed(11)
+            members = [ParticleSwarm(num_particles=4, max_iterations=5), Genetic(population_size=4, max_generations=5)]
+            with mock.patch("random.seed") as reseed:
+                result = Portfolio(members, workers=1, use_processes=False).solve(self.problem)
+            reseed.assert_not_called()
+            return result
+
+        first, second = run(), run()
+        self.assertEqual(first.assignments, second.assignments)
+        self.assertEqual([s.fitness for s in first.members], [s.fitness for s in second.members])
+
+    def test_process_members(self):
+        members = [Genetic(population_size=4, max_generations=3), Genetic(population_size=6, max_generations=3)]
+        result = Portfolio(members, workers=2).solve(self.problem)
+        self.assertEqual([stats.name for stats in result.members], ["Genetic", "Genetic#2"])
+        self.assertEqual(len(result.assignments), 60)
+
+    def test_grace_iterations_without_time_limit(self):
+        # One worker runs the members in turn, so the weak second member races the first one's final best.
+        for grace_iterations in (1, 6):
+            members = [AntColony(num_ants=4, num_iterations=10), Genetic(population_size=4, max_generations=10**6)]
+            result = Portfolio(
+                members, cutoff=0.0, grace_iterations=grace_iterations, workers=1, use_processes=False
+            ).solve(self.problem)
+            loser = result.members[1]
+            self.assertTrue(loser.cut)
+            self.assertEqual(loser.iterations, grace_iterations)
+
+    def test_process_members_on_a_scenario_file_problem(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fleet.gss")
+            save_problem(path, self.problem)
+            problem = AssignmentProblem.from_scenario_file(path)
+            members = [Genetic(population_size=4, max_generations=3), ParticleSwarm(num_particles=4, max_iterations=3)]
+            result = Portfolio(members, workers=2).solve(problem)
+        self.assertEqual(len(result.assignments), 60)
+        self.assertEqual(result.fitness, min(stats.fitness for stats in result.members))
+
+    def test_rejects_bad_settings(self):
+        with self.assertRaises(ValueError):
+            Portfolio([])
+        with self.assertRaises(ValueError):
+            Portfolio(grace=1.5)
+        with self.assertRaises(ValueError):
+            Portfolio(grace_iterations=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+import os
+import tempfile
+import unittest
+
+from ground_station.algorithms import ParticleSwarm
+from ground_station.profiling import profile_call
+from ground_station.scenarios import generated_scenario
+
+
+class ProfilingTests(unittest.TestCase):
+    def setUp(self):
+        self.problem = generated_scenario(num_drones=100, num_stations=20, seed=2)
+        self.solver = ParticleSwarm(max_iterations=20)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_cprofile_reports_package_functions(self):
+        path = os.path.join(self.tmp.name, "solve.pstats")
+        result, report = profile_call(lambda: self.solver.solve(self.problem), "cprofile", path)
+        self.assertGreater(result.fitness, 0)
+        self.assertTrue(os.path.getsize(path) > 0)
+        labels = [label for label, _, _ in report.hot_functions]
+        self.assertTrue(any("(evaluate)" in label for label in labels))
+        self.assertTrue(all(label.startswith("ground_station") for label in labels))
+        self.assertFalse(any("profiling.py" in label for label in labels))
+
+    def test_sampling_writes_collapsed_stacks(self):
+        path = os.path.join(self.tmp.name, "solve.collapsed")
+        _, report = profile_call(lambda: self.solver.solve(self.problem), "sampling", path, interval=0.0005)
+        with open(path, encoding="utf-8") as handle:
+            lines = handle.read().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(" ", 1)
+        self.assertGreater(int(count), 0)
+        self.assertIn(";", stack)
+        self.assertTrue(any("(solve)" in label for label, _, _ in report.hot_functions))
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            profile_call(lambda: None, "perf", os.path.join(self.tmp.name, "out"))
+
+
+if __name__ == "__main__":
+    unittest.main()
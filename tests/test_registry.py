@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+from ground_station.algorithms import DifferentialEvolution, Portfolio
+from ground_station.algorithms.registry import SOLVERS, SolverConfig, build_solver, load_config
+
+
+class RegistryTests(unittest.TestCase):
+    def test_every_solver_builds_with_iterations_and_population(self):
+        for name, spec in SOLVERS.items():
+            solver = build_solver(name, iterations=7, population=6 if spec.population else None)
+            if spec.iterations:
+                self.assertEqual(getattr(solver, spec.iterations), 7)
+            for parameter in spec.population:
+                self.assertEqual(getattr(solver, parameter), 6)
+
+    def test_schema_is_typed(self):
+        schema = SOLVERS["dea"].schema()
+        self.assertEqual(schema["scaling_factor"].kind, float)
+        self.assertTrue(schema["time_limit"].nullable)
+        solver = build_solver("dea", {"scaling_factor": 1, "time_limit": None})
+        self.assertIsInstance(solver, DifferentialEvolution)
+        self.assertEqual(solver.scaling_factor, 1.0)
+
+        for params in ({"scaling_factor": "big"}, {"population_size": 2.5}, {"instrument": 1}, {"unknown": 1}):
+            with self.assertRaises(ValueError):
+                build_solver("dea", params)
+        with self.assertRaises(ValueError):
+            build_solver("dea", population=3)
+        with self.assertRaises(ValueError):
+            build_solver("simplex")
+
+    def test_portfolio_members_inherit_iterations(self):
+        members = [{"solver": "ga"}, {"solver": "aco", "iterations": 2}]
+        solver = SolverConfig.from_dict({"solver": "portfolio", "iterations": 9, "params": {"members": members}}).build()
+        self.assertIsInstance(solver, Portfolio)
+        self.assertEqual((solver.members[0].max_generations, solver.members[1].num_iterations), (9, 2))
+        self.assertEqual(len(build_solver("portfolio", iterations=3).members), 4)
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def _write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(text)
+        return path
+
+    def test_load_json(self):
+        config = {"solver": "aco", "iterations": 12, "population": 8, "params": {"evaporation_rate": 0.3}}
+        json_path = self._write("solver.json", json.dumps(config))
+        solver = load_config(json_path).build()
+        self.assertEqual((solver.num_iterations, solver.num_ants, solver.evaporation_rate), (12, 8, 0.3))
+        self.assertEqual(load_config(json_path).to_dict(), config)
+
+        self._write("solver.json", json.dumps({"solver": "aco", "rate": 1}))
+        with self.assertRaises(ValueError):
+            load_config(json_path)
+
+    @unittest.skipIf(tomllib is None, "tomllib needs Python 3.11+")
+    def test_load_toml(self):
+        toml_path = self._write(
+            "solver.toml", 'solver = "aco"\niterations = 12\npopulation = 8\n\n[params]\nevaporation_rate = 0.3\n'
+        )
+        solver = load_config(toml_path).build()
+        self.assertEqual((solver.num_iterations, solver.num_ants, solver.evaporation_rate), (12, 8, 0.3))
+
+    @unittest.skipIf(tomllib is not None, "tomllib is available")
+    def test_toml_without_tomllib_is_a_value_error(self):
+        with self.assertRaisesRegex(ValueError, "JSON"):
+            load_config(self._write("solver.toml", 'solver = "aco"\n'))
+
+if __name__ == "__main__":
+    unittest.main()
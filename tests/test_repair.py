@@ -0,0 +1,110 @@
+import math
+import random
+import unittest
+
+from ground_station.algorithms import DifferentialEvolution, Genetic, GreyWolf, ParticleSwarm
+from ground_station.algorithms.repair import StationPool
+from ground_station.scenarios import generated_scenario
+
+
+class StationPoolTests(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.problem = generated_scenario(num_drones=40, num_stations=12, seed=3)
+        self.covered = generated_scenario(num_drones=40, num_stations=30, seed=3, coverage_radius=3000)
+
+    def test_take_release_and_reset(self):
+        pool = StationPool(self.problem)
+        self.assertTrue(pool.take(4))
+        self.assertFalse(pool.take(4))
+        self.assertFalse(pool.is_free(4))
+        self.assertEqual(len(pool), 11)
+        self.assertNotIn(4, pool.available(0))
+        pool.release(4)
+        pool.release(4)
+        self.assertTrue(pool.is_free(4))
+        for station_idx in range(12):
+            pool.take(station_idx)
+        self.assertEqual(pool.pick(0), -1)
+        pool.reset()
+        self.assertEqual(sorted(pool.available(0)), list(range(12)))
+
+    def test_picks_are_free_and_feasible(self):
+        pool = StationPool(self.covered)
+        for drone_idx in range(self.covered.num_drones):
+            station_idx = pool.pick(drone_idx)
+            if station_idx < 0:
+                self.assertEqual(pool.available(drone_idx), [])
+                continue
+            self.assertTrue(self.covered.is_feasible(drone_idx, station_idx))
+            self.assertTrue(pool.take(station_idx))
+
+    def test_assign_repairs_duplicates_and_counts_them(self):
+        pool = StationPool(self.problem)
+        repairs = self.problem.counters.repairs
+        self.assertEqual(pool.assign(0, 5), 5)
+        repaired = pool.assign(1, 5)
+        self.assertNotIn(repaired, (5, -1))
+        self.assertEqual(pool.assign(2, -1), -1)
+        self.assertEqual(self.problem.counters.repairs, repairs + 1)
+
+    def test_nearest_mode_picks_the_closest_free_station(self):
+        for problem in (self.problem, self.covered):
+            pool = StationPool(problem, nearest=True)
+            for drone_idx in range(problem.num_drones):
+                x, y = problem.fleet.x[drone_idx], problem.fleet.y[drone_idx]
+                free = pool.available(drone_idx)
+                expected = min(
+                    (math.hypot(problem.station_set.x[s] - x, problem.station_set.y[s] - y) for s in free),
+                    default=None,
+                )
+                station_idx = pool.pick(drone_idx)
+                if expected is None:
+                    self.assertEqual(station_idx, -1)
+                    continue
+                distance = math.hypot(problem.station_set.x[station_idx] - x, problem.station_set.y[station_idx] - y)
+                self.assertAlmostEqual(distance, expected)
+                pool.take(station_idx)
+
+    def test_solvers_with_nearest_repair_keep_assignments_unique_and_feasible(self):
+        solvers = [
+            ParticleSwarm(num_particles=5, max_iterations=3, nearest_repair=True),
+            GreyWolf(num_wolves=5, max_iterations=3, nearest_repair=True),
+            Genetic(population_size=6, max_generations=3, nearest_repair=True),
+            DifferentialEvolution(population_size=5, max_iterations=3, nearest_repair=True),
+        ]
+        for solver in solvers:
+            with self.subTest(solver=type(solver).__name__):
+                assignments = solver.solve(self.covered).assignments
+                used = [station_idx for station_idx in assignments if station_idx >= 0]
+                self.assertEqual(len(used), len(set(used)))
+                self.assertTrue(all(self.covered.is_feasible(i, s) for i, s in enumerate(assignments) if s >= 0))
+
+
+class OccupancyTests(unittest.TestCase):
+    def setUp(self):
+        self.problem = generated_scenario(num_drones=20, num_stations=600, seed=5)
+
+    def test_evaluate_reuses_one_cleared_buffer(self):
+        duplicated = [7] * 20
+        distinct = list(range(20))
+        first = self.problem.evaluate(duplicated)
+        self.assertEqual(self.problem.evaluate(duplicated), first)
+        clean = self.problem.evaluate(distinct)
+        self.assertLess(clean, first)
+        self.assertEqual(self.problem.evaluate(distinct), clean)
+        self.assertEqual(len(self.problem._occupancy), 1)
+        self.assertFalse(any(self.problem._occupancy[0]))
+
+    def test_pool_reset_clears_sparse_and_dense_occupancy(self):
+        pool = StationPool(self.problem)
+        for count in (1, 300):
+            for station_idx in range(count):
+                pool.take(station_idx)
+            pool.reset()
+            self.assertEqual(len(pool), 600)
+            self.assertFalse(any(pool._taken))
+
+
+if __name__ == "__main__":
+    unittest.main()
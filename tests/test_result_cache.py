@@ -0,0 +1,108 @@
+import argparse
+import os
+import random
+import tempfile
+import unittest
+
+from ground_station.algorithms import ParticleSwarm
+from ground_station.result_cache import ResultCache
+from ground_station.scenarios import generated_scenario
+from run import cache_tag
+
+
+class ResultCacheTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".sqlite")
+        os.close(handle)
+        self.problem = generated_scenario(num_drones=20, num_stations=8, seed=3)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def solve(self, solver, seed):
+        random.seed(seed)
+        return solver.solve(self.problem)
+
+    def test_round_trip_and_key(self):
+        solver = ParticleSwarm(num_particles=4, max_iterations=3, instrument=True)
+        result = self.solve(solver, 1)
+        with ResultCache(self.path) as cache:
+            self.assertIsNone(cache.get(self.problem, solver, 1))
+            cache.put(self.problem, solver, 1, result)
+
+        with ResultCache(self.path) as cache:
+            cached = cache.get(self.problem, solver, 1)
+            self.assertEqual(cached.assignments, result.assignments)
+            self.assertEqual(cached.fitness, result.fitness)
+            self.assertEqual(cached.trace, result.trace)
+            self.assertIsNone(cache.get(self.problem, solver, 2))
+            self.assertIsNone(cache.get(self.problem, ParticleSwarm(num_particles=5, max_iterations=3), 1))
+            self.assertEqual(cache.stats()["hits"], 1)
+
+    def test_changed_problem_is_stale(self):
+        solver = ParticleSwarm(num_particles=4, max_iterations=2)
+        with ResultCache(self.path) as cache:
+            cache.put(self.problem, solver, 1, self.solve(solver, 1), tag="generated")
+            self.problem.move_drones([(0, (5.0, 5.0))])
+            self.assertIsNone(cache.get(self.problem, solver, 1))
+            self.assertEqual(cache.purge_stale("generated", self.problem), 1)
+            self.assertEqual(cache.stats()["entries"], 0)
+
+    def test_alternating_generated_instances_stay_cached(self):
+        solver = ParticleSwarm(num_particles=4, max_iterations=2)
+        defaults = dict(
+            scenario="generated",
+            scenario_file=None,
+            drones=20,
+            stations=8,
+            layout="uniform",
+            coverage_radius=None,
+            energy_weight=0.0,
+        )
+        with ResultCache(self.path) as cache:
+            for seed in (1, 2, 1):
+                args = argparse.Namespace(seed=seed, **defaults)
+                problem = generated_scenario(num_drones=20, num_stations=8, seed=seed)
+                self.assertEqual(cache.purge_stale(cache_tag(args), problem), 0)
+                if cache.get(problem, solver, seed) is None:
+                    random.seed(seed)
+                    cache.put(problem, solver, seed, solver.solve(problem), tag=cache_tag(args))
+            self.assertEqual((cache.stats()["hits"], cache.stats()["entries"]), (1, 2))
+        changed = argparse.Namespace(seed=1, **dict(defaults, layout="clustered"))
+        self.assertNotEqual(cache_tag(changed), cache_tag(argparse.Namespace(seed=1, **defaults)))
+
+    def test_scenario_file_runs_with_different_energy_weights_stay_cached(self):
+        solver = ParticleSwarm(num_particles=4, max_iterations=2)
+        scenario_file = os.path.join(os.path.dirname(self.path), "fleet.gss")
+        with ResultCache(self.path) as cache:
+            for energy_weight in (0.0, 1.5, 0.0, 1.5):
+                args = argparse.Namespace(scenario_file=scenario_file, scenario="static", seed=1,
+                                          energy_weight=energy_weight)
+                problem = generated_scenario(num_drones=20, num_stations=8, seed=1)
+                problem.energy_weight = energy_weight
+                self.assertEqual(cache.purge_stale(cache_tag(args), problem), 0)
+                if cache.get(problem, solver, 1) is None:
+                    random.seed(1)
+                    cache.put(problem, solver, 1, solver.solve(problem), tag=cache_tag(args))
+            self.assertEqual((cache.stats()["hits"], cache.stats()["entries"]), (2, 2))
+
+    def test_evicts_least_recently_used(self):
+        solver = ParticleSwarm(num_particles=4, max_iterations=2)
+        result = self.solve(solver, 1)
+        with ResultCache(self.path) as cache:
+            cache.put(self.problem, solver, 1, result)
+            entry_size = cache.stats()["bytes"]
+        with ResultCache(self.path, max_bytes=int(entry_size * 2.5)) as cache:
+            cache.put(self.problem, solver, 2, result)
+            cache.get(self.problem, solver, 1)
+            cache.put(self.problem, solver, 3, result)
+            self.assertEqual(cache.stats()["entries"], 2)
+            self.assertIsNotNone(cache.get(self.problem, solver, 1))
+            self.assertIsNone(cache.get(self.problem, solver, 2))
+
+        with self.assertRaises(ValueError):
+            ResultCache(self.path, max_bytes=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks.scaling import build_tasks, fit_exponent, log_grid, run_tasks, summarize, write_report
+
+
+class ScalingBenchmarkTests(unittest.TestCase):
+    def test_log_grid(self):
+        self.assertEqual(log_grid(10, 1000, 3), [10, 100, 1000])
+        self.assertEqual(log_grid(5, 5, 4), [5])
+        with self.assertRaises(ValueError):
+            log_grid(0, 10, 3)
+
+    def test_fit_exponent_recovers_power_law(self):
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(fit_exponent(sizes, [3 * s**2 for s in sizes]), 2.0)
+        self.assertIsNone(fit_exponent([10], [1.0]))
+
+    def test_runs_reach_target_and_report(self):
+        # 0.25 is not met by the initial populations on these instances: every run has to iterate.
+        tasks = build_tasks(
+            ["ga", "gwo"],
+            grids={"drones": [5, 10], "population": [4, 8]},
+            base={"drones": 8, "stations": 6, "population": 5},
+            max_iterations=60,
+            time_limit=5.0,
+            target_gap=0.25,
+            layout="uniform",
+            repeats=1,
+            seed=3,
+        )
+        self.assertEqual(len(tasks), 8)
+        runs = run_tasks(tasks, workers=2)
+        self.assertTrue(all(run.reached and run.evaluations > 0 for run in runs))
+        self.assertTrue(all(run.iterations > 1 for run in runs))
+        self.assertEqual({run.size for run in runs if run.dimension == "drones"}, {5, 10})
+
+        exponents = summarize(runs)
+        self.assertEqual(exponents["ga"]["drones"]["reached"], 1.0)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "scaling.json")
+            write_report(path, runs, {"target_gap": 0.25})
+            with open(path, encoding="utf-8") as handle:
+                report = json.load(handle)
+        self.assertEqual(len(report["runs"]), 8)
+        self.assertIn("gwo", report["exponents"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import pickle
+import tempfile
+import unittest
+from array import array
+
+from ground_station import AssignmentProblem
+from ground_station.scenario_file import load_scenario, save_problem
+from ground_station.scenarios import generated_scenario
+
+
+class ScenarioFileTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".gss")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip(self):
+        problem = generated_scenario(num_drones=60, num_stations=30, layout="road-grid", coverage_radius=900)
+        problem.unassigned_penalty = 42.0
+        save_problem(self.path, problem)
+
+        loaded = AssignmentProblem.from_scenario_file(self.path)
+        self.assertEqual(loaded.drones, problem.drones)
+        self.assertEqual(loaded.stations, problem.stations)
+        self.assertEqual(loaded.unassigned_penalty, 42.0)
+        self.assertTrue(loaded.require_unique_station)
+
+    def test_battery_level_is_an_optional_column(self):
+        problem = generated_scenario(num_drones=8, num_stations=4)
+        save_problem(self.path, problem)
+        self.assertIsNone(AssignmentProblem.from_scenario_file(self.path).fleet.battery_level)
+
+        problem.fleet.battery_level = array("d", [float(idx) for idx in range(8)])
+        save_problem(self.path, problem)
+        loaded = AssignmentProblem.from_scenario_file(self.path)
+        self.assertEqual(list(loaded.fleet.battery_level), list(problem.fleet.battery_level))
+        self.assertEqual(list(loaded.fleet.max_battery), list(problem.fleet.max_battery))
+        self.assertEqual(loaded.stations, problem.stations)
+        self.assertEqual(loaded.fingerprint(), problem.fingerprint())
+
+    def test_columns_are_memory_mapped_views(self):
+        problem = generated_scenario(num_drones=10, num_stations=5)
+        save_problem(self.path, problem)
+
+        data = load_scenario(self.path)
+        self.assertIsInstance(data.drone_x, memoryview)
+        self.assertEqual(data.drone_x[3], problem.drones[3].x)
+        self.assertEqual(data.station_names[4], problem.stations[4].name)
+        data.close()
+
+    def test_mapped_problem_pickles_by_reference_to_the_file(self):
+        problem = generated_scenario(num_drones=200, num_stations=12)
+        save_problem(self.path, problem)
+        loaded = AssignmentProblem.from_scenario_file(self.path)
+
+        blob = pickle.dumps(loaded)
+        self.assertLess(len(blob), 200 * 8)  # smaller than a single copied column
+        clone = pickle.loads(blob)
+        self.assertIsInstance(clone.fleet.x, memoryview)
+        self.assertEqual(clone.drones, problem.drones)
+        self.assertEqual(clone.stations, problem.stations)
+
+        loaded.move_drones([(0, (5.0, 6.0))])
+        moved = pickle.loads(pickle.dumps(loaded))
+        self.assertEqual(moved.drones[0].position, (5.0, 6.0))
+        self.assertEqual(moved.drones[1:], problem.drones[1:])
+
+    def test_changed_file_is_copied_when_pickling(self):
+        save_problem(self.path, generated_scenario(num_drones=10, num_stations=5))
+        loaded = AssignmentProblem.from_scenario_file(self.path)
+        drones = list(loaded.drones)
+        os.utime(self.path, ns=(0, 0))
+        clone = pickle.loads(pickle.dumps(loaded))
+        self.assertNotIsInstance(clone.fleet.x, memoryview)
+        self.assertEqual(list(clone.drones), drones)
+
+    def test_rejects_truncated_file(self):
+        save_problem(self.path, generated_scenario(num_drones=10, num_stations=5))
+        size = os.path.getsize(self.path)
+        for keep in (size - 1, size // 2, 40):
+            with self.subTest(keep=keep):
+                with open(self.path, "r+b") as handle:
+                    handle.truncate(keep)
+                with self.assertRaisesRegex(ValueError, "truncated"):
+                    load_scenario(self.path)
+
+    def test_rejects_foreign_file(self):
+        with open(self.path, "wb") as handle:
+            handle.write(b"not a scenario file at all, just bytes")
+        with self.assertRaises(ValueError):
+            load_scenario(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
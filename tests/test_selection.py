@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+
+from ground_station.scenarios import generated_scenario
+from ground_station.selection import FEATURES, MODEL_VERSION, SelectorModel, instance_features
+
+
+def _run(features, algorithm, population, seconds, reached=True):
+    return {"features": features, "algorithm": algorithm, "population": population, "seconds": seconds, "reached": reached}
+
+
+class SelectionTests(unittest.TestCase):
+    def setUp(self):
+        self.small = instance_features(generated_scenario(num_drones=20, num_stations=10, seed=1))
+        self.large = instance_features(generated_scenario(num_drones=400, num_stations=40, seed=1))
+
+    def test_features_are_scale_free(self):
+        self.assertEqual(set(self.small), set(FEATURES))
+        for features in (self.small, self.large):
+            self.assertTrue(0 <= features["coverage"] <= 1)
+            self.assertTrue(0 < features["nearest_cost"] <= features["pair_cost_mean"] <= 1)
+        self.assertAlmostEqual(self.small["station_ratio"], 0.5)
+
+    def test_picks_fastest_configuration_for_similar_instances(self):
+        runs = [
+            _run(self.small, "pso", 10, 0.01),
+            _run(self.small, "aco", 10, 0.20),
+            _run(self.large, "pso", 10, 2.0, reached=False),
+            _run(self.large, "aco", 20, 0.50),
+        ]
+        model = SelectorModel.train(runs, k=1)
+        self.assertEqual(model.predict(self.small)[0].algorithm, "pso")
+        large = model.predict(self.large)[0]
+        self.assertEqual((large.algorithm, large.params), ("aco", {"num_ants": 20}))
+
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        try:
+            model.save(path)
+            self.assertEqual(SelectorModel.load(path).predict(self.large), model.predict(self.large))
+        finally:
+            os.remove(path)
+
+    def test_rejects_runs_without_features(self):
+        with self.assertRaises(ValueError):
+            SelectorModel.train([{"algorithm": "pso", "population": 5, "seconds": 1.0, "reached": True}])
+
+    def test_malformed_model_file_is_a_value_error(self):
+        header = {"version": MODEL_VERSION, "features": list(FEATURES)}
+        example = {"x": [0.0] * len(FEATURES), "algorithm": "pso", "population": 5, "score": 0.0}
+        stats = {"mean": [0.0] * len(FEATURES), "scale": [1.0] * len(FEATURES), "k": 1}
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        try:
+            for payload in (
+                [],
+                {**header, "examples": [example]},
+                {**header, **stats, "examples": [{"x": [0.0]}]},
+                {**header, **stats, "mean": [0.0], "examples": [example]},
+                {**header, **stats, "examples": 3},
+            ):
+                with self.subTest(payload=payload):
+                    with open(path, "w", encoding="utf-8") as out:
+                        json.dump(payload, out)
+                    with self.assertRaises(ValueError):
+                        SelectorModel.load(path)
+        finally:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from ground_station import AssignmentProblem
+from ground_station.scenario_file import save_problem
+from ground_station.scenarios import generated_scenario, static_scenario
+from ground_station.server import AssignmentServer, ServiceClient, problem_from_spec
+
+
+class ProblemSpecTests(unittest.TestCase):
+    def test_inline_spec_uses_catalogue_defaults(self):
+        problem = problem_from_spec(
+            {
+                "drones": [{"model": "DJI Mavic Air 2", "x": 0, "y": 0}],
+                "stations": [{"name": "A", "x": 10, "y": 0, "coverage_radius": 50}],
+                "unassigned_penalty": 7.5,
+            }
+        )
+        self.assertEqual(problem.drones[0].max_speed, 68)
+        self.assertEqual(problem.stations[0].coverage_radius, 50)
+        self.assertEqual(problem.unassigned_penalty, 7.5)
+
+    def test_random_scenarios_are_reproducible(self):
+        first = problem_from_spec({"scenario": "moving-all", "seed": 4})
+        second = problem_from_spec({"scenario": "moving-all", "seed": 4})
+        self.assertEqual(first.drones, second.drones)
+
+    def test_rejects_unknown_specs(self):
+        with self.assertRaises(ValueError):
+            problem_from_spec({"scenario": "nope"})
+        with self.assertRaises(ValueError):
+            problem_from_spec({"drones": [{"model": "Unknown", "x": 0, "y": 0}], "stations": [{"x": 0, "y": 0}]})
+
+
+class FingerprintTests(unittest.TestCase):
+    def test_fingerprint_tracks_fitness_inputs(self):
+        problem = generated_scenario(num_drones=3, num_stations=4)
+        rebuilt = AssignmentProblem(list(problem.drones), list(problem.stations))
+        self.assertEqual(rebuilt.fingerprint(), problem.fingerprint())
+        rebuilt.require_unique_station = False
+        self.assertNotEqual(rebuilt.fingerprint(), problem.fingerprint())
+
+        before = problem.fingerprint()
+        problem.move_drones([(0, (1.0, 2.0))])
+        self.assertNotEqual(problem.fingerprint(), before)
+
+    def test_scenario_file_round_trip_keeps_the_fingerprint(self):
+        problem = generated_scenario(num_drones=60, num_stations=30, layout="road-grid", coverage_radius=900)
+        problem.unassigned_penalty = 42.0
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "fleet.gss")
+            save_problem(path, problem)
+            self.assertEqual(AssignmentProblem.from_scenario_file(path).fingerprint(), problem.fingerprint())
+
+
+class AssignmentServerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = AssignmentServer(workers=2)
+        self.host, self.port = await self.server.start()
+        self.client = ServiceClient(self.host, self.port)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        await self.server.close()
+
+    async def test_register_and_solve(self):
+        info = await self.client.register_problem({"scenario": "static"})
+        self.assertEqual(info["num_drones"], 6)
+
+        params = {"max_iterations": 3, "num_particles": 4}
+        status, first = await self.client.solve(problem_id=info["problem_id"], algorithm="pso", params=params, seed=5)
+        self.assertEqual(status, 200)
+        self.assertEqual(len(first["assignments"]), 6)
+        self.assertGreaterEqual(first["fitness"], first["lower_bound"])
+
+        _, again = await self.client.solve(problem_id=info["problem_id"], algorithm="pso", params=params, seed=5)
+        self.assertEqual(again["assignments"], first["assignments"])
+
+    async def test_concurrent_requests(self):
+        info = await self.client.register_problem({"scenario": "generated", "options": {"num_drones": 30}})
+        clients = [ServiceClient(self.host, self.port) for _ in range(8)]
+        try:
+            responses = await asyncio.gather(
+                *(c.solve(problem_id=info["problem_id"], algorithm="aco", params={"num_iterations": 2}) for c in clients)
+            )
+        finally:
+            for c in clients:
+                await c.close()
+        self.assertTrue(all(status == 200 for status, _ in responses))
+
+    async def test_cancel_running_solve(self):
+        info = await self.client.register_problem({"scenario": "generated", "options": {"num_drones": 300}})
+        other = ServiceClient(self.host, self.port)
+        try:
+            pending = asyncio.create_task(
+                other.solve(problem_id=info["problem_id"], algorithm="ga", params={"max_generations": 100_000}, job_id="j1")
+            )
+            for _ in range(100):
+                if "j1" in self.server.jobs:
+                    break
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.2)
+            status, _ = await self.client.cancel("j1")
+            self.assertEqual(status, 202)
+            status, payload = await asyncio.wait_for(pending, timeout=10)
+        finally:
+            await other.close()
+        self.assertEqual(status, 409)
+        self.assertIn("cancelled", payload["error"])
+
+    async def test_identical_problems_share_an_id(self):
+        first = await self.client.register_problem({"scenario": "generated", "options": {"num_drones": 20}})
+        second = await self.client.register_problem(
+            {"scenario": "generated", "options": {"num_drones": 20, "num_stations": 100}}
+        )
+        self.assertEqual(first["problem_id"], second["problem_id"])
+        self.assertEqual(len(self.server.problems), 1)
+
+    async def test_concurrent_duplicates_are_coalesced(self):
+        spec = {"scenario": "generated", "options": {"num_drones": 200}}
+        request = dict(problem=spec, algorithm="ga", params={"max_generations": 30}, seed=3)
+        clients = [ServiceClient(self.host, self.port) for _ in range(10)]
+        try:
+            responses = await asyncio.gather(*(c.solve(**request) for c in clients))
+        finally:
+            for c in clients:
+                await c.close()
+        self.assertTrue(all(status == 200 for status, _ in responses))
+        self.assertEqual(len({tuple(payload["assignments"]) for _, payload in responses}), 1)
+        self.assertEqual(self.server.stats["solves"], 1)
+        self.assertEqual(self.server.stats["coalesced"], 9)
+
+    async def test_cancelling_one_waiter_keeps_the_shared_solve(self):
+        info = await self.client.register_problem({"scenario": "generated", "options": {"num_drones": 200}})
+        request = dict(problem_id=info["problem_id"], algorithm="ga", params={"max_generations": 40}, seed=1)
+        first, second = ServiceClient(self.host, self.port), ServiceClient(self.host, self.port)
+        try:
+            kept = asyncio.create_task(first.solve(job_id="kept", **request))
+            dropped = asyncio.create_task(second.solve(job_id="dropped", **request))
+            while not {"kept", "dropped"} <= set(self.server.jobs):
+                await asyncio.sleep(0.005)
+            self.assertEqual((await self.client.cancel("dropped"))[0], 202)
+            self.assertEqual((await dropped)[0], 409)
+            self.assertEqual((await kept)[0], 200)
+        finally:
+            await first.close()
+            await second.close()
+        self.assertEqual(self.server.stats["solves"], 1)
+
+    async def test_errors(self):
+        self.assertEqual((await self.client.solve(problem_id="missing"))[0], 404)
+        status, payload = await self.client.solve(problem={"scenario": "static"}, algorithm="pso", params={"bad": 1})
+        self.assertEqual(status, 400)
+        self.assertIn("bad", payload["error"])
+        self.assertEqual((await self.client.request("GET", "/nowhere"))[0], 404)
+        self.assertEqual((await self.client.request("GET", "/health"))[1], {"status": "ok"})
+
+    async def test_large_registration_does_not_block_other_requests(self):
+        spec = {"scenario": "generated", "options": {"num_drones": 60_000, "num_stations": 3_000}}
+        other = ServiceClient(self.host, self.port)
+        try:
+            registration = asyncio.create_task(other.register_problem(spec))
+            await asyncio.sleep(0.1)  # the helper thread is now building / bounding the problem
+            start = time.perf_counter()
+            status, _ = await self.client.request("GET", "/health")
+            latency = time.perf_counter() - start
+            self.assertEqual(status, 200)
+            self.assertFalse(registration.done())
+            self.assertLess(latency, 0.25)
+            self.assertEqual((await registration)["num_drones"], 60_000)
+        finally:
+            await other.close()
+
+    async def test_scenario_files_are_confined_to_the_scenario_directory(self):
+        status, _ = await self.client.request("POST", "/problems", {"scenario_file": "/etc/passwd"})
+        self.assertEqual(status, 403)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            save_problem(os.path.join(tmp, "static.gsp"), static_scenario())
+            server = AssignmentServer(workers=1, use_processes=False, scenario_dir=tmp)
+            host, port = await server.start()
+            client = ServiceClient(host, port)
+            try:
+                status, info = await client.request("POST", "/problems", {"scenario_file": "static.gsp"})
+                self.assertEqual((status, info["num_drones"]), (201, 6))
+                status, _ = await client.request("POST", "/problems", {"scenario_file": "../static.gsp"})
+                self.assertEqual(status, 403)
+            finally:
+                await client.close()
+                await server.close()
+
+
+class CoalescingWindowTests(unittest.IsolatedAsyncioTestCase):
+    async def _serve(self, coalesce_window):
+        server = AssignmentServer(workers=1, use_processes=False, coalesce_window=coalesce_window)
+        host, port = await server.start()
+        client = ServiceClient(host, port)
+        self.addAsyncCleanup(server.close)
+        self.addAsyncCleanup(client.close)
+        info = await client.register_problem({"scenario": "static"})
+        request = dict(problem_id=info["problem_id"], algorithm="pso", params={"max_iterations": 2}, seed=1)
+        return server, client, request
+
+    async def test_late_duplicates_share_the_result_until_the_window_closes(self):
+        server, client, request = await self._serve(coalesce_window=0.5)
+        _, first = await client.solve(**request)
+        _, late = await client.solve(**request)
+        self.assertEqual(late["assignments"], first["assignments"])
+        self.assertEqual((server.stats["solves"], server.stats["coalesced"]), (1, 1))
+
+        await asyncio.sleep(0.6)
+        self.assertEqual((await client.solve(**request))[0], 200)
+        self.assertEqual((server.stats["solves"], server.stats["coalesced"]), (2, 1))
+
+    async def test_zero_window_only_joins_running_solves(self):
+        server, client, request = await self._serve(coalesce_window=0.0)
+        await client.solve(**request)
+        await client.solve(**request)
+        self.assertEqual((server.stats["solves"], server.stats["coalesced"]), (2, 0))
+
+    async def test_coalesced_requests_are_answered_within_10ms(self):
+        server, client, request = await self._serve(coalesce_window=60.0)
+        await client.solve(**request)
+        repeats = 50
+        start = time.perf_counter()
+        for _ in range(repeats):
+            status, _ = await client.solve(**request)
+            self.assertEqual(status, 200)
+        per_request = (time.perf_counter() - start) / repeats
+        self.assertEqual(server.stats["coalesced"], repeats)
+        self.assertLess(per_request, 0.010)
+
+
+if __name__ == "__main__":
+    unittest.main()
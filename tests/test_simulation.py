@@ -0,0 +1,67 @@
+import unittest
+
+from ground_station.algorithms import ParticleSwarm
+from ground_station.scenarios import generated_scenario, moving_drones_and_stations, static_scenario
+from ground_station.simulation import Simulation, problem_bounds
+
+
+class SimulationTests(unittest.TestCase):
+    def test_run_reports_latency_percentiles(self):
+        problem = static_scenario()
+        simulation = Simulation(problem, ParticleSwarm(num_particles=5, max_iterations=3), seed=1)
+        report = simulation.run(10)
+
+        self.assertEqual(len(report.step_latency_ns), 10)
+        self.assertEqual(len(report.assignments), len(problem.drones))
+        percentiles = report.latency_percentiles()
+        self.assertLessEqual(percentiles["p50"], percentiles["p99"])
+        self.assertLessEqual(percentiles["p99"], percentiles["max"])
+
+    def test_incremental_matrix_matches_rebuild(self):
+        problem = moving_drones_and_stations()
+        velocities = [(1.0, -2.0)] * len(problem.stations)
+        simulation = Simulation(
+            problem, ParticleSwarm(num_particles=5, max_iterations=1), station_velocities=velocities, seed=3
+        )
+        simulation.run(5)
+
+        cached = [list(row) for row in problem.travel_time_matrix()]
+        problem._travel_times = None
+        rebuilt = [list(row) for row in problem.travel_time_matrix()]
+        for cached_row, rebuilt_row in zip(cached, rebuilt):
+            for cached_value, rebuilt_value in zip(cached_row, rebuilt_row):
+                self.assertAlmostEqual(cached_value, rebuilt_value)
+
+    def test_positions_stay_within_bounds(self):
+        problem = static_scenario()
+        velocities = [(500.0, 500.0)] * len(problem.drones)
+        Simulation(
+            problem, ParticleSwarm(num_particles=5, max_iterations=1), drone_velocities=velocities, bounds=(600, 600)
+        ).run(3)
+        for drone in problem.drones:
+            self.assertLessEqual(drone.x, 601)
+            self.assertLessEqual(drone.y, 601)
+
+    def test_default_bounds_follow_the_scenario_extent(self):
+        problem = generated_scenario(num_drones=200, num_stations=20, seed=2)
+        start = list(zip(problem.fleet.x, problem.fleet.y))
+        simulation = Simulation(problem, ParticleSwarm(num_particles=4, max_iterations=1), seed=2)
+        self.assertEqual(simulation.bounds, problem_bounds(problem))
+        self.assertGreater(min(simulation.bounds), 9000)
+        simulation.run(3)
+
+        # Velocities are at most 5 per axis, and a collision nudge moves a drone by at most 1.
+        width, height = simulation.bounds
+        for (x0, y0), x, y in zip(start, problem.fleet.x, problem.fleet.y):
+            self.assertTrue(0 <= x <= width and 0 <= y <= height)
+            self.assertLessEqual(abs(x - x0), 3 * 5 + 3)
+            self.assertLessEqual(abs(y - y0), 3 * 5 + 3)
+
+    def test_step_budget_sets_solver_time_limit(self):
+        solver = ParticleSwarm(num_particles=5, max_iterations=1000)
+        Simulation(static_scenario(), solver, step_budget=0.01)
+        self.assertEqual(solver.time_limit, 0.01)
+
+
+if __name__ == "__main__":
+    unittest.main()
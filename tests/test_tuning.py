@@ -0,0 +1,67 @@
+import os
+import random
+import tempfile
+import unittest
+
+from ground_station.tuning import SEARCH_SPACES, Trial, Tuner, load_tuned, sample_config, save_tuned, scenario_classes
+from run import build_algorithm
+
+
+class TuningTests(unittest.TestCase):
+    def test_sampled_configs_stay_in_bounds(self):
+        rng = random.Random(1)
+        for algorithm, space in SEARCH_SPACES.items():
+            config = sample_config(space, rng)
+            build_algorithm(algorithm, 1, config)
+            for name, (kind, low, high) in space.items():
+                self.assertTrue(low <= config[name] <= high, (algorithm, name))
+                self.assertEqual(isinstance(config[name], int), kind == "int")
+
+    def test_seeds_build_different_instances(self):
+        for name in ("moving-drones", "moving-all", "generated/uniform"):
+            factory = scenario_classes(drones=20, stations=5)[name]
+            positions = [list(zip(problem.fleet.x, problem.fleet.y)) for problem in map(factory, (1, 2, 1))]
+            self.assertNotEqual(positions[0], positions[1], name)
+            self.assertEqual(positions[0], positions[2], name)
+
+    def test_successive_halving_keeps_the_best(self):
+        tuner = Tuner("static", instances=1, min_iterations=1, max_iterations=4, eta=2)
+        trials = [Trial({"num_particles": size}) for size in (2, 4, 8, 16)]
+        survivors = tuner.successive_halving("pso", trials, 1)
+        self.assertEqual(len(survivors), 1)
+        self.assertEqual(set(survivors[0].scores), {1, 2, 4})
+        first_rung = sorted(trial.scores[1] for trial in trials)
+        self.assertLessEqual(survivors[0].scores[1], first_rung[1])
+        self.assertEqual(sum(2 in trial.scores for trial in trials), 2)
+
+    def test_hyperband_result_round_trips_through_build_algorithm(self):
+        with Tuner("static", instances=1, min_iterations=1, max_iterations=3) as tuner:
+            best = tuner.hyperband("ga")
+        self.assertIn(3, best.scores)
+
+        handle, path = tempfile.mkstemp(suffix=".json")
+        os.close(handle)
+        os.remove(path)
+        try:
+            save_tuned(path, "static", "ga", best, 3)
+            save_tuned(path, "moving-all", "ga", Trial({"mutation_rate": 0.2}, {3: 0.1}), 3)
+            params = load_tuned(path, "static", "ga")
+            self.assertEqual(params, best.params)
+            self.assertIsNone(load_tuned(path, "static", "pso"))
+            solver = build_algorithm("ga", 7, params)
+            self.assertEqual(solver.population_size, best.params["population_size"])
+            self.assertEqual(solver.max_generations, 7)
+        finally:
+            os.remove(path)
+
+    def test_rejects_bad_settings(self):
+        with self.assertRaises(ValueError):
+            Tuner("nowhere")
+        with self.assertRaises(ValueError):
+            Tuner("static", eta=1)
+        with self.assertRaises(ValueError):
+            build_algorithm("pso", 5, {"swarm_size": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()